@@ -1,25 +1,75 @@
 from .policy import Policy, DeterministicPolicy, StochasticPolicy
 from .tabular_policy import TabularPolicy
+from .compact_policy import CompactPolicy, PolicyLookupService
+from .tabular_stochastic_policy import TabularStochasticPolicy
 from .value_function import ValueFunction
 from .tabular_value_function import TabularValueFunction
+from .array_value_function import ArrayValueFunction
+from .sparse_value_function import SparseValueFunction, IntKeyValueFunction
 from .qtable import QTable
+from .random_stream import RandomStream
+from .action_selection import EpsilonSchedule, EpsilonGreedy
+from .step_budget import StepBudget
+from .learning_metrics import RollingWindow, ExponentialMovingAverage, QuantileSketch, LearningMetrics
 from .policy_iteration import PolicyIteration
 from .value_iteration import ValueIteration
 from .monte_carlo import MonteCarlo
+from .off_policy_monte_carlo import OffPolicyMonteCarlo
 from .td0 import TD0
 from .td_lambda import TDLambda
+from .incremental_replanner import IncrementalReplanner
+from .multigrid_value_iteration import MultigridValueIteration
+from .multi_goal_value_iteration import MultiGoalValueIteration
+from .distance_oracle import DistanceOracle
+from .solution_cache import SolutionCache
+from .warm_start import remap_values, remap_policy, with_discount, anneal_discount
+from .td_control import TDControl, QLearning, SARSA, ExpectedSARSA
+from .dyna_q import DynaQ
+from .hyperparameter_sweep import HyperparameterSweep
+from .actor_learner import ActorLearner
 
 __all__ = [
     'Policy',
     'DeterministicPolicy',
     'StochasticPolicy',
     'TabularPolicy',
+    'CompactPolicy',
+    'PolicyLookupService',
+    'TabularStochasticPolicy',
     'ValueFunction',
     'TabularValueFunction',
+    'ArrayValueFunction',
+    'SparseValueFunction',
+    'IntKeyValueFunction',
     'QTable',
+    'RandomStream',
+    'EpsilonSchedule',
+    'EpsilonGreedy',
+    'StepBudget',
+    'RollingWindow',
+    'ExponentialMovingAverage',
+    'QuantileSketch',
+    'LearningMetrics',
     'PolicyIteration',
     'ValueIteration',
     'MonteCarlo',
+    'OffPolicyMonteCarlo',
     'TD0',
     'TDLambda',
+    'IncrementalReplanner',
+    'MultigridValueIteration',
+    'MultiGoalValueIteration',
+    'DistanceOracle',
+    'SolutionCache',
+    'remap_values',
+    'remap_policy',
+    'with_discount',
+    'anneal_discount',
+    'TDControl',
+    'QLearning',
+    'SARSA',
+    'ExpectedSARSA',
+    'DynaQ',
+    'HyperparameterSweep',
+    'ActorLearner',
 ]
@@ -0,0 +1,194 @@
+from array import array
+from .random_stream import RandomStream
+
+
+def argmax(actions, scores, rng=None, tolerance=0.0):
+    """
+    점수가 가장 높은 액션
+
+    Args:
+        actions: 액션 리스트
+        scores: 액션별 점수 리스트
+        rng: RandomStream - 주어지면 최댓값과 tolerance 이내인 액션들 중 랜덤으로 선택,
+             None이면 (기존 동작처럼) 그중 첫 번째 액션
+        tolerance: 최댓값과의 차이가 이 값 이하이면 동점으로 취급
+    """
+    threshold = max(scores) - tolerance
+    if rng is None:
+        for action, score in zip(actions, scores):
+            if score >= threshold:
+                return action
+    ties = [action for action, score in zip(actions, scores) if score >= threshold]
+    return ties[0] if len(ties) == 1 else rng.choice(ties)
+
+
+class EpsilonSchedule:
+    """
+    에피소드 수에 따른 ε 스케줄
+
+    - constant:    ε = start
+    - linear:      start에서 end까지 decay_steps 동안 선형 감소
+    - exponential: start에서 end까지 decay_steps 동안 기하적으로 감소 (start, end > 0)
+    decay_steps 이후에는 end로 고정됩니다.
+    """
+
+    MODES = ("constant", "linear", "exponential")
+
+    def __init__(self, start=0.1, end=None, decay_steps=1, mode="constant"):
+        """
+        Args:
+            start: 초기 ε
+            end: 최종 ε (None이면 start)
+            decay_steps: end에 도달할 때까지의 스텝(에피소드) 수
+            mode: "constant", "linear", "exponential" 중 하나
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}: {mode}")
+        self.start = start
+        self.end = start if end is None else end
+        self.decay_steps = max(1, decay_steps)
+        self.mode = mode
+
+    def value(self, step):
+        """step번째 스텝의 ε"""
+        if self.mode == "constant":
+            return self.start
+        progress = min(step / self.decay_steps, 1.0)
+        if self.mode == "linear":
+            return self.start + (self.end - self.start) * progress
+        return self.start * (self.end / self.start) ** progress
+
+    def __repr__(self):
+        return (f"EpsilonSchedule(start={self.start}, end={self.end}, "
+                f"decay_steps={self.decay_steps}, mode={self.mode!r})")
+
+
+class EpsilonGreedy:
+    """
+    에이전트들이 공유하는 batch ε-greedy 액션 선택기
+
+    상태 batch에 대해
+    1. 탐색 동전(coin)을 RandomStream에서 한 번에 뽑고 (coin < ε 이면 랜덤 액션)
+    2. 나머지 상태는 액션 점수의 argmax를 고르되, 최댓값과 tolerance 이내인 액션이
+       여러 개면 그중 랜덤으로 선택합니다.
+
+    액션 점수는 세 가지 방식으로 계산할 수 있습니다.
+    - q_actions:         QTable의 Q(s, a)
+    - lookahead_actions: V와 환경 모델로 계산한 Σ p·(r + γ·V(s'))  (TD(0), TD(λ))
+    - model_actions:     컴파일된 TabularMDP 위에서 상태 인덱스 배열 → 액션 인덱스 배열
+
+    ε은 float 또는 EpsilonSchedule이며, advance()를 호출할 때마다 스케줄이 한 스텝 진행됩니다.
+    """
+
+    def __init__(self, epsilon=0.1, rng=None, tolerance=0.0):
+        """
+        Args:
+            epsilon: ε 값 또는 EpsilonSchedule
+            rng: RandomStream (None이면 새로 생성)
+            tolerance: argmax에서 최댓값과의 차이가 이 값 이하인 액션을 동점으로 취급
+        """
+        self.schedule = epsilon if isinstance(epsilon, EpsilonSchedule) else EpsilonSchedule(epsilon)
+        self.rng = rng if rng is not None else RandomStream()
+        self.tolerance = tolerance
+        self.step_count = 0
+
+    @property
+    def epsilon(self):
+        """현재 ε"""
+        return self.schedule.value(self.step_count)
+
+    def advance(self, steps=1):
+        """ε 스케줄을 steps만큼 진행"""
+        self.step_count += steps
+
+    def argmax(self, actions, scores):
+        """점수가 가장 높은 액션 (tolerance 이내 동점이면 랜덤)"""
+        return argmax(actions, scores, self.rng, self.tolerance)
+
+    def select(self, states, action_lists, score_fn):
+        """
+        상태 batch에 대한 ε-greedy 액션 선택
+
+        Args:
+            states: 상태 리스트
+            action_lists: 상태별 가능한 액션 리스트
+            score_fn: (state, actions) → 액션별 점수 리스트 (greedy로 고를 때만 호출)
+
+        Returns:
+            상태별 선택된 액션 리스트 (가능한 액션이 없으면 None)
+        """
+        epsilon = self.epsilon
+        coins = self.rng.uniforms(len(states))
+        selected = []
+        for state, actions, coin in zip(states, action_lists, coins):
+            if not actions:
+                selected.append(None)
+            elif coin < epsilon:
+                selected.append(self.rng.choice(actions))
+            else:
+                selected.append(self.argmax(actions, score_fn(state, actions)))
+        return selected
+
+    def select_one(self, state, actions, score_fn):
+        """한 상태에 대한 ε-greedy 액션 선택"""
+        if not actions:
+            return None
+        if self.rng.random() < self.epsilon:
+            return self.rng.choice(actions)
+        return self.argmax(actions, score_fn(state, actions))
+
+    # --- Q 기반 ---
+
+    @staticmethod
+    def q_scores(qtable):
+        """QTable 기반 점수 함수"""
+        def score_fn(state, actions):
+            row = qtable.q_table[state]
+            return [row[action] for action in actions]
+        return score_fn
+
+    def q_action(self, qtable, state, actions):
+        return self.select_one(state, actions, self.q_scores(qtable))
+
+    def q_actions(self, qtable, states, action_lists):
+        return self.select(states, action_lists, self.q_scores(qtable))
+
+    # --- V + 환경 모델 기반 (one-step lookahead) ---
+
+    @staticmethod
+    def lookahead_scores(env, value_function, gamma):
+        """Σ p·(r + γ·V(s')) 점수 함수"""
+        def score_fn(state, actions):
+            scores = []
+            for action in actions:
+                expected_value = 0.0
+                for next_state, prob in env.get_transitions(state, action):
+                    reward = env.get_reward(state, action, next_state)
+                    expected_value += prob * (reward + gamma * value_function.get_value(next_state))
+                scores.append(expected_value)
+            return scores
+        return score_fn
+
+    def lookahead_action(self, env, value_function, gamma, state, actions):
+        return self.select_one(state, actions, self.lookahead_scores(env, value_function, gamma))
+
+    def lookahead_actions(self, env, value_function, gamma, states, action_lists):
+        return self.select(states, action_lists, self.lookahead_scores(env, value_function, gamma))
+
+    # --- 컴파일된 모델 (상태/액션 인덱스) ---
+
+    def model_actions(self, model, values, state_ids):
+        """
+        TabularMDP 위에서 상태 인덱스 batch → 액션 인덱스 배열 (터미널 상태는 -1)
+
+        Args:
+            model: TabularMDP
+            values: 상태 인덱스 기반 가치 배열
+            state_ids: 상태 인덱스 리스트/배열
+        """
+        def score_fn(s, action_ids):
+            return [model.q_value(values, s, a) for a in action_ids]
+
+        action_lists = [model.state_actions[s] for s in state_ids]
+        selected = self.select(state_ids, action_lists, score_fn)
+        return array("l", [-1 if a is None else a for a in selected])
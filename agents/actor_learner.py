@@ -0,0 +1,334 @@
+import asyncio
+import copy
+import multiprocessing
+import queue
+from .tabular_value_function import TabularValueFunction
+from .random_stream import RandomStream
+from .action_selection import EpsilonGreedy
+from .learning_metrics import LearningMetrics
+
+
+def actor_score_fn(env, parameters):
+    """
+    actor가 받은 파라미터 스냅샷으로 ε-greedy의 greedy 점수 함수 생성
+
+    - "q"가 있으면 Q(s, a) (MonteCarlo)
+    - 아니면 "values"의 V와 환경 모델의 one-step lookahead (TD0, TDLambda)
+    """
+    if "q" in parameters:
+        q = parameters["q"]
+
+        def score_fn(state, actions):
+            row = q.get(state, {})
+            return [row.get(action, 0.0) for action in actions]
+        return score_fn
+
+    value_function = TabularValueFunction(default_value=0.0)
+    value_function.merge(parameters["values"])
+    return EpsilonGreedy.lookahead_scores(env, value_function, parameters["gamma"])
+
+
+def run_actor_episode(env, parameters, rng):
+    """
+    파라미터 스냅샷 기준 ε-greedy로 에피소드 하나 생성
+
+    Returns:
+        [(state, action, reward, next_state, done), ...]
+    """
+    selector = EpsilonGreedy(parameters["epsilon"], rng)
+    score_fn = actor_score_fn(env, parameters)
+    episode = []
+    state = env.reset()
+    for _ in range(parameters["max_steps"]):
+        actions = env.get_actions(state)
+        if not actions:
+            break
+        action = selector.select_one(state, actions, score_fn)
+        next_state, reward, done = env.step(action)
+        episode.append((state, action, reward, next_state, done))
+        if done:
+            break
+        state = next_state
+    return episode
+
+
+async def run_actor_episode_async(env, parameters, rng):
+    """
+    run_actor_episode의 asyncio 버전
+
+    env에 async_step 코루틴이 있으면 await 하고 (느린 외부 서비스를 감싼 환경 등),
+    없으면 step 후 이벤트 루프에 제어를 넘깁니다.
+    """
+    selector = EpsilonGreedy(parameters["epsilon"], rng)
+    score_fn = actor_score_fn(env, parameters)
+    async_step = getattr(env, "async_step", None)
+    episode = []
+    state = env.reset()
+    for _ in range(parameters["max_steps"]):
+        actions = env.get_actions(state)
+        if not actions:
+            break
+        action = selector.select_one(state, actions, score_fn)
+        if async_step is not None:
+            next_state, reward, done = await async_step(action)
+        else:
+            next_state, reward, done = env.step(action)
+            await asyncio.sleep(0)
+        episode.append((state, action, reward, next_state, done))
+        if done:
+            break
+        state = next_state
+    return episode
+
+
+def _publish_latest(parameter_queue, parameters, timeout=0.01):
+    """
+    크기 1인 파라미터 큐의 내용을 최신 스냅샷으로 교체
+
+    multiprocessing.Queue는 feeder 스레드를 거치므로 get_nowait가 들어 있는 스냅샷을
+    아직 보지 못하고 Empty를 낼 수 있습니다. put이 Full이면 짧게 블로킹 get으로 이전
+    스냅샷을 비우고 다시 넣어, 최신 스냅샷이 조용히 버려지지 않게 합니다.
+    (이 큐에 put하는 쪽은 learner뿐이므로 비운 뒤의 put은 곧 성공)
+    """
+    while True:
+        try:
+            parameter_queue.put_nowait(parameters)
+            return
+        except queue.Full:
+            try:
+                parameter_queue.get(timeout=timeout)
+            except queue.Empty:
+                pass
+
+
+def _process_actor(env, parameters, seed, experience_queue, parameter_queue, stop_event):
+    """프로세스 actor: 최신 파라미터로 에피소드를 만들어 experience_queue에 넣는 루프"""
+    rng = RandomStream(seed)
+    while not stop_event.is_set():
+        # 배포된 파라미터 중 가장 최신 것만 사용
+        while True:
+            try:
+                parameters = parameter_queue.get_nowait()
+            except queue.Empty:
+                break
+
+        episode = run_actor_episode(env, parameters, rng)
+        while not stop_event.is_set():
+            try:
+                experience_queue.put(episode, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+
+
+class ActorLearner:
+    """
+    Actor-Learner 구조의 비동기 학습
+
+    - actor num_actors개가 각자 환경 복사본에서 에피소드를 만들어 크기가 제한된(bounded) 큐에 넣고
+    - learner는 큐에서 최대 batch_size개의 에피소드를 모아 agent.learn_episodes로 batch 업데이트한 뒤
+    - publish_interval번 업데이트마다 agent.get_parameters() 스냅샷을 actor들에게 배포합니다.
+
+    actor는 마지막으로 받은 스냅샷으로 행동하므로 learner를 기다리지 않고,
+    learner는 큐만 기다리므로 느린 actor(환경) 하나 때문에 멈추지 않습니다.
+    큐가 가득 차면 actor가 기다립니다 (backpressure).
+
+    mode:
+        "asyncio": actor는 코루틴 - I/O 대기가 긴 환경(env.async_step)에 적합
+        "process": actor는 프로세스 - CPU를 많이 쓰는 환경에 적합 (env는 pickle 가능해야 함)
+
+    agent는 learn_episodes(episodes), get_parameters(), step_budget, action_selector를 제공해야 합니다.
+    (TD0, TDLambda, MonteCarlo)
+    """
+
+    MODES = ("asyncio", "process")
+
+    def __init__(self, agent, num_actors=4, queue_size=64, batch_size=8, publish_interval=1,
+                 mode="asyncio", seed=None):
+        """
+        Args:
+            agent: 학습할 에이전트 (TD0, TDLambda, MonteCarlo)
+            num_actors: actor 수
+            queue_size: experience 큐의 최대 에피소드 수
+            batch_size: learner가 한 번에 업데이트할 최대 에피소드 수
+            publish_interval: 파라미터를 배포할 업데이트 간격
+            mode: "asyncio" 또는 "process"
+            seed: actor 난수 seed (actor i는 seed + i 사용, None이면 매번 다른 난수열)
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}: {mode}")
+
+        self.agent = agent
+        self.num_actors = num_actors
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.publish_interval = publish_interval
+        self.mode = mode
+        self.seed = seed
+
+        # actor가 읽는 최신 파라미터 스냅샷
+        self.parameters = None
+
+        # 통계
+        self.num_updates = 0
+        self.num_publishes = 0
+        self.num_episodes = 0
+        self.max_batch_size = 0
+
+        # run() 진행 상태: 보상 리스트(metrics가 없을 때), 지표 집계, 이번 run에서 학습한 에피소드 수
+        self.episode_rewards = None
+        self.tracker = None
+        self.num_learned = 0
+
+    def actor_seed(self, i):
+        return None if self.seed is None else self.seed + i
+
+    def publish(self):
+        """현재 에이전트 파라미터 스냅샷 생성"""
+        self.parameters = self.agent.get_parameters()
+        self.num_publishes += 1
+        return self.parameters
+
+    def learn(self, batch, metrics=None):
+        """
+        learner: 에피소드 batch로 업데이트
+
+        Args:
+            batch: 에피소드 리스트
+            metrics: LearningMetrics - 주어지면 에피소드별 return/길이를 여기에 집계
+
+        Returns:
+            에피소드별 총 보상 리스트
+        """
+        agent = self.agent
+        agent.learn_episodes(batch)
+        rewards = []
+        for episode in batch:
+            done = bool(episode) and episode[-1][4]
+            agent.step_budget.record(len(episode), truncated=not done)
+            agent.action_selector.advance()
+            total_reward = sum(reward for _, _, reward, _, _ in episode)
+            rewards.append(total_reward)
+            if metrics is not None:
+                metrics.record(total_reward, len(episode))
+
+        self.num_updates += 1
+        self.num_episodes += len(batch)
+        return rewards
+
+    def run(self, num_episodes=1000, verbose=False, metrics=None):
+        """
+        learner가 num_episodes개의 에피소드를 학습할 때까지 actor-learner 실행
+
+        Args:
+            num_episodes: 학습할 에피소드 수
+            verbose: True면 진행상황 출력
+            metrics: LearningMetrics - 주어지면 에피소드별 return/길이를 여기에 집계
+
+        Returns:
+            policy: 학습된 정책
+            episode_rewards: learner가 받은 순서대로의 에피소드별 보상 리스트 (metrics가 주어지면 metrics)
+        """
+        # metrics가 주어지면 보상 리스트를 만들지 않고 스트리밍 지표에만 집계
+        self.episode_rewards = [] if metrics is None else None
+        self.tracker = metrics if metrics is not None else (LearningMetrics() if verbose else None)
+        self.num_learned = 0
+
+        self.publish()
+        if self.mode == "asyncio":
+            asyncio.run(self._run_async(num_episodes, verbose))
+        else:
+            self._run_processes(num_episodes, verbose)
+
+        # 최종 정책: TD 에이전트는 V로부터 추출, Monte Carlo는 Q에 대해 greedy하게 개선
+        if hasattr(self.agent, "extract_policy"):
+            self.agent.policy = self.agent.extract_policy()
+        else:
+            self.agent.improve_policy()
+        return self.agent.policy, self.episode_rewards if metrics is None else metrics
+
+    def _learner_step(self, batch, num_episodes, verbose):
+        """batch 학습 후 배포 주기가 되면 새 스냅샷을 반환 (아니면 None)"""
+        batch = batch[:num_episodes - self.num_learned]
+        self.max_batch_size = max(self.max_batch_size, len(batch))
+        rewards = self.learn(batch, self.tracker)
+        self.num_learned += len(batch)
+        if self.episode_rewards is not None:
+            self.episode_rewards.extend(rewards)
+
+        if verbose and self.num_learned % 100 < len(batch):
+            print(f"Episode {self.num_learned}/{num_episodes} - "
+                  f"Avg Reward (last {self.tracker.window}): {self.tracker.mean_return():.3f}")
+
+        if self.num_updates % self.publish_interval == 0:
+            return self.publish()
+        return None
+
+    # --- asyncio ---
+
+    async def _async_actor(self, i, experience_queue):
+        env = copy.deepcopy(self.agent.env)
+        rng = RandomStream(self.actor_seed(i))
+        while True:
+            episode = await run_actor_episode_async(env, self.parameters, rng)
+            await experience_queue.put(episode)
+
+    async def _run_async(self, num_episodes, verbose):
+        experience_queue = asyncio.Queue(maxsize=self.queue_size)
+        actors = [
+            asyncio.create_task(self._async_actor(i, experience_queue)) for i in range(self.num_actors)
+        ]
+
+        try:
+            while self.num_learned < num_episodes:
+                batch = [await experience_queue.get()]
+                while len(batch) < self.batch_size and not experience_queue.empty():
+                    batch.append(experience_queue.get_nowait())
+                self._learner_step(batch, num_episodes, verbose)
+        finally:
+            for actor in actors:
+                actor.cancel()
+            await asyncio.gather(*actors, return_exceptions=True)
+
+    # --- process ---
+
+    def _run_processes(self, num_episodes, verbose):
+        context = multiprocessing.get_context()
+        experience_queue = context.Queue(maxsize=self.queue_size)
+        stop_event = context.Event()
+        parameter_queues = [context.Queue(maxsize=1) for _ in range(self.num_actors)]
+        actors = [
+            context.Process(
+                target=_process_actor,
+                args=(self.agent.env, self.parameters, self.actor_seed(i),
+                      experience_queue, parameter_queues[i], stop_event),
+                daemon=True,
+            )
+            for i in range(self.num_actors)
+        ]
+        for actor in actors:
+            actor.start()
+
+        try:
+            while self.num_learned < num_episodes:
+                batch = [experience_queue.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(experience_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                parameters = self._learner_step(batch, num_episodes, verbose)
+                if parameters is not None:
+                    for parameter_queue in parameter_queues:
+                        # 아직 가져가지 않은 이전 스냅샷은 버리고 최신 스냅샷으로 교체
+                        _publish_latest(parameter_queue, parameters)
+        finally:
+            stop_event.set()
+            # put에서 기다리는 actor가 없도록 큐를 비우며 종료 대기
+            for actor in actors:
+                while actor.is_alive():
+                    try:
+                        experience_queue.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+                    actor.join(timeout=0.1)
@@ -0,0 +1,53 @@
+from array import array
+from .value_function import ValueFunction
+
+
+class ArrayValueFunction(ValueFunction):
+    """
+    배열 기반 가치 함수
+
+    상태마다 정수 인덱스를 부여하고 값은 array('d')에 연속으로 저장합니다.
+    처음 보는 상태는 update 시 새 인덱스가 추가되며, get_value는 테이블을 키우지 않습니다.
+    """
+
+    def __init__(self, states=(), default_value=0.0):
+        """
+        Args:
+            states: 미리 인덱스를 부여할 상태들 (예: env.get_states())
+            default_value: 방문하지 않은 상태의 값
+        """
+        self.default_value = default_value
+        self.states = []
+        self.state_index = {}
+        self.values = array("d")
+        for state in states:
+            self.index(state)
+
+    def index(self, state):
+        """state의 인덱스 반환 (없으면 새로 추가)"""
+        i = self.state_index.get(state)
+        if i is None:
+            i = len(self.states)
+            self.state_index[state] = i
+            self.states.append(state)
+            self.values.append(self.default_value)
+        return i
+
+    def update(self, state, value):
+        self.values[self.index(state)] = value
+
+    def add(self, state, value):
+        self.values[self.index(state)] = value
+
+    def merge(self, value_table):
+        for state, value in value_table.items():
+            self.update(state, value)
+
+    def get_value(self, state):
+        i = self.state_index.get(state)
+        if i is None:
+            return self.default_value
+        return self.values[i]
+
+    def items(self):
+        return zip(self.states, self.values)
@@ -0,0 +1,221 @@
+import ast
+import json
+import mmap
+import struct
+from array import array
+from .policy import DeterministicPolicy
+
+
+class CompactPolicy(DeterministicPolicy):
+    """
+    상태 인덱스 → 액션 코드(uint8) 배열로 저장한 결정적 정책
+
+    codes[i]는 states[i]에서 선택할 액션의 인덱스(actions 기준)이며,
+    액션이 없는 상태(터미널 등)는 NO_ACTION(255)입니다.
+
+    파일 형식 (save / load):
+        MAGIC(8바이트) | 헤더 길이(uint32, little-endian) | 헤더(JSON: states, actions) | codes(상태 수 바이트)
+    load(path)는 파일을 mmap하여 codes를 복사하지 않고 바로 사용합니다.
+    """
+
+    NO_ACTION = 255
+    MAGIC = b"RLPOLICY"
+
+    def __init__(self, states, actions, codes=None):
+        """
+        Args:
+            states: 상태 리스트 (인덱스 → 상태)
+            actions: 액션 리스트 (인덱스 → 액션, 최대 255개)
+            codes: 상태별 액션 코드 (None이면 모두 NO_ACTION)
+        """
+        if len(actions) >= self.NO_ACTION:
+            raise ValueError(f"CompactPolicy supports at most {self.NO_ACTION - 1} actions: {len(actions)}")
+
+        self.states = list(states)
+        self.actions = list(actions)
+        self.state_index = {state: i for i, state in enumerate(self.states)}
+        self.action_index = {action: i for i, action in enumerate(self.actions)}
+        if codes is None:
+            codes = array("B", [self.NO_ACTION]) * len(self.states)
+        self.codes = codes
+        # 액션 코드 → 액션 (256칸, 없는 코드와 NO_ACTION은 None) - batch 조회에서 분기 없이 인덱싱
+        self.action_lookup = self.actions + [None] * (256 - len(self.actions))
+
+        # mmap으로 불러온 경우 파일 매핑 (codes가 참조하는 동안 유지)
+        self._mmap = None
+
+    @classmethod
+    def from_policy(cls, policy, states, actions):
+        """다른 정책(TabularPolicy 등)을 주어진 상태/액션 집합 위의 CompactPolicy로 변환"""
+        compact = cls(states, actions)
+        for i, state in enumerate(compact.states):
+            action = policy.select_action(state, compact.actions)
+            if action is not None:
+                compact.codes[i] = compact.action_index[action]
+        return compact
+
+    @classmethod
+    def from_model(cls, model, action_ids):
+        """TabularMDP의 액션 인덱스 리스트(greedy_actions 결과 등, 터미널은 -1)로부터 생성"""
+        codes = array("B", [cls.NO_ACTION if a < 0 else a for a in action_ids])
+        return cls(model.states, model.actions, codes)
+
+    def select_action(self, state, actions=None):
+        """
+        state에서 선택할 액션
+
+        저장되지 않은 상태이거나, actions가 주어졌는데 저장된 액션이 그 안에 없으면 None
+        """
+        i = self.state_index.get(state)
+        if i is None:
+            return None
+        code = self.codes[i]
+        if code == self.NO_ACTION:
+            return None
+        action = self.actions[code]
+        if actions is not None and action not in actions:
+            return None
+        return action
+
+    def select_actions(self, states):
+        """상태 batch에 대한 액션 리스트 (저장되지 않은 상태는 None)"""
+        state_index = self.state_index
+        codes = self.codes
+        lookup = self.action_lookup
+        return [
+            lookup[codes[state_index[state]]] if state in state_index else None
+            for state in states
+        ]
+
+    def select_action_ids(self, state_ids):
+        """상태 인덱스 batch → 액션 코드 배열"""
+        return array("B", map(self.codes.__getitem__, state_ids))
+
+    def update(self, state, action):
+        i = self.state_index.get(state)
+        if i is None:
+            i = len(self.states)
+            self.states.append(state)
+            self.state_index[state] = i
+            self.codes.append(self.NO_ACTION)
+        if action is None:
+            self.codes[i] = self.NO_ACTION
+            return
+        if action not in self.action_index:
+            if len(self.actions) >= self.NO_ACTION - 1:
+                raise ValueError(f"CompactPolicy supports at most {self.NO_ACTION - 1} actions")
+            self.action_index[action] = len(self.actions)
+            self.action_lookup[len(self.actions)] = action
+            self.actions.append(action)
+        self.codes[i] = self.action_index[action]
+
+    def save(self, path):
+        """정책을 파일로 저장"""
+        header = json.dumps({
+            "states": [repr(state) for state in self.states],
+            "actions": [repr(action) for action in self.actions],
+        }).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            f.write(bytes(self.codes))
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        """
+        save로 저장한 정책을 불러옵니다.
+
+        Args:
+            path: 파일 경로
+            use_mmap: True면 codes를 파일의 mmap(copy-on-write)으로 사용 - 파일 크기와 무관하게
+                      바로 불러오고, 여러 프로세스가 같은 페이지를 공유합니다.
+                      update()로 새 상태를 추가하려면 False로 불러와야 합니다.
+        """
+        with open(path, "rb") as f:
+            if f.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"not a CompactPolicy file: {path}")
+            (header_length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_length).decode("utf-8"))
+            states = [ast.literal_eval(state) for state in header["states"]]
+            actions = [ast.literal_eval(action) for action in header["actions"]]
+            offset = len(cls.MAGIC) + 4 + header_length
+
+            if not use_mmap or not states:
+                f.seek(offset)
+                return cls(states, actions, array("B", f.read(len(states))))
+
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        policy = cls(states, actions, memoryview(mapping)[offset:offset + len(states)])
+        policy._mmap = mapping
+        return policy
+
+
+class PolicyLookupService:
+    """
+    여러 CompactPolicy를 이름으로 등록해 두고 batch 질의에 답하는 in-process 정책 조회 서비스
+
+    제어 루프의 한 tick 동안 모인 (정책 이름, 상태) 질의들을 tick() 한 번으로 처리하고,
+    상태 인덱스를 알고 있는 호출자는 select_action_ids로 배열 단위 조회를 할 수 있습니다.
+
+    사용 예:
+        service = PolicyLookupService()
+        service.load("gridworld", "policy.bin")
+        actions = service.select_actions("gridworld", agent_states)
+    """
+
+    def __init__(self):
+        self.policies = {}
+        self.num_queries = 0
+
+    def register(self, name, policy):
+        """CompactPolicy 등록 (TabularPolicy 등은 CompactPolicy.from_policy로 변환해서 등록)"""
+        self.policies[name] = policy
+
+    def load(self, name, path, use_mmap=True):
+        """파일에서 정책을 불러와 등록"""
+        self.policies[name] = CompactPolicy.load(path, use_mmap=use_mmap)
+        return self.policies[name]
+
+    def unregister(self, name):
+        self.policies.pop(name, None)
+
+    def select_action(self, name, state, actions=None):
+        self.num_queries += 1
+        return self.policies[name].select_action(state, actions)
+
+    def select_actions(self, name, states):
+        """name 정책에 대한 상태 batch 질의"""
+        self.num_queries += len(states)
+        return self.policies[name].select_actions(states)
+
+    def select_action_ids(self, name, state_ids):
+        """name 정책에 대한 상태 인덱스 batch 질의 → 액션 코드 배열 (가장 빠른 경로)"""
+        self.num_queries += len(state_ids)
+        return self.policies[name].select_action_ids(state_ids)
+
+    def tick(self, queries):
+        """
+        한 tick의 질의 처리
+
+        Args:
+            queries: [(정책 이름, 상태), ...]
+
+        Returns:
+            질의 순서대로의 액션 리스트
+        """
+        self.num_queries += len(queries)
+        # 이번 tick에 질의된 정책만 (state_index, codes, action_lookup)을 한 번 꺼내 사용
+        # (등록된 정책 수와 무관하게 질의 수에 비례하는 비용)
+        lookups = {}
+        results = []
+        for name, state in queries:
+            lookup = lookups.get(name)
+            if lookup is None:
+                policy = self.policies[name]
+                lookup = lookups[name] = (policy.state_index, policy.codes, policy.action_lookup)
+            state_index, codes, actions = lookup
+            i = state_index.get(state)
+            results.append(None if i is None else actions[codes[i]])
+        return results
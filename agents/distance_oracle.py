@@ -0,0 +1,259 @@
+import copy
+import hashlib
+import json
+import os
+import struct
+from array import array
+from collections import deque
+from .tabular_policy import TabularPolicy
+from .tabular_value_function import TabularValueFunction
+
+
+class DistanceOracle:
+    """
+    결정적 GridWorld의 목표별 최단거리 / V* / π* 사전 계산 oracle
+
+    보상이 "매 스텝 -step_cost, 터미널(목표/위험 셀) 진입 시 그 보상"뿐인 결정적 맵에서
+    최적 정책은 어떤 터미널 t로 최단 경로를 따라가거나(다른 터미널은 지나갈 수 없음) 영원히 머무는 것이므로
+
+        f(d, r) = -c·(1 - γ^d)/(1 - γ) + γ^(d-1)·r     (d: t까지의 거리, r: t의 보상, c: step_cost)
+        V*(s) = max( max_t f(d_t(s), r_t),  -c/(1 - γ) )
+
+    입니다. 목표마다 (그 목표 하나만 목표인 설정으로) 역방향 BFS 거리장 d_t를 구해 V*와 π* 배열을 만들어 두고,
+    질의는 상태 인덱스 조회 + 배열 인덱싱(O(1))으로 답합니다.
+    위험 셀은 영원히 머무는 것보다 나을 수 있을 때만 BFS 합니다.
+
+    cache_dir를 주면 결과를 맵 해시(GridWorld.map_hash) + 목표 목록을 키로 디스크에 저장하고,
+    같은 맵/목표로 다시 만들면 BFS 없이 파일에서 불러옵니다.
+    (cell_rewards가 있는 맵은 거리만으로 V*가 정해지지 않으므로 지원하지 않습니다.)
+    """
+
+    MAGIC = b"RLORACLE"
+    UNREACHABLE = -1
+    NO_ACTION = 255
+
+    def __init__(self, env, goals=None, cache_dir=None):
+        """
+        Args:
+            env: 결정적 GridWorld (장애물, 위험 셀, step_cost, 할인율 사용)
+            goals: 거리장을 계산할 목표 셀 리스트 (None이면 env.goal_states)
+                   목표 보상은 env.goal_rewards (없으면 +1)
+            cache_dir: 디스크 캐시 디렉토리 (None이면 캐시하지 않음)
+        """
+        if env.cell_rewards:
+            raise ValueError("DistanceOracle does not support cell_rewards; use ValueIteration")
+
+        self.env = env
+        self.goals = list(goals) if goals is not None else list(env.goal_states)
+        self.goal_index = {goal: i for i, goal in enumerate(self.goals)}
+        self.cache_dir = cache_dir
+        self.loaded_from_cache = False
+
+        # 목표가 없는 맵을 컴파일해 모든 목표가 transition 구조를 공유
+        dynamics = copy.copy(env)
+        dynamics.goal_states = []
+        self.model = model = dynamics.compile()
+        if not model.deterministic:
+            raise ValueError("DistanceOracle requires a deterministic GridWorld")
+        self.states = model.states
+        self.state_index = model.state_index
+        self.actions = model.actions
+
+        # 목표별 거리장 / V* / π* (상태 인덱스 기반 배열)
+        self.distances = []
+        self.values = []
+        self.policies = []
+
+        if not self._load_cached():
+            for goal in self.goals:
+                self._solve(goal)
+            self._save()
+
+    # --- 사전 계산 ---
+
+    def cache_key(self):
+        """맵 해시와 목표 목록으로 만든 캐시 키"""
+        goals = [(goal, self.env.goal_rewards.get(goal, 1.0)) for goal in self.goals]
+        encoded = json.dumps([self.env.map_hash(include_goals=False), goals], default=repr).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _predecessors(self, terminals):
+        """역방향 간선: s' → [s, ...] (터미널 s에서 나가는 간선은 제외)"""
+        model = self.model
+        predecessors = [[] for _ in range(model.num_states)]
+        for s in range(model.num_states):
+            if s in terminals:
+                continue
+            base = s * model.num_actions
+            for a in model.state_actions[s]:
+                next_s = model.successors[base + a]
+                if next_s != s:
+                    predecessors[next_s].append(s)
+        return predecessors
+
+    def _bfs(self, source, predecessors):
+        """source까지의 최단 거리 배열 (도달 불가면 UNREACHABLE)"""
+        distances = array("i", [self.UNREACHABLE]) * self.model.num_states
+        distances[source] = 0
+        frontier = deque([source])
+        while frontier:
+            s = frontier.popleft()
+            d = distances[s] + 1
+            for prev in predecessors[s]:
+                if distances[prev] < 0:
+                    distances[prev] = d
+                    frontier.append(prev)
+        return distances
+
+    def _solve(self, goal):
+        """goal 하나만 목표인 설정의 거리장, V*, π* 계산"""
+        env = self.env
+        model = self.model
+        gamma = model.discount
+        cost = env.step_cost
+        goal_id = self.state_index[goal]
+        goal_reward = env.goal_rewards.get(goal, 1.0)
+
+        hazard_ids = {self.state_index[cell]: reward for cell, reward in env.hazards.items()}
+        terminals = set(hazard_ids) | {goal_id}
+        predecessors = self._predecessors(terminals)
+
+        # 영원히 머무는 경우의 가치 (할인율 1이면 step_cost가 있을 때 -∞)
+        if cost == 0.0:
+            stay_value = 0.0
+        elif gamma < 1.0:
+            stay_value = -cost / (1.0 - gamma)
+        else:
+            stay_value = float("-inf")
+
+        def terminal_value(d, reward):
+            if gamma == 1.0:
+                return -cost * d + reward
+            return -cost * (1.0 - gamma ** d) / (1.0 - gamma) + gamma ** (d - 1) * reward
+
+        goal_distances = self._bfs(goal_id, predecessors)
+        values = array("d", [stay_value]) * model.num_states
+        sources = [(goal_distances, goal_reward)]
+        for hazard_id, reward in hazard_ids.items():
+            # 인접한 위험 셀(거리 1)조차 머무는 것보다 나쁘면 BFS 하지 않음
+            if terminal_value(1, reward) > stay_value:
+                sources.append((self._bfs(hazard_id, predecessors), reward))
+        for distances, reward in sources:
+            for s, d in enumerate(distances):
+                if d > 0:
+                    value = terminal_value(d, reward)
+                    if value > values[s]:
+                        values[s] = value
+        for s in terminals:
+            values[s] = 0.0
+
+        # π*(s) = argmax_a r(s') + γ·V*(s')  (동점이면 앞의 액션)
+        entry_rewards = [-cost] * model.num_states
+        entry_rewards[goal_id] += goal_reward
+        for hazard_id, reward in hazard_ids.items():
+            entry_rewards[hazard_id] += reward
+        policy = array("B", [self.NO_ACTION]) * model.num_states
+        for s in range(model.num_states):
+            if s in terminals:
+                continue
+            base = s * model.num_actions
+            best_value = float("-inf")
+            for a in model.state_actions[s]:
+                next_s = model.successors[base + a]
+                value = entry_rewards[next_s] + gamma * values[next_s]
+                if value > best_value:
+                    best_value = value
+                    policy[s] = a
+
+        self.distances.append(goal_distances)
+        self.values.append(values)
+        self.policies.append(policy)
+
+    # --- 디스크 캐시 ---
+
+    def _cache_path(self):
+        return os.path.join(self.cache_dir, self.cache_key() + ".oracle")
+
+    def _save(self):
+        """
+        파일 형식: MAGIC | 헤더 길이(uint32) | 헤더(JSON: 상태 수, 목표 수)
+                   | 목표마다 distances(int32 x S) | values(float64 x S) | policy(uint8 x S)
+        """
+        if self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._cache_path()
+        header = json.dumps({"num_states": len(self.states), "num_goals": len(self.goals)}).encode("utf-8")
+        # 쓰는 도중 중단되어도 깨진 파일이 남지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            for distances, values, policy in zip(self.distances, self.values, self.policies):
+                distances.tofile(f)
+                values.tofile(f)
+                policy.tofile(f)
+        os.replace(temp_path, path)
+
+    def _load_cached(self):
+        if self.cache_dir is None:
+            return False
+        path = self._cache_path()
+        if not os.path.exists(path):
+            return False
+        with open(path, "rb") as f:
+            if f.read(len(self.MAGIC)) != self.MAGIC:
+                return False
+            (header_length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_length).decode("utf-8"))
+            num_states = header["num_states"]
+            if num_states != len(self.states) or header["num_goals"] != len(self.goals):
+                return False
+            for _ in range(header["num_goals"]):
+                distances = array("i")
+                values = array("d")
+                policy = array("B")
+                distances.fromfile(f, num_states)
+                values.fromfile(f, num_states)
+                policy.fromfile(f, num_states)
+                self.distances.append(distances)
+                self.values.append(values)
+                self.policies.append(policy)
+        self.loaded_from_cache = True
+        return True
+
+    # --- 질의 (O(1)) ---
+
+    def _goal_id(self, goal):
+        if goal is None:
+            if len(self.goals) != 1:
+                raise ValueError("goal must be given when the oracle has several goals")
+            return 0
+        return self.goal_index[goal]
+
+    def distance(self, state, goal=None):
+        """state에서 goal까지의 최단 거리 (도달 불가면 None)"""
+        d = self.distances[self._goal_id(goal)][self.state_index[state]]
+        return None if d < 0 else d
+
+    def value(self, state, goal=None):
+        """goal이 목표인 설정의 V*(state)"""
+        return self.values[self._goal_id(goal)][self.state_index[state]]
+
+    def action(self, state, goal=None):
+        """goal이 목표인 설정의 π*(state) (터미널이면 None)"""
+        a = self.policies[self._goal_id(goal)][self.state_index[state]]
+        return None if a == self.NO_ACTION else self.actions[a]
+
+    def get_value_function(self, goal=None, value_function=None):
+        """goal의 V*를 value_function(기본: TabularValueFunction)에 기록"""
+        if value_function is None:
+            value_function = TabularValueFunction(default_value=0.0)
+        return self.model.to_value_function(self.values[self._goal_id(goal)], value_function)
+
+    def get_policy(self, goal=None):
+        """goal의 π*를 TabularPolicy로 반환"""
+        policy = self.policies[self._goal_id(goal)]
+        action_ids = [-1 if a == self.NO_ACTION else a for a in policy]
+        return self.model.to_policy(action_ids, TabularPolicy(default_action=None))
@@ -0,0 +1,226 @@
+from array import array
+from .qtable import QTable
+from .tabular_policy import TabularPolicy
+from .tabular_value_function import TabularValueFunction
+from .random_stream import RandomStream
+from .action_selection import EpsilonGreedy
+from .step_budget import StepBudget
+from .learning_metrics import LearningMetrics
+
+
+class DynaQ:
+    """
+    Dyna-Q: 실제 경험으로 모델을 학습하고, 그 모델로 simulated backup을 추가로 수행
+
+    실제 스텝 (S, A, R, S')마다
+    1. Direct RL:  Q(S,A) ← Q(S,A) + α·(R + γ·max_a Q(S',a) - Q(S,A))
+    2. Model 학습: model(S,A) ← (R, S')   (마지막으로 관찰한 결과, 결정적 모델)
+    3. Planning:   지금까지 관찰한 (s, a) 중 planning_steps개를 랜덤으로 뽑아
+                   model이 주는 (r, s')로 같은 Q-learning backup을 batch로 수행
+
+    모델과 Q는 상태/액션 인덱스 k = s·A + a 기반 배열에 저장합니다:
+        model_next[k] (관찰 전이면 -1), model_reward[k], q[k]
+    환경의 get_transitions는 사용하지 않으므로(model-free) 실제 스텝이 비싼 환경에서
+    환경과의 상호작용 한 번당 더 많은 backup을 얻습니다.
+    """
+
+    def __init__(self, env, alpha=0.1, epsilon=0.1, gamma=0.9, planning_steps=10,
+                 max_steps=1000, seed=None):
+        """
+        Args:
+            env: 환경 (GridWorld 등)
+            alpha: 학습률 α
+            epsilon: ε-greedy의 epsilon 값 또는 EpsilonSchedule (에피소드마다 진행)
+            gamma: 할인율 γ
+            planning_steps: 실제 스텝마다 수행할 simulated backup 수 k (0이면 Q-learning)
+            max_steps: 에피소드 최대 스텝 수 또는 StepBudget
+            seed: 탐색/planning용 난수 seed (None이면 매번 다른 난수열)
+        """
+        self.env = env
+        self.alpha = alpha
+        self.epsilon = epsilon
+        self.gamma = gamma
+        self.planning_steps = planning_steps
+
+        self.rng = RandomStream(seed)
+        self.action_selector = EpsilonGreedy(epsilon, self.rng)
+        self.step_budget = max_steps if isinstance(max_steps, StepBudget) else StepBudget(max_steps)
+
+        # 상태/액션 인덱스
+        self.states = list(env.get_states())
+        self.state_index = {state: i for i, state in enumerate(self.states)}
+        self.actions = []
+        self.action_index = {}
+        for state in self.states:
+            for action in env.get_actions(state):
+                if action not in self.action_index:
+                    self.action_index[action] = len(self.actions)
+                    self.actions.append(action)
+        self.state_actions = [
+            [self.action_index[action] for action in env.get_actions(state)] for state in self.states
+        ]
+
+        num_pairs = len(self.states) * len(self.actions)
+        self.q = array("d", bytes(8 * num_pairs))
+        self.model_next = array("l", [-1]) * num_pairs
+        self.model_reward = array("d", bytes(8 * num_pairs))
+        # 관찰한 (s, a) 인덱스 목록 (planning 샘플링용)
+        self.observed = array("l")
+
+        self.num_real_steps = 0
+        self.num_planning_backups = 0
+
+        self.policy = TabularPolicy(default_action=None)
+
+    def max_q(self, s):
+        """max_a Q(s, a) (터미널 상태는 0)"""
+        action_ids = self.state_actions[s]
+        if not action_ids:
+            return 0.0
+        base = s * len(self.actions)
+        q = self.q
+        return max(q[base + a] for a in action_ids)
+
+    def q_scores(self, state, actions):
+        """ε-greedy 선택용 Q(s, a) 점수"""
+        base = self.state_index[state] * len(self.actions)
+        return [self.q[base + self.action_index[action]] for action in actions]
+
+    def epsilon_greedy_action(self, state, actions):
+        return self.action_selector.select_one(state, actions, self.q_scores)
+
+    def learn(self, s, a, reward, next_s):
+        """실제 transition으로 Q 업데이트 및 모델 기록"""
+        k = s * len(self.actions) + a
+        self.q[k] += self.alpha * (reward + self.gamma * self.max_q(next_s) - self.q[k])
+
+        if self.model_next[k] < 0:
+            self.observed.append(k)
+        self.model_next[k] = next_s
+        self.model_reward[k] = reward
+
+    def plan(self, num_backups):
+        """
+        관찰한 (s, a) 중 num_backups개를 랜덤으로 뽑아 모델로 simulated backup
+
+        한 batch의 target을 먼저 모두 계산한 뒤 한 번에 반영합니다.
+        """
+        if not self.observed or num_backups <= 0:
+            return
+        observed = self.observed
+        n = len(observed)
+        pairs = [observed[int(u * n)] for u in self.rng.uniforms(num_backups)]
+
+        model_next = self.model_next
+        model_reward = self.model_reward
+        targets = [
+            model_reward[k] + self.gamma * self.max_q(model_next[k]) for k in pairs
+        ]
+
+        q = self.q
+        alpha = self.alpha
+        for k, target in zip(pairs, targets):
+            q[k] += alpha * (target - q[k])
+        self.num_planning_backups += num_backups
+
+    def run_episode(self):
+        """
+        한 에피소드 실행 (실제 스텝마다 learn + plan)
+
+        Returns:
+            total_reward: 에피소드의 총 보상
+            steps: 에피소드의 스텝 수
+        """
+        state = self.env.reset()
+        total_reward = 0.0
+        steps = 0
+
+        done = False
+        for _ in range(self.step_budget.cap):
+            actions = self.env.get_actions(state)
+            if not actions:  # 터미널 상태
+                done = True
+                break
+
+            action = self.epsilon_greedy_action(state, actions)
+            next_state, reward, done = self.env.step(action)
+
+            self.learn(self.state_index[state], self.action_index[action],
+                       reward, self.state_index[next_state])
+            self.plan(self.planning_steps)
+
+            total_reward += reward
+            steps += 1
+            self.num_real_steps += 1
+
+            if done:
+                break
+
+            state = next_state
+
+        self.step_budget.record(steps, truncated=not done)
+        self.action_selector.advance()
+
+        return total_reward, steps
+
+    def extract_policy(self):
+        """
+        현재 Q로부터 greedy policy 추출
+
+        π(s) = argmax_a Q(s, a)
+        """
+        policy = TabularPolicy(default_action=None)
+        for state in self.states:
+            actions = self.env.get_actions(state)
+            if actions:
+                policy.update(state, self.action_selector.argmax(actions, self.q_scores(state, actions)))
+        return policy
+
+    def train(self, num_episodes=1000, verbose=False, metrics=None):
+        """
+        Dyna-Q 학습 메인 루프
+
+        Args:
+            num_episodes: 학습할 에피소드 수
+            verbose: True면 진행상황 출력
+            metrics: LearningMetrics - 주어지면 에피소드별 return/길이를 여기에 집계
+
+        Returns:
+            policy: 학습된 정책
+            episode_rewards: 에피소드별 보상 리스트 (metrics가 주어지면 metrics)
+        """
+        # metrics가 주어지면 보상 리스트를 만들지 않고 스트리밍 지표에만 집계
+        episode_rewards = [] if metrics is None else None
+        tracker = metrics if metrics is not None else (LearningMetrics() if verbose else None)
+
+        for episode_num in range(num_episodes):
+            total_reward, steps = self.run_episode()
+            if episode_rewards is not None:
+                episode_rewards.append(total_reward)
+            if tracker is not None:
+                tracker.record(total_reward, steps)
+
+            if verbose and (episode_num + 1) % 100 == 0:
+                print(f"Episode {episode_num + 1}/{num_episodes} - "
+                      f"Avg Reward (last {tracker.window}): {tracker.mean_return():.3f}")
+
+        policy = self.extract_policy()
+        self.policy = policy
+
+        return policy, episode_rewards if metrics is None else metrics
+
+    def get_q_values(self):
+        """학습된 Q를 QTable로 반환"""
+        qtable = QTable(alpha=1.0)
+        num_actions = len(self.actions)
+        for s, state in enumerate(self.states):
+            for a in self.state_actions[s]:
+                qtable.update(state, self.actions[a], self.q[s * num_actions + a])
+        return qtable
+
+    def get_value_function(self):
+        """학습된 Q로부터 V(s) = max_a Q(s,a) 계산하여 반환"""
+        value_function = TabularValueFunction(default_value=0.0)
+        for s, state in enumerate(self.states):
+            value_function.update(state, self.max_q(s))
+        return value_function
@@ -0,0 +1,210 @@
+import copy
+import hashlib
+import inspect
+import itertools
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+def run_trial(agent_class, env, params, seed, num_episodes, evaluate=None):
+    """
+    하나의 trial 실행 (프로세스 풀에서 호출되므로 모듈 최상위 함수)
+
+    Returns:
+        {"params", "seed", "episode_rewards", "score"} 결과 딕셔너리
+    """
+    # StepBudget 등 상태를 가진 파라미터 객체가 trial 사이에 공유되지 않도록 복사본 사용
+    agent_params = copy.deepcopy(params)
+    # 에이전트가 자체 난수 스트림(seed 인자)을 지원하면 그것을, 아니면 전역 random을 고정
+    if "seed" in inspect.signature(agent_class).parameters:
+        agent = agent_class(env=env, seed=seed, **agent_params)
+    else:
+        random.seed(seed)
+        agent = agent_class(env=env, **agent_params)
+    result = agent.train(num_episodes=num_episodes, verbose=False)
+
+    # TD0/TDLambda 등은 (policy, episode_rewards), MonteCarlo는 policy만 반환
+    episode_rewards = list(result[1]) if isinstance(result, tuple) else []
+    score = evaluate(agent) if evaluate is not None else None
+    return {"params": params, "seed": seed, "episode_rewards": episode_rewards, "score": score}
+
+
+class HyperparameterSweep:
+    """
+    하이퍼파라미터 grid x seed 조합을 병렬로 실행하는 sweep runner
+
+    - 모든 (하이퍼파라미터 조합, seed) trial을 프로세스 풀에서 실행
+    - 끝난 trial의 결과는 설정(config)의 해시를 이름으로 cache_dir에 바로 저장되므로,
+      중간에 중단되어도 다시 실행하면 남은 trial만 실행 (resumable)
+    - 같은 하이퍼파라미터의 seed별 learning curve를 평균내어 집계
+
+    사용 예:
+        sweep = HyperparameterSweep(
+            TDLambda, gridworld,
+            param_grid={"alpha": [0.05, 0.1], "lambda_": [0.0, 0.8]},
+            seeds=[0, 1, 2],
+            num_episodes=1000,
+            cache_dir="sweep_cache",
+        )
+        results = sweep.run()
+        summary = sweep.aggregate(results)
+    """
+
+    def __init__(self, agent_class, env, param_grid, seeds=(0,), num_episodes=1000,
+                 cache_dir=None, num_workers=None, fixed_params=None, evaluate=None):
+        """
+        Args:
+            agent_class: 에이전트 클래스 (agent_class(env=env, **params).train(num_episodes) 형태)
+            env: 환경
+            param_grid: {파라미터 이름: 값 리스트}
+            seeds: trial마다 사용할 seed 리스트
+            num_episodes: trial별 학습 에피소드 수
+            cache_dir: 결과 캐시 디렉토리 (None이면 캐시하지 않음)
+            num_workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행)
+            fixed_params: 모든 trial에 공통으로 넘길 파라미터
+            evaluate: 학습이 끝난 에이전트를 받아 점수를 반환하는 함수 (모듈 최상위 함수여야 함)
+        """
+        self.agent_class = agent_class
+        self.env = env
+        self.param_grid = param_grid
+        self.seeds = list(seeds)
+        self.num_episodes = num_episodes
+        self.cache_dir = cache_dir
+        self.num_workers = num_workers
+        self.fixed_params = fixed_params or {}
+        self.evaluate = evaluate
+
+    def trials(self):
+        """(params, seed) 조합 리스트"""
+        names = sorted(self.param_grid)
+        trials = []
+        for values in itertools.product(*(self.param_grid[name] for name in names)):
+            params = dict(self.fixed_params)
+            params.update(zip(names, values))
+            for seed in self.seeds:
+                trials.append((params, seed))
+        return trials
+
+    def config_hash(self, params, seed):
+        """trial 설정(에이전트, 환경, 파라미터, seed, 에피소드 수)의 해시"""
+        if hasattr(self.env, "canonical_key"):
+            # 보상 맵(hazards 등)은 tuple 키 dict이므로 정규화된 맵 설정 사용 + 학습에 영향을 주는 시작 상태
+            env_config = self.env.canonical_key()
+            env_config["start_state"] = self.env.start_state
+        else:
+            env_config = {
+                key: value for key, value in vars(self.env).items() if key != "current_state"
+            }
+        config = {
+            "agent": f"{self.agent_class.__module__}.{self.agent_class.__qualname__}",
+            "env": f"{type(self.env).__qualname__}{json.dumps(env_config, sort_keys=True, default=repr)}",
+            "params": params,
+            "seed": seed,
+            "num_episodes": self.num_episodes,
+            "evaluate": None if self.evaluate is None else
+            f"{self.evaluate.__module__}.{self.evaluate.__qualname__}",
+        }
+        encoded = json.dumps(config, sort_keys=True, default=repr).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _cache_path(self, params, seed):
+        return os.path.join(self.cache_dir, self.config_hash(params, seed) + ".json")
+
+    def _load_cached(self, params, seed):
+        if self.cache_dir is None:
+            return None
+        path = self._cache_path(params, seed)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save(self, result):
+        if self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._cache_path(result["params"], result["seed"])
+        # 쓰는 도중 중단되어도 깨진 파일이 남지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            # 파라미터 객체(StepBudget, EpsilonSchedule)는 설정 해시와 같은 repr로 저장
+            json.dump(result, f, default=repr)
+        os.replace(temp_path, path)
+
+    def run(self, verbose=False):
+        """
+        모든 trial 실행 (캐시에 있는 trial은 건너뜀)
+
+        Returns:
+            trial 결과 리스트 (trials() 순서)
+        """
+        trials = self.trials()
+        results = [self._load_cached(params, seed) for params, seed in trials]
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        if verbose:
+            print(f"Trials: {len(trials)} (cached: {len(trials) - len(pending)})")
+
+        if self.num_workers == 1:
+            for i in pending:
+                params, seed = trials[i]
+                results[i] = run_trial(
+                    self.agent_class, self.env, params, seed, self.num_episodes, self.evaluate
+                )
+                self._save(results[i])
+                if verbose:
+                    print(f"  done: {params} seed={seed}")
+            return results
+
+        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+            futures = {
+                executor.submit(
+                    run_trial, self.agent_class, self.env, trials[i][0], trials[i][1],
+                    self.num_episodes, self.evaluate
+                ): i
+                for i in pending
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                self._save(results[i])
+                if verbose:
+                    print(f"  done: {trials[i][0]} seed={trials[i][1]}")
+
+        return results
+
+    def aggregate(self, results, window=100):
+        """
+        같은 하이퍼파라미터를 가진 trial들을 seed에 대해 평균
+
+        Args:
+            results: run()의 결과
+            window: 마지막 window 에피소드의 평균 보상을 final_reward로 계산
+
+        Returns:
+            [{"params", "num_seeds", "mean_curve", "final_reward", "mean_score"}, ...]
+        """
+        groups = {}
+        for result in results:
+            key = json.dumps(result["params"], sort_keys=True, default=repr)
+            groups.setdefault(key, []).append(result)
+
+        summary = []
+        for group in groups.values():
+            curves = [result["episode_rewards"] for result in group if result["episode_rewards"]]
+            length = min((len(curve) for curve in curves), default=0)
+            mean_curve = [
+                sum(curve[t] for curve in curves) / len(curves) for t in range(length)
+            ]
+            tail = mean_curve[-window:]
+            scores = [result["score"] for result in group if result["score"] is not None]
+            summary.append({
+                "params": group[0]["params"],
+                "num_seeds": len(group),
+                "mean_curve": mean_curve,
+                "final_reward": sum(tail) / len(tail) if tail else 0.0,
+                "mean_score": sum(scores) / len(scores) if scores else None,
+            })
+        return summary
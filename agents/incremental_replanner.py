@@ -0,0 +1,178 @@
+import heapq
+import itertools
+from collections import defaultdict
+from .tabular_value_function import TabularValueFunction
+from .value_iteration import ValueIteration
+
+
+class IncrementalReplanner:
+    """
+    GridWorld 맵 변경 시 이전 가치 함수로부터 영향 받은 영역만 복구하는 증분 재계획
+
+    장애물 추가/제거, 목표 이동 등 맵 변경(delta)이 주어지면
+    1. 변경된 셀과 그 셀로 이동을 시도하는 이웃 셀들의 transition만 다시 계산하고
+       predecessor index를 갱신합니다.
+    2. (결정적 환경) LPA*/D*-Lite처럼 값이 낮아져야 하는 상태(underconsistent)와
+       그 상태에 의존하던 predecessor들을 하한값으로 초기화합니다.
+    3. 초기화된 상태와 변경된 상태에서부터 prioritized sweeping으로
+       Bellman residual이 큰 순서대로 backup하며, 값이 바뀐 상태의
+       predecessor만 다시 큐에 넣습니다.
+
+    변경되지 않은 영역은 이전 해의 값을 그대로 warm start로 사용합니다.
+    """
+
+    def __init__(self, mdp, values=None, theta=0.001):
+        """
+        Args:
+            mdp: GridWorld 환경 (obstacles, goal_states, ACTION_DELTAS 사용)
+            values: 이전 해의 가치 함수 (없으면 새로 생성)
+            theta: 수렴 판정 기준 (Bellman residual)
+        """
+        self.mdp = mdp
+        self.values = values if values is not None else TabularValueFunction()
+        self.theta = theta
+
+        # predecessor index: s' -> {s | P(s'|s,a) > 0}
+        self.predecessors = defaultdict(set)
+        self.successors = defaultdict(set)
+        self.deterministic = True
+        self.min_reward = 0.0
+
+        # 마지막 재계획에서 수행한 backup 횟수
+        self.num_backups = 0
+
+        for state in self.mdp.get_states():
+            self._index_state(state)
+
+    def _index_state(self, state):
+        """state의 transition을 predecessor index에 등록"""
+        for action in self.mdp.get_actions(state):
+            for next_state, probability in self.mdp.get_transitions(state, action):
+                if probability <= 0.0:
+                    continue
+                if probability < 1.0:
+                    self.deterministic = False
+                reward = self.mdp.get_reward(state, action, next_state)
+                self.min_reward = min(self.min_reward, reward)
+                self.successors[state].add(next_state)
+                self.predecessors[next_state].add(state)
+
+    def _unindex_state(self, state):
+        """state의 transition을 predecessor index에서 제거"""
+        for next_state in self.successors.pop(state, ()):
+            self.predecessors[next_state].discard(state)
+
+    def _value_lower_bound(self):
+        """가능한 최소 보상으로 얻는 V의 하한"""
+        gamma = self.mdp.get_discount_factor()
+        if gamma >= 1.0:
+            return self.min_reward
+        return self.min_reward / (1.0 - gamma)
+
+    def backup(self, state):
+        """Bellman optimality backup: max_a Q(s,a)"""
+        actions = self.mdp.get_actions(state)
+        if not actions:
+            return 0.0  # 터미널 상태
+        return max(self.values.get_q_value(self.mdp, state, action) for action in actions)
+
+    def plan(self, max_iterations=1000):
+        """처음 한 번 전체 Value Iteration으로 해를 구합니다."""
+        vi = ValueIteration(self.mdp, self.values)
+        return vi.value_iteration(max_iterations=max_iterations, theta=self.theta)
+
+    def update_map(self, add_obstacles=(), remove_obstacles=(), add_goals=(), remove_goals=()):
+        """
+        맵 변경을 적용하고 영향 받은 영역만 재계획합니다.
+
+        Args:
+            add_obstacles: 새로 추가할 장애물 셀들
+            remove_obstacles: 제거할 장애물 셀들
+            add_goals: 새로 추가할 목표 셀들
+            remove_goals: 제거할 목표 셀들
+
+        Returns:
+            재계획에 사용된 backup 횟수
+        """
+        changed = set(add_obstacles) | set(remove_obstacles) | set(add_goals) | set(remove_goals)
+
+        # 변경된 셀로 이동을 시도하는 셀들은 transition이 바뀔 수 있음
+        affected = set(changed)
+        for row, col in changed:
+            for action in self.mdp.ACTIONS:
+                d_row, d_col = self.mdp.ACTION_DELTAS.get(action, (0, 0))
+                neighbor = (row - d_row, col - d_col)
+                if 0 <= neighbor[0] < self.mdp.height and 0 <= neighbor[1] < self.mdp.width:
+                    affected.add(neighbor)
+
+        for state in affected:
+            self._unindex_state(state)
+
+        # 맵 변경 적용 (호출자가 넘긴 리스트를 직접 수정하지 않도록 새 리스트 생성)
+        self.mdp.obstacles = [
+            cell for cell in self.mdp.obstacles if cell not in remove_obstacles
+        ] + [cell for cell in add_obstacles if cell not in self.mdp.obstacles]
+        self.mdp.goal_states = [
+            cell for cell in self.mdp.goal_states if cell not in remove_goals
+        ] + [cell for cell in add_goals if cell not in self.mdp.goal_states]
+
+        seeds = [state for state in affected if state not in self.mdp.obstacles]
+        for state in seeds:
+            self._index_state(state)
+
+        return self.replan(seeds)
+
+    def replan(self, seeds):
+        """
+        seeds(transition이 바뀐 상태들)에서 시작해 가치 함수를 복구합니다.
+
+        Returns:
+            수행한 backup 횟수
+        """
+        self.num_backups = 0
+        touched = set(seeds)
+
+        # LPA*/D*-Lite 스타일: 값이 낮아져야 하는 상태와 그에 의존하던 상태들을
+        # 하한값으로 초기화해 서로의 예전 값을 지지하는 순환(count-to-infinity)을 끊음
+        if self.deterministic:
+            lower_bound = self._value_lower_bound()
+            invalidated = set()
+            stack = list(seeds)
+            while stack:
+                state = stack.pop()
+                if state in invalidated:
+                    continue
+                self.num_backups += 1
+                if self.backup(state) < self.values.get_value(state) - self.theta:
+                    self.values.update(state, lower_bound)
+                    invalidated.add(state)
+                    for predecessor in self.predecessors[state]:
+                        touched.add(predecessor)
+                        stack.append(predecessor)
+
+        # Prioritized sweeping: residual이 큰 상태부터 backup
+        counter = itertools.count()
+        heap = []
+        for state in touched:
+            heapq.heappush(heap, (0.0, next(counter), state))
+
+        while heap:
+            _, _, state = heapq.heappop(heap)
+            new_value = self.backup(state)
+            self.num_backups += 1
+            change = abs(new_value - self.values.get_value(state))
+            if change <= self.theta:
+                continue
+
+            self.values.update(state, new_value)
+
+            # 값이 바뀐 상태의 predecessor만 다시 확인
+            priority = -self.mdp.get_discount_factor() * change
+            for predecessor in self.predecessors[state]:
+                heapq.heappush(heap, (priority, next(counter), predecessor))
+
+        return self.num_backups
+
+    def extract_policy(self):
+        """현재 가치 함수로부터 greedy policy 추출"""
+        return self.values.extract_policy(self.mdp)
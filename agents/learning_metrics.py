@@ -0,0 +1,249 @@
+import json
+import math
+import os
+import struct
+import sys
+from array import array
+
+
+class RollingWindow:
+    """
+    최근 size개의 값을 ring buffer(array('d'))에 유지하는 rolling window
+
+    합계를 함께 갱신하므로 mean()은 O(1)이며, 메모리는 기록한 값의 수와 무관하게 size개입니다.
+    """
+
+    def __init__(self, size=100):
+        self.size = size
+        self.buffer = array("d", [0.0]) * size
+        self.count = 0
+        self.total = 0.0
+        self.position = 0
+
+    def append(self, value):
+        if self.count == self.size:
+            self.total -= self.buffer[self.position]
+        else:
+            self.count += 1
+        self.buffer[self.position] = value
+        self.total += value
+        self.position = (self.position + 1) % self.size
+        if self.position == 0:
+            # 더하고 빼기를 반복하며 쌓인 부동소수점 오차 제거 (size번에 한 번이므로 평균 O(1))
+            self.total = sum(self.buffer[:self.count])
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def values(self):
+        """오래된 것부터 순서대로 window의 값 리스트"""
+        if self.count < self.size:
+            return list(self.buffer[:self.count])
+        return list(self.buffer[self.position:]) + list(self.buffer[:self.position])
+
+    def __len__(self):
+        return self.count
+
+
+class ExponentialMovingAverage:
+    """지수 이동 평균 - EMA ← EMA + α·(x - EMA) (첫 값으로 초기화)"""
+
+    def __init__(self, alpha=0.01):
+        self.alpha = alpha
+        self.value = None
+
+    def update(self, x):
+        if self.value is None:
+            self.value = float(x)
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+
+class QuantileSketch:
+    """
+    상대 오차가 보장되는 스트리밍 분위수 sketch (DDSketch 방식의 로그 히스토그램)
+
+    |x|를 γ = (1 + α)/(1 - α) 밑의 로그 구간(bucket) 인덱스 ceil(log_γ |x|)로 세므로
+    quantile(q)는 실제 분위수와 상대 오차 α 이내입니다. 음수는 별도 bucket에, |x| < MIN_VALUE는 0으로 셉니다.
+    bucket 수는 값의 범위(로그 스케일)에만 의존하므로 기록한 값의 수와 무관하게 메모리가 제한되며,
+    max_bins를 넘으면 가장 작은 |x| 쪽 bucket들을 합칩니다 (그 구간의 분위수만 부정확해짐).
+    분포가 학습 중에 바뀌어도(초반의 긴 에피소드 등) 누적 분위수를 정확히 따라갑니다.
+    """
+
+    MIN_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy=0.01, max_bins=2048):
+        """
+        Args:
+            relative_accuracy: 분위수의 상대 오차 α
+            max_bins: 양수/음수 bucket 각각의 최대 수
+        """
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_bins = max_bins
+        self.positive = {}
+        self.negative = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _index(self, magnitude):
+        return math.ceil(math.log(magnitude) / self.log_gamma)
+
+    def _value(self, index):
+        # bucket (γ^(i-1), γ^i]의 대표값 - 양 끝과의 상대 오차가 모두 α
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def update(self, x):
+        self.count += 1
+        if x > self.MIN_VALUE:
+            bins = self.positive
+            magnitude = x
+        elif x < -self.MIN_VALUE:
+            bins = self.negative
+            magnitude = -x
+        else:
+            self.zero_count += 1
+            return
+        index = self._index(magnitude)
+        bins[index] = bins.get(index, 0) + 1
+        if len(bins) > self.max_bins:
+            self._collapse(bins)
+
+    def _collapse(self, bins):
+        """|x|가 가장 작은 두 bucket을 합쳐 bucket 수를 max_bins로 유지"""
+        lowest, second = sorted(bins)[:2]
+        bins[second] += bins.pop(lowest)
+
+    def quantile(self, q):
+        """q 분위수 추정값 (값이 없으면 0.0)"""
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = 0
+        # 작은 값부터: 음수(|x| 큰 것부터) → 0 → 양수(작은 것부터)
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return -self._value(index)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self.positive))
+
+
+class LearningMetrics:
+    """
+    에피소드별 return / 길이를 메모리 크기 고정으로 집계하는 스트리밍 learning curve 지표
+
+    에피소드마다 record(episode_return, episode_length)를 호출하면
+        - rolling window(ring buffer) 평균
+        - 지수 이동 평균(EMA)
+        - 분위수 sketch (QuantileSketch, 누적 분포의 quantiles)
+    을 갱신합니다. 에피소드 리스트를 저장하지 않으므로 메모리는 에피소드 수와 무관합니다.
+
+    path를 주면 flush_interval 에피소드마다 summary 한 행을 파일에 추가(append)합니다.
+    파일 형식:
+        MAGIC(8바이트) | 헤더 길이(uint32, little-endian) | 헤더(JSON: fields, byteorder) | 행(float64 x 필드 수) ...
+    LearningMetrics.read(path)로 행 리스트를 읽을 수 있습니다.
+    """
+
+    MAGIC = b"RLMETRIC"
+
+    def __init__(self, window=100, ema_alpha=0.01, quantiles=(0.5, 0.9), path=None, flush_interval=1000,
+                 relative_accuracy=0.01):
+        """
+        Args:
+            window: rolling window 크기 (에피소드 수)
+            ema_alpha: EMA 계수 α
+            quantiles: 추정할 분위수들
+            path: summary를 기록할 파일 경로 (None이면 기록하지 않음, 있으면 덮어씀)
+            flush_interval: summary를 기록할 에피소드 간격
+            relative_accuracy: 분위수 sketch의 상대 오차
+        """
+        self.window = window
+        self.quantiles = tuple(quantiles)
+        self.path = path
+        self.flush_interval = flush_interval
+        self.num_episodes = 0
+
+        self.return_window = RollingWindow(window)
+        self.length_window = RollingWindow(window)
+        self.return_ema = ExponentialMovingAverage(ema_alpha)
+        self.length_ema = ExponentialMovingAverage(ema_alpha)
+        self.return_sketch = QuantileSketch(relative_accuracy)
+        self.length_sketch = QuantileSketch(relative_accuracy)
+
+        if path is not None:
+            header = json.dumps({"fields": self.fields(), "byteorder": sys.byteorder}).encode("utf-8")
+            with open(path, "wb") as f:
+                f.write(self.MAGIC)
+                f.write(struct.pack("<I", len(header)))
+                f.write(header)
+
+    def fields(self):
+        """summary()의 필드 이름들 (파일의 행 순서)"""
+        names = ["episodes", "return_mean", "return_ema"]
+        names += [f"return_p{q * 100:g}" for q in self.quantiles]
+        names += ["length_mean", "length_ema"]
+        names += [f"length_p{q * 100:g}" for q in self.quantiles]
+        return names
+
+    def record(self, episode_return, episode_length):
+        """에피소드 하나의 return과 길이 기록"""
+        self.num_episodes += 1
+        self.return_window.append(episode_return)
+        self.length_window.append(episode_length)
+        self.return_ema.update(episode_return)
+        self.length_ema.update(episode_length)
+        self.return_sketch.update(episode_return)
+        self.length_sketch.update(episode_length)
+
+        if self.path is not None and self.num_episodes % self.flush_interval == 0:
+            self.flush()
+
+    def mean_return(self):
+        """최근 window 에피소드의 평균 return"""
+        return self.return_window.mean()
+
+    def summary(self):
+        """현재 지표들의 {필드 이름: 값}"""
+        values = [float(self.num_episodes), self.return_window.mean(), self.return_ema.value or 0.0]
+        values += [self.return_sketch.quantile(q) for q in self.quantiles]
+        values += [self.length_window.mean(), self.length_ema.value or 0.0]
+        values += [self.length_sketch.quantile(q) for q in self.quantiles]
+        return dict(zip(self.fields(), values))
+
+    def flush(self):
+        """summary 한 행을 파일에 추가"""
+        if self.path is None:
+            return
+        with open(self.path, "ab") as f:
+            array("d", self.summary().values()).tofile(f)
+
+    @classmethod
+    def read(cls, path):
+        """
+        기록된 summary 행 리스트
+
+        Returns:
+            [{필드 이름: 값}, ...]
+        """
+        with open(path, "rb") as f:
+            if f.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"not a metrics file: {path}")
+            (header_length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_length).decode("utf-8"))
+            fields = header["fields"]
+            rows = array("d")
+            num_values = (os.path.getsize(path) - len(cls.MAGIC) - 4 - header_length) // 8
+            rows.fromfile(f, num_values - num_values % len(fields))
+        if header["byteorder"] != sys.byteorder:
+            rows.byteswap()
+        num_fields = len(fields)
+        return [dict(zip(fields, rows[i:i + num_fields])) for i in range(0, len(rows), num_fields)]
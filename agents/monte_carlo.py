@@ -1,7 +1,9 @@
-import random
 from collections import defaultdict
 from .qtable import QTable
 from .tabular_policy import TabularPolicy
+from .random_stream import RandomStream
+from .action_selection import EpsilonGreedy
+from .step_budget import StepBudget
 
 
 class MonteCarlo:
@@ -19,24 +21,37 @@ class MonteCarlo:
        G_t = Σ(k=0 to T-t-1) γ^k * R_(t+k+1)
     """
 
-    def __init__(self, env, epsilon=0.1, discount=0.9, first_visit=True):
+    def __init__(self, env, epsilon=0.1, discount=0.9, first_visit=True, max_steps=1000,
+                 seed=None):
         """
         Args:
             env: 환경 (GridWorld 등)
-            epsilon: ε-greedy의 epsilon 값
+            epsilon: ε-greedy의 epsilon 값 또는 EpsilonSchedule (에피소드마다 진행)
             discount: 할인율 γ
             first_visit: True면 first-visit MC, False면 every-visit MC
+            max_steps: 에피소드 최대 스텝 수 또는 StepBudget (적응형 cap)
+            seed: 탐색(exploration)용 난수 seed (None이면 매번 다른 난수열)
         """
         self.env = env
         self.epsilon = epsilon
         self.discount = discount
         self.first_visit = first_visit
+
+        # 에이전트 전용 난수 스트림 (전역 random 모듈과 독립)
+        self.rng = RandomStream(seed)
+        self.action_selector = EpsilonGreedy(epsilon, self.rng)
+
+        # 에피소드 step cap과 에피소드 통계
+        self.step_budget = max_steps if isinstance(max_steps, StepBudget) else StepBudget(max_steps)
         
-        # Q-table: Q(s, a) 값 저장
-        self.qtable = QTable(alpha=1.0, default_value=0.0)
+        # Q-table: Q(s, a) 값 저장 (argmax 동점은 랜덤으로 선택)
+        self.qtable = QTable(alpha=1.0, default_value=0.0, rng=self.rng)
         
         # Returns: 각 (s, a)에 대한 return 리스트
         self.returns = defaultdict(list)
+
+        # 마지막 에피소드가 step cap에 걸려 잘렸다면 그 마지막 상태 (아니면 None)
+        self.truncated_state = None
         
         # Policy: greedy policy
         self.policy = TabularPolicy(default_action=None)
@@ -52,15 +67,7 @@ class MonteCarlo:
         Returns:
             선택된 액션
         """
-        if not actions:
-            return None
-        
-        # ε 확률로 랜덤 액션 선택 (exploration)
-        if random.random() < self.epsilon:
-            return random.choice(actions)
-        
-        # 1-ε 확률로 greedy 액션 선택 (exploitation)
-        return self.qtable.get_best_action(state, actions)
+        return self.action_selector.q_action(self.qtable, state, actions)
 
     def generate_episode(self):
         """
@@ -72,10 +79,11 @@ class MonteCarlo:
         episode = []
         state = self.env.reset()
         
-        max_steps = 1000  # 무한 루프 방지
-        for _ in range(max_steps):
+        done = False
+        for _ in range(self.step_budget.cap):
             actions = self.env.get_actions(state)
             if not actions:  # 터미널 상태
+                done = True
                 break
             
             action = self.epsilon_greedy_action(state, actions)
@@ -88,22 +96,30 @@ class MonteCarlo:
             
             state = next_state
         
+        # 잘린 에피소드는 마지막 상태를 기억해 두었다가 return 계산 시 Q로 bootstrap
+        self.truncated_state = None if done or not episode else next_state
+        self.step_budget.record(len(episode), truncated=not done)
+        
+        # 에피소드가 끝날 때마다 ε 스케줄 진행
+        self.action_selector.advance()
+        
         return episode
 
-    def calculate_returns(self, episode):
+    def calculate_returns(self, episode, bootstrap=0.0):
         """
         에피소드로부터 각 time step의 return G_t 계산
         
-        G_t = R_(t+1) + γ*R_(t+2) + γ^2*R_(t+3) + ... + γ^(T-t-1)*R_T
+        G_t = R_(t+1) + γ*R_(t+2) + γ^2*R_(t+3) + ... + γ^(T-t-1)*R_T + γ^(T-t)*bootstrap
         
         Args:
             episode: [(state, action, reward), ...] 리스트
+            bootstrap: 에피소드가 잘린 경우 마지막 상태의 가치 추정 (터미널이면 0)
         
         Returns:
             returns: [G_0, G_1, G_2, ...] 리스트
         """
         returns = []
-        G = 0.0
+        G = bootstrap
         
         # 역순으로 계산 (T-1부터 0까지)
         for state, action, reward in reversed(episode):
@@ -118,7 +134,13 @@ class MonteCarlo:
         
         q_π(s,a) = average of returns following (s,a)
         """
-        returns = self.calculate_returns(episode)
+        # 잘린 에피소드는 마지막 상태의 max_a Q로 bootstrap (터미널로 취급하지 않음)
+        bootstrap = 0.0
+        if self.truncated_state is not None:
+            bootstrap = self.qtable.get_max_q(
+                self.truncated_state, self.env.get_actions(self.truncated_state)
+            )
+        returns = self.calculate_returns(episode, bootstrap)
         visited_state_actions = set()
         
         for t, (state, action, reward) in enumerate(episode):
@@ -150,13 +172,14 @@ class MonteCarlo:
                 best_action = self.qtable.get_argmax_q(state, actions)
                 self.policy.update(state, best_action)
 
-    def train(self, num_episodes=1000, verbose=False):
+    def train(self, num_episodes=1000, verbose=False, metrics=None):
         """
         Monte Carlo Control 학습 메인 루프
         
         Args:
             num_episodes: 학습할 에피소드 수
             verbose: True면 진행상황 출력
+            metrics: LearningMetrics - 주어지면 에피소드별 return/길이를 여기에 집계
         
         Returns:
             policy: 학습된 정책
@@ -164,6 +187,8 @@ class MonteCarlo:
         for episode_num in range(num_episodes):
             # 2. Generate Episode
             episode = self.generate_episode()
+            if metrics is not None:
+                metrics.record(sum(reward for _, _, reward in episode), len(episode))
             
             # 3. Estimate Q
             self.update_q_values(episode)
@@ -176,6 +201,52 @@ class MonteCarlo:
         
         return self.policy
 
+    def learn_episodes(self, episodes):
+        """
+        다른 곳(actor, 로그 등)에서 생성한 에피소드 batch로 Q 업데이트 (정책 개선은 하지 않음)
+
+        Args:
+            episodes: [[(state, action, reward, next_state, done), ...], ...]
+                      터미널에 도달하지 못하고 잘린 에피소드는 마지막 다음 상태의 max_a Q로 bootstrap 합니다.
+        """
+        for logged_episode in episodes:
+            if not logged_episode:
+                continue
+            episode = [(state, action, reward) for state, action, reward, _, _ in logged_episode]
+            _, _, _, last_state, done = logged_episode[-1]
+            self.truncated_state = None if done else last_state
+            self.update_q_values(episode)
+        self.truncated_state = None
+
+    def get_parameters(self):
+        """actor에게 배포할 파라미터 스냅샷 (pickle 가능한 dict, ε-greedy Q 행동용)"""
+        return {
+            "q": {state: dict(row) for state, row in self.qtable.q_table.items()},
+            "gamma": self.discount,
+            "epsilon": self.action_selector.epsilon,
+            "max_steps": self.step_budget.cap,
+        }
+
+    def train_offline(self, log, num_epochs=1):
+        """
+        로그 파일(TransitionLog)의 에피소드로 학습 - 환경에서 step 하지 않음
+
+        로그를 에피소드 단위로 읽으므로 메모리에는 에피소드 하나만 올라갑니다.
+        정책 개선(improve_policy)은 epoch마다 한 번 수행합니다.
+
+        Args:
+            log: TransitionLog (episodes()로 에피소드를 생성하는 reader)
+            num_epochs: 로그 전체를 반복할 횟수
+
+        Returns:
+            policy: 학습된 정책
+        """
+        for _ in range(num_epochs):
+            self.learn_episodes(log.episodes())
+            self.improve_policy()
+
+        return self.policy
+
     def get_q_values(self):
         """학습된 Q-table 반환"""
         return self.qtable
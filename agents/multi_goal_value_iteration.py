@@ -0,0 +1,159 @@
+import copy
+from array import array
+from operator import add, mul, sub
+from .tabular_policy import TabularPolicy
+from .tabular_value_function import TabularValueFunction
+
+
+class MultiGoalValueIteration:
+    """
+    같은 맵의 K개 목표 설정(goal_configs)을 한 번에 푸는 batched Value Iteration
+
+    목표만 다르고 dynamics는 같으므로 목표가 없는(터미널이 위험 셀뿐인) 맵을 한 번만 컴파일해
+    transition 구조를 공유하고, 상태마다 K개 목표의 값을 길이 K 벡터로 함께 갱신합니다.
+    GridWorld의 보상은 다음 상태 s'에만 의존하므로 sweep은
+
+        B[s'] = R[s'] + γ·V[s']            (길이 K 벡터, 목표별 진입 보상 R)
+        V[s] = max_a Σ_s' P(s'|s,a)·B[s']  (목표 k에서 s가 터미널이면 0)
+
+    이며, 벡터 연산은 map(max/add/mul, ...)로 수행하므로 Python 루프는 목표 수 K와 무관하게
+    sweep당 O(S·A)입니다. sweep은 in-place(Gauss-Seidel)로 수행합니다.
+
+    값은 상태별 길이 K 리스트(values[s][k])로 저장하며, value_matrix()로 (K, S) 행렬을 얻을 수 있습니다.
+    """
+
+    def __init__(self, env, goal_configs):
+        """
+        Args:
+            env: GridWorld (장애물, 위험 셀, cell_rewards, step_cost는 모든 목표 설정이 공유하며
+                 env.goal_states는 사용하지 않음)
+            goal_configs: 목표 설정 리스트 - 각 설정은 목표 셀 리스트 또는 {cell: reward}
+                          (리스트면 env.goal_rewards의 보상, 없으면 +1)
+        """
+        self.env = env
+        self.goal_configs = [
+            dict(config) if isinstance(config, dict)
+            else {cell: env.goal_rewards.get(cell, 1.0) for cell in config}
+            for config in goal_configs
+        ]
+        self.num_goals = len(self.goal_configs)
+
+        # 목표가 없는 맵을 컴파일해 모든 목표 설정이 transition 구조를 공유
+        dynamics = copy.copy(env)
+        dynamics.goal_states = []
+        self.model = model = dynamics.compile()
+        self.gamma = model.discount
+
+        num_goals = self.num_goals
+        # 상태별 목표 설정별 진입 보상 R[s'][k]
+        self.entry_rewards = [
+            [dynamics.get_reward(None, None, state)] * num_goals for state in model.states
+        ]
+        # 어떤 설정에서 목표(터미널)인 상태: s → 길이 K의 0/1 마스크 (목표인 설정이 0)
+        self.terminal_masks = {}
+        for k, config in enumerate(self.goal_configs):
+            for cell, reward in config.items():
+                s = model.state_index[cell]
+                self.entry_rewards[s][k] += reward
+                self.terminal_masks.setdefault(s, [1.0] * num_goals)[k] = 0.0
+
+        # 상태별 액션별 [(s', p), ...]
+        self.state_transitions = []
+        for s in range(model.num_states):
+            transitions = []
+            for a in model.state_actions[s]:
+                k = s * model.num_actions + a
+                transitions.append([
+                    (model.next_states[j], model.probabilities[j])
+                    for j in range(model.offsets[k], model.offsets[k + 1])
+                ])
+            self.state_transitions.append(transitions)
+
+        self.values = [[0.0] * num_goals for _ in range(model.num_states)]
+        # B[s] = R[s] + γ·V[s]
+        self.backups = [list(rewards) for rewards in self.entry_rewards]
+
+    def action_backups(self, s):
+        """상태 s의 액션별 Q(s, a) 벡터 리스트 (길이 K)"""
+        backups = self.backups
+        q_values = []
+        for transitions in self.state_transitions[s]:
+            if len(transitions) == 1 and transitions[0][1] == 1.0:
+                q_values.append(backups[transitions[0][0]])
+                continue
+            q = [0.0] * self.num_goals
+            for next_s, probability in transitions:
+                q = list(map(add, q, map(probability.__mul__, backups[next_s])))
+            q_values.append(q)
+        return q_values
+
+    def sweep(self):
+        """in-place sweep 한 번 - 모든 목표 설정의 최대 변화량 반환"""
+        values = self.values
+        backups = self.backups
+        entry_rewards = self.entry_rewards
+        terminal_masks = self.terminal_masks
+        gamma = self.gamma.__mul__
+
+        delta = 0.0
+        for s in range(self.model.num_states):
+            if not self.state_transitions[s]:
+                continue  # 위험 셀 (모든 설정에서 터미널)
+
+            q_values = self.action_backups(s)
+            new_values = list(map(max, *q_values)) if len(q_values) > 1 else list(q_values[0])
+            mask = terminal_masks.get(s)
+            if mask is not None:
+                new_values = list(map(mul, new_values, mask))
+
+            delta = max(delta, max(map(abs, map(sub, new_values, values[s]))))
+            values[s] = new_values
+            backups[s] = list(map(add, entry_rewards[s], map(gamma, new_values)))
+        return delta
+
+    def value_iteration(self, max_iterations=1000, theta=0.001):
+        """
+        Returns:
+            수렴까지 실행된 sweep 수
+        """
+        for i in range(max_iterations):
+            if self.sweep() < theta:
+                return i + 1
+        return max_iterations
+
+    def value_matrix(self):
+        """(K, S) 가치 행렬 - 목표 설정별 상태 인덱스 기반 array('d') 리스트"""
+        return [array("d", column) for column in zip(*self.values)]
+
+    def get_value_function(self, k, value_function=None):
+        """목표 설정 k의 가치 함수 (value_function이 주어지면 그곳에 기록)"""
+        if value_function is None:
+            value_function = TabularValueFunction(default_value=0.0)
+        for state, state_values in zip(self.model.states, self.values):
+            value_function.update(state, state_values[k])
+        return value_function
+
+    def extract_policies(self):
+        """
+        목표 설정별 greedy 정책 리스트
+
+        π_k(s) = argmax_a Q_k(s, a) (동점이면 앞의 액션), 설정 k에서 터미널인 상태는 제외
+        """
+        model = self.model
+        policies = [TabularPolicy(default_action=None) for _ in range(self.num_goals)]
+        for s, state in enumerate(model.states):
+            action_ids = model.state_actions[s]
+            if not action_ids:
+                continue
+            q_values = self.action_backups(s)
+            best_values = list(map(max, *q_values)) if len(q_values) > 1 else q_values[0]
+            mask = self.terminal_masks.get(s)
+            for k, policy in enumerate(policies):
+                if mask is not None and mask[k] == 0.0:
+                    continue
+                best = best_values[k]
+                for a, q in zip(action_ids, q_values):
+                    if q[k] == best:
+                        policy.update(state, model.actions[a])
+                        break
+        return policies
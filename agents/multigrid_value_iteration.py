@@ -0,0 +1,183 @@
+from array import array
+from collections import deque
+from envs.tabular_mdp import TabularMDP
+from .tabular_policy import TabularPolicy
+
+
+class MultigridValueIteration:
+    """
+    계층적(coarse-to-fine) Value Iteration
+
+    큰 맵에서는 목표의 보상이 맵 전체로 퍼지는 데 O(거리)번의 sweep이 필요합니다.
+    1. 인접한 block_size x block_size 셀들을 하나의 coarse 상태로 묶어 (state aggregation)
+       coarse MDP를 만들고, 상태 수가 min_states 이하가 될 때까지 재귀적으로 반복합니다.
+    2. 가장 coarse한 MDP를 먼저 풀고,
+    3. 그 해를 한 단계 fine한 MDP로 prolongation(블록 값 복사)하여 warm start로 사용한 뒤
+       Value Iteration으로 refine 합니다. (결정적 모델에서는 과대평가된 상태를 먼저 초기화)
+
+    각 레벨의 sweep은 컴파일된 배열 모델(TabularMDP) 위에서 in-place(Gauss-Seidel)로 수행하고
+    sweep 방향을 번갈아 바꿉니다. 제자리로 돌아오는 transition(self-loop)은
+    Q(s,a) = (R(s,a) + γ·Σ_(s'≠s) P(s'|s,a)·V(s')) / (1 - γ·P(s|s,a)) 로 정확히 풀어
+    coarse 레벨에서도 값이 한 sweep에 한 블록씩 전파되도록 합니다.
+
+    결과는 ValueIteration과 같이 전달받은 value function에 기록됩니다.
+    """
+
+    def __init__(self, mdp, values, block_size=2, min_states=64):
+        """
+        Args:
+            mdp: MDP 환경 (GridWorld 또는 TabularMDP, 상태는 정수 좌표 튜플)
+            values: 결과를 기록할 가치 함수
+            block_size: 한 레벨에서 묶을 블록의 한 변 크기
+            min_states: 상태 수가 이보다 작으면 더 이상 coarse하게 만들지 않음
+        """
+        self.mdp = mdp
+        self.values = values
+        self.block_size = block_size
+        self.min_states = min_states
+
+        # 레벨별 (상태 수, sweep 수) - coarsest 레벨부터
+        self.level_sweeps = []
+
+    def compile(self):
+        """MDP를 배열 모델로 컴파일"""
+        if isinstance(self.mdp, TabularMDP):
+            return self.mdp
+        if hasattr(self.mdp, "compile"):
+            return self.mdp.compile()
+        return TabularMDP.from_mdp(self.mdp)
+
+    def block_key(self, state):
+        """상태 좌표 → 블록 좌표"""
+        return tuple(x // self.block_size for x in state)
+
+    def value_iteration(self, max_iterations=1000, theta=0.001):
+        """
+        Returns:
+            가장 fine한 레벨(원래 MDP)에서 수렴까지 실행된 sweep 수
+        """
+        model = self.compile()
+        self.level_sweeps = []
+        values = self.solve(model, max_iterations, theta)
+        model.to_value_function(values, self.values)
+        return self.level_sweeps[-1][1]
+
+    def solve(self, model, max_iterations, theta):
+        """model을 coarse-to-fine으로 풀어 상태 인덱스 기반 가치 배열 반환"""
+        values = array("d", bytes(8 * model.num_states))
+
+        if model.num_states > self.min_states and self.block_size > 1:
+            coarse, partition = model.aggregate(self.block_key)
+            if coarse.num_states < model.num_states:
+                coarse_values = self.solve(coarse, max_iterations, theta)
+                # Prolongation: 블록의 값을 블록에 속한 상태들에 복사
+                for s in range(model.num_states):
+                    values[s] = coarse_values[partition[s]]
+                if model.deterministic:
+                    self.reset_overestimates(model, values)
+
+        sweeps = self.sweep_until_converged(model, values, max_iterations, theta)
+        self.level_sweeps.append((model.num_states, sweeps))
+        return values
+
+    def reset_overestimates(self, model, values):
+        """
+        결정적 모델에서 prolongation된 값 중 V(s) > (TV)(s) 인 상태(과대평가)를 하한 L로 초기화합니다.
+
+        결정적 환경에서는 과대평가된 이웃끼리 서로의 값을 지지하는 순환이 생겨
+        γ의 속도로만 줄어들기 때문에, IncrementalReplanner의 invalidation처럼
+        과대평가된 상태를 V*의 하한 L = min(0, min r) / (1 - γ)로 내려 아래에서부터 다시 전파되도록 합니다.
+        (step_cost나 음수 보상이 있으면 0은 하한이 아니므로 L을 사용)
+        모든 값이 L 이상이면 Q(s, a) ≥ min r + γ·L ≥ L 이므로 L로 내린 상태는 다시 과대평가되지 않고,
+        초기화된 상태의 값이 줄면 그 상태로 오는 이전 상태들만 다시 과대평가될 수 있으므로
+        worklist로 그 이전 상태들만 다시 확인합니다 (상태마다 최대 한 번 초기화 → O(S·A) 번의 확인).
+        할인율이 1이고 음수 보상이 있으면 유한한 하한이 없으므로 초기화하지 않습니다.
+        (확률적 모델에서는 transition이 섞이면서 빠르게 줄어들므로 그대로 사용)
+        """
+        lowest_reward = min(0.0, min(model.rewards, default=0.0))
+        if lowest_reward < 0.0 and model.discount >= 1.0:
+            return
+        lower_bound = lowest_reward / (1.0 - model.discount) if lowest_reward < 0.0 else 0.0
+
+        # 역방향 간선: s' → s' 로 올 수 있는 상태들
+        num_actions = model.num_actions
+        predecessors = [[] for _ in range(model.num_states)]
+        for s in range(model.num_states):
+            for a in model.state_actions[s]:
+                k = s * num_actions + a
+                for j in range(model.offsets[k], model.offsets[k + 1]):
+                    next_state = model.next_states[j]
+                    if next_state != s:
+                        predecessors[next_state].append(s)
+
+        def reset(s):
+            """s가 과대평가되었으면 초기화하고 True 반환"""
+            actions = model.state_actions[s]
+            if not actions:
+                if values[s] == 0.0:
+                    return False
+                values[s] = 0.0  # 터미널 상태
+                return True
+            if values[s] <= lower_bound or values[s] <= max(model.q_value(values, s, a) for a in actions):
+                return False
+            values[s] = lower_bound
+            return True
+
+        # 전체 상태를 한 번 확인한 뒤, 초기화된 상태의 이전 상태들만 다시 확인
+        changed = [s for s in range(model.num_states) if reset(s)]
+        worklist = deque(p for s in changed for p in predecessors[s])
+        while worklist:
+            s = worklist.popleft()
+            if reset(s):
+                worklist.extend(predecessors[s])
+
+    def sweep_until_converged(self, model, values, max_iterations, theta):
+        """in-place Gauss-Seidel sweep을 방향을 번갈아 가며 수렴할 때까지 반복"""
+        num_actions = model.num_actions
+        gamma = model.discount
+        state_actions = model.state_actions
+        expected_rewards = model.expected_rewards
+        offsets = model.offsets
+        next_states = model.next_states
+        probabilities = model.probabilities
+        forward = range(model.num_states)
+        backward = range(model.num_states - 1, -1, -1)
+
+        for i in range(1, max_iterations + 1):
+            delta = 0.0
+            for s in (forward if i % 2 else backward):
+                actions = state_actions[s]
+                if not actions:
+                    new_value = 0.0  # 터미널 상태
+                else:
+                    new_value = float("-inf")
+                    for a in actions:
+                        k = s * num_actions + a
+                        total = expected_rewards[k]
+                        self_probability = 0.0
+                        for j in range(offsets[k], offsets[k + 1]):
+                            next_state = next_states[j]
+                            if next_state == s:
+                                self_probability += probabilities[j]
+                            else:
+                                total += gamma * probabilities[j] * values[next_state]
+                        if gamma * self_probability < 1.0:
+                            q_value = total / (1.0 - gamma * self_probability)
+                        else:
+                            q_value = total + gamma * self_probability * values[s]
+                        if q_value > new_value:
+                            new_value = q_value
+
+                delta = max(delta, abs(new_value - values[s]))
+                values[s] = new_value
+
+            if delta < theta:
+                return i
+
+        return max_iterations
+
+    def extract_policy(self):
+        """현재 가치 함수로부터 greedy policy 추출 (배열 모델 위에서 계산)"""
+        model = self.compile()
+        values = model.values_from(self.values)
+        return model.to_policy(model.greedy_actions(values), TabularPolicy(default_action=None))
@@ -0,0 +1,199 @@
+from array import array
+from .monte_carlo import MonteCarlo
+
+
+class OffPolicyMonteCarlo(MonteCarlo):
+    """
+    Weighted Importance Sampling 기반 Off-policy Monte Carlo Control
+
+    behavior policy b(ε-greedy 또는 로그를 남긴 임의의 정책)로 만든 에피소드로
+    target policy π(Q에 대해 greedy)를 학습합니다. 에피소드를 역순으로 한 번만 훑습니다:
+
+        G ← γG + R_(t+1)
+        C(S_t, A_t) ← C(S_t, A_t) + W
+        Q(S_t, A_t) ← Q(S_t, A_t) + W / C(S_t, A_t) · (G - Q(S_t, A_t))
+        π(S_t) ← argmax_a Q(S_t, a)
+        A_t ≠ π(S_t) 이면 중단   (π(A_t|S_t) = 0 → 이후 ratio가 모두 0)
+        W ← W / b(A_t|S_t)
+
+    return 리스트 대신 누적 가중치 C(s, a)만 상태/액션 인덱스 k = s·A + a 기반 배열에 저장하므로
+    메모리는 에피소드 수와 무관하고, ratio가 0이 되는 시점에서 역방향 계산을 멈추므로
+    에피소드 뒤쪽의 greedy 구간만 계산합니다.
+
+    importance sampling에는 각 스텝의 b(A_t|S_t)가 필요하므로
+    - learn_episodes(ActorLearner): actor가 배포받은 Q의 ε-greedy로 행동하므로 현재 Q와 ε으로 b를 계산
+      (actor의 파라미터 스냅샷이 learner보다 늦을 수 있어 근사값)
+    - train_offline(TransitionLog): 로그에 b가 없으므로 지원하지 않음 → b를 함께 기록해 train_from_log 사용
+    """
+
+    def __init__(self, env, epsilon=0.1, discount=0.9, max_steps=1000, seed=None):
+        """
+        Args:
+            env: 환경 (GridWorld 등)
+            epsilon: behavior policy(ε-greedy)의 epsilon 값 또는 EpsilonSchedule
+            discount: 할인율 γ
+            max_steps: 에피소드 최대 스텝 수 또는 StepBudget
+            seed: 탐색(exploration)용 난수 seed (None이면 매번 다른 난수열)
+        """
+        # Weighted IS는 every-visit 방식으로 모든 스텝을 사용
+        super().__init__(env, epsilon=epsilon, discount=discount, first_visit=False,
+                         max_steps=max_steps, seed=seed)
+        self.returns = None
+
+        # 상태/액션 인덱스
+        self.states = list(env.get_states())
+        self.state_index = {state: i for i, state in enumerate(self.states)}
+        self.actions = []
+        self.action_index = {}
+        for state in self.states:
+            for action in env.get_actions(state):
+                if action not in self.action_index:
+                    self.action_index[action] = len(self.actions)
+                    self.actions.append(action)
+
+        # 누적 가중치 C(s, a)
+        self.cumulative_weights = array("d", bytes(8 * len(self.states) * len(self.actions)))
+
+        # 역방향 계산 통계
+        self.num_episode_steps = 0
+        self.num_backward_steps = 0
+
+    def behavior_probability(self, state, actions, action, epsilon):
+        """
+        ε-greedy behavior policy에서 action을 선택할 확률 b(action|state)
+
+        argmax 동점은 랜덤으로 선택하므로 동점 액션들이 1 - ε를 나눠 갖습니다.
+        """
+        row = self.qtable.q_table[state]
+        scores = [row[a] for a in actions]
+        best = max(scores)
+        greedy = [a for a, score in zip(actions, scores) if best - score <= self.action_selector.tolerance]
+        probability = epsilon / len(actions)
+        if action in greedy:
+            probability += (1.0 - epsilon) / len(greedy)
+        return probability
+
+    def behavior_probabilities(self, episode, epsilon):
+        """에피소드의 각 스텝에 대한 b(A_t|S_t) 리스트"""
+        return [
+            self.behavior_probability(state, self.env.get_actions(state), action, epsilon)
+            for state, action, reward in episode
+        ]
+
+    def update_off_policy(self, episode, behavior_probabilities, bootstrap=0.0):
+        """
+        Weighted importance sampling으로 Q(s, a)와 target policy 업데이트
+
+        Args:
+            episode: [(state, action, reward), ...] 리스트
+            behavior_probabilities: 각 스텝의 b(A_t|S_t)
+            bootstrap: 에피소드가 잘린 경우 마지막 상태의 가치 추정 (터미널이면 0)
+
+        Returns:
+            역방향으로 계산한 스텝 수 (ratio가 0이 되면 그 자리에서 중단)
+        """
+        qtable = self.qtable
+        weights = self.cumulative_weights
+        num_actions = len(self.actions)
+        state_index = self.state_index
+        action_index = self.action_index
+
+        G = bootstrap
+        W = 1.0
+        steps = 0
+        for (state, action, reward), b in zip(reversed(episode), reversed(behavior_probabilities)):
+            steps += 1
+            G = reward + self.discount * G
+
+            k = state_index[state] * num_actions + action_index[action]
+            weights[k] += W
+            q_value = qtable.get_q_value(state, action)
+            qtable.update(state, action, q_value + W / weights[k] * (G - q_value))
+
+            greedy_action = qtable.get_argmax_q(state, self.env.get_actions(state))
+            self.policy.update(state, greedy_action)
+            if action != greedy_action:
+                break
+            W /= b
+
+        self.num_episode_steps += len(episode)
+        self.num_backward_steps += steps
+        return steps
+
+    def train_from_log(self, episodes):
+        """
+        로그로 남은 behavior 데이터로 학습
+
+        Args:
+            episodes: [[(state, action, reward, b(action|state)), ...], ...]
+                      각 에피소드는 터미널 상태에서 끝났다고 가정합니다.
+
+        Returns:
+            policy: 학습된 greedy 정책
+        """
+        for logged_episode in episodes:
+            episode = [(state, action, reward) for state, action, reward, b in logged_episode]
+            behavior_probabilities = [b for state, action, reward, b in logged_episode]
+            self.update_off_policy(episode, behavior_probabilities)
+
+        self.improve_policy()
+        return self.policy
+
+    def learn_episodes(self, episodes):
+        """
+        다른 곳(actor 등)에서 생성한 에피소드 batch로 학습 (정책 개선은 하지 않음)
+
+        Args:
+            episodes: [[(state, action, reward, next_state, done), ...], ...]
+                      ε-greedy behavior로 만든 에피소드 - b(A_t|S_t)는 현재 Q와 ε으로 계산하며,
+                      잘린 에피소드는 마지막 다음 상태의 max_a Q로 bootstrap 합니다.
+        """
+        epsilon = self.action_selector.epsilon
+        for logged_episode in episodes:
+            if not logged_episode:
+                continue
+            episode = [(state, action, reward) for state, action, reward, _, _ in logged_episode]
+            _, _, _, last_state, done = logged_episode[-1]
+            bootstrap = 0.0 if done else self.qtable.get_max_q(last_state, self.env.get_actions(last_state))
+            self.update_off_policy(episode, self.behavior_probabilities(episode, epsilon), bootstrap)
+
+    def train_offline(self, log, num_epochs=1):
+        """TransitionLog에는 b(A_t|S_t)가 없으므로 지원하지 않음 (train_from_log 사용)"""
+        raise ValueError(
+            "OffPolicyMonteCarlo needs behavior probabilities b(a|s), which transition logs do not store; "
+            "use train_from_log with (state, action, reward, b) episodes"
+        )
+
+    def train(self, num_episodes=1000, verbose=False, metrics=None):
+        """
+        ε-greedy behavior policy로 에피소드를 생성하며 greedy target policy 학습
+
+        Args:
+            num_episodes: 학습할 에피소드 수
+            verbose: True면 진행상황 출력
+            metrics: LearningMetrics - 주어지면 behavior 에피소드의 return/길이를 여기에 집계
+
+        Returns:
+            policy: 학습된 정책
+        """
+        for episode_num in range(num_episodes):
+            # 에피소드를 만든 ε (generate_episode가 끝나면 스케줄이 진행됨)
+            epsilon = self.action_selector.epsilon
+            episode = self.generate_episode()
+            if metrics is not None:
+                metrics.record(sum(reward for _, _, reward in episode), len(episode))
+            # 에피소드 생성 중에는 Q가 변하지 않으므로 b(A_t|S_t)를 나중에 계산해도 동일
+            behavior_probabilities = self.behavior_probabilities(episode, epsilon)
+
+            bootstrap = 0.0
+            if self.truncated_state is not None:
+                bootstrap = self.qtable.get_max_q(
+                    self.truncated_state, self.env.get_actions(self.truncated_state)
+                )
+            self.update_off_policy(episode, behavior_probabilities, bootstrap)
+
+            if verbose and (episode_num + 1) % 100 == 0:
+                print(f"Episode {episode_num + 1}/{num_episodes} completed")
+
+        self.improve_policy()
+        return self.policy
@@ -1,10 +1,21 @@
 from collections import defaultdict
+from .action_selection import argmax
 
 
 class QTable:
-    def __init__(self, alpha=0.1, default_value=0.0):
+    def __init__(self, alpha=0.1, default_value=0.0, rng=None, tolerance=0.0):
+        """
+        Args:
+            alpha: 학습률 (1.0이면 update가 값을 덮어씀)
+            default_value: 아직 업데이트되지 않은 Q(s, a)의 값
+            rng: RandomStream - 주어지면 get_best_action의 동점을 랜덤으로 선택
+                 (None이면 첫 번째 최대 액션 - Policy Iteration처럼 결정적인 결과가 필요할 때)
+            tolerance: 최대 Q-값과의 차이가 이 값 이하인 액션을 동점으로 취급
+        """
         self.alpha = alpha
         self.default_value = default_value
+        self.rng = rng
+        self.tolerance = tolerance
         self.q_table = defaultdict(lambda: defaultdict(lambda: self.default_value))
 
     def get_q_value(self, state, action):
@@ -15,6 +26,15 @@ class QTable:
         old_value = self.q_table[state][action]
         self.q_table[state][action] = old_value + self.alpha * (value - old_value)
 
+    def update_batch(self, states, actions, values):
+        """여러 (s, a)의 Q-값을 한 번에 업데이트합니다."""
+        q_table = self.q_table
+        alpha = self.alpha
+        for state, action, value in zip(states, actions, values):
+            row = q_table[state]
+            old_value = row[action]
+            row[action] = old_value + alpha * (value - old_value)
+
     def get_max_q(self, state, actions):
         """주어진 상태에서 가능한 액션들 중 최대 Q-값을 반환합니다."""
         if not actions:
@@ -25,7 +45,22 @@ class QTable:
         """주어진 상태에서 가장 높은 Q-값을 가진 액션을 반환합니다."""
         if not actions:
             return None
-        return max(actions, key=lambda a: self.q_table[state][a])
+        row = self.q_table[state]
+        return argmax(actions, [row[action] for action in actions], self.rng, self.tolerance)
+
+    def get_best_actions(self, states, action_lists):
+        """여러 상태의 get_best_action을 한 번에 계산합니다."""
+        q_table = self.q_table
+        rng = self.rng
+        tolerance = self.tolerance
+        best_actions = []
+        for state, actions in zip(states, action_lists):
+            if not actions:
+                best_actions.append(None)
+                continue
+            row = q_table[state]
+            best_actions.append(argmax(actions, [row[action] for action in actions], rng, tolerance))
+        return best_actions
 
     def get_argmax_q(self, state, actions):
         """get_best_action의 별칭 - argmax_a Q(s,a)를 반환합니다."""
@@ -0,0 +1,76 @@
+import copy
+import itertools
+import random
+
+
+class RandomStream:
+    """
+    에이전트별 seed 가능한 난수 스트림
+
+    전역 random 모듈 대신 에이전트마다 독립된 random.Random을 가지므로
+    같은 seed면 (병렬 실행 중에도) 항상 같은 난수열을 얻습니다.
+
+    [0, 1) 균등 난수는 block_size개씩 미리 생성해 두고 버퍼에서 꺼내 씁니다.
+    random()은 버퍼 iterator의 __next__ 그 자체이므로 한 번 뽑을 때 Python 함수 호출이 없고,
+    uniforms(n)으로 여러 개를 한 번에 꺼낼 수도 있습니다 (batch 액션 선택용).
+
+    pickle / deepcopy 시에는 random.Random 상태와 현재 block에 남은 난수를 저장하고
+    스트림을 다시 만들므로, 복사본은 원본과 같은 난수열을 이어서 생성합니다.
+    """
+
+    BLOCK_SIZE = 4096
+
+    def __init__(self, seed=None, block_size=BLOCK_SIZE):
+        """
+        Args:
+            seed: 난수 seed (None이면 OS 엔트로피로 초기화)
+            block_size: 한 번에 미리 생성할 난수 개수
+        """
+        self.block_size = block_size
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """스트림을 seed로 다시 초기화 (버퍼에 남은 난수는 버림)"""
+        self.generator = random.Random(seed)
+        self._start([])
+
+    def _start(self, buffered):
+        """buffered의 난수를 먼저 꺼내고 이후 generator의 block을 이어 붙인 스트림 생성"""
+        self._block = iter(buffered)
+        self._stream = itertools.chain.from_iterable(self._blocks())
+        self.random = self._stream.__next__
+
+    def _blocks(self):
+        """block_size개씩 미리 생성한 균등 난수 block(의 iterator)을 무한히 생성"""
+        # 현재 block의 iterator를 self._block에 두어 남은 난수를 pickle 할 수 있게 함
+        yield self._block
+        # map + repeat로 block 전체를 C 레벨 루프에서 생성
+        draw = random.Random.random
+        while True:
+            self._block = iter(list(map(draw, itertools.repeat(self.generator, self.block_size))))
+            yield self._block
+
+    def __getstate__(self):
+        # 스트림(generator 객체)은 pickle 할 수 없으므로 현재 block에 남은 난수만 저장
+        return {
+            "block_size": self.block_size,
+            "generator": self.generator,
+            "buffered": list(copy.copy(self._block)),
+        }
+
+    def __setstate__(self, state):
+        self.block_size = state["block_size"]
+        self.generator = state["generator"]
+        self._start(state["buffered"])
+
+    def uniforms(self, n):
+        """[0, 1) 균등 난수 n개 리스트"""
+        return list(itertools.islice(self._stream, n))
+
+    def choice(self, seq):
+        """seq에서 균등하게 하나 선택"""
+        return seq[int(self.random() * len(seq))]
+
+    def randrange(self, n):
+        """[0, n) 정수 하나"""
+        return int(self.random() * n)
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from .tabular_policy import TabularPolicy
+from .tabular_value_function import TabularValueFunction
+from .policy_iteration import PolicyIteration
+from .value_iteration import ValueIteration
+
+
+class SolutionCache:
+    """
+    같은 맵 설정의 ValueIteration / PolicyIteration 풀이 결과를 재사용하는 캐시
+
+    키는 맵의 정규화된 설정(GridWorld.canonical_key: 크기, 장애물, 목표, 보상 맵, 할인율,
+    transition 모델)과 solver 설정(solver 이름, theta, max_iterations, 초기 액션 등)의 sha256 해시입니다.
+
+    - 메모리: 최근 사용한 max_entries개의 풀이를 LRU로 유지
+    - 디스크: cache_dir를 주면 풀이를 키 이름의 파일로 저장하고, 메모리에 없으면 파일에서 불러옴
+
+    풀이는 상태 인덱스 기반 배열(values: float64, policy: 액션 코드 uint8)로 저장하며,
+    solve()는 호출마다 새 TabularValueFunction / TabularPolicy를 만들어 돌려주므로
+    호출한 쪽에서 결과를 수정해도 캐시는 바뀌지 않습니다.
+
+    사용 예:
+        cache = SolutionCache(cache_dir="solutions")
+        values, policy = cache.solve(gridworld, solver="value_iteration", theta=1e-6)
+    """
+
+    SOLVERS = ("value_iteration", "policy_iteration")
+    MAGIC = b"RLSOLVED"
+    NO_ACTION = 255
+
+    def __init__(self, cache_dir=None, max_entries=256):
+        """
+        Args:
+            cache_dir: 디스크 캐시 디렉토리 (None이면 메모리에만 저장)
+            max_entries: 메모리에 유지할 최대 풀이 수
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        # 키 → (values, codes, actions, iterations)
+        self.entries = OrderedDict()
+
+        # 통계
+        self.num_hits = 0
+        self.num_disk_hits = 0
+        self.num_misses = 0
+        self.num_evictions = 0
+
+    def solver_config(self, env, solver, theta, max_iterations, initial_action=None, action_elimination=False):
+        """캐시 키에 들어가는 solver 설정"""
+        if solver not in self.SOLVERS:
+            raise ValueError(f"solver must be one of {self.SOLVERS}: {solver}")
+        config = {"solver": solver, "theta": theta, "max_iterations": max_iterations}
+        if solver == "policy_iteration":
+            # 초기 정책에 따라 동점 액션 중 선택되는 액션이 달라질 수 있음
+            config["initial_action"] = initial_action if initial_action is not None else env.ACTIONS[0]
+        else:
+            config["action_elimination"] = action_elimination
+        return config
+
+    def cache_key(self, env, solver="value_iteration", theta=0.001, max_iterations=1000,
+                  initial_action=None, action_elimination=False):
+        """맵 설정 + solver 설정의 해시"""
+        config = {
+            "map": env.canonical_key(),
+            "solver": self.solver_config(env, solver, theta, max_iterations, initial_action, action_elimination),
+        }
+        encoded = json.dumps(config, sort_keys=True, default=repr).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def solve(self, env, solver="value_iteration", theta=0.001, max_iterations=1000,
+              initial_action=None, action_elimination=False):
+        """
+        캐시된 풀이를 반환하고, 없으면 풀어서 캐시에 저장
+
+        Args:
+            env: GridWorld (canonical_key를 제공하는 MDP)
+            solver: "value_iteration" 또는 "policy_iteration"
+            theta: 수렴 기준
+            max_iterations: 최대 반복 수
+            initial_action: policy_iteration의 초기 정책 액션 (None이면 env.ACTIONS[0])
+            action_elimination: value_iteration의 action elimination 사용 여부
+
+        Returns:
+            (value_function, policy): 새로 만든 TabularValueFunction, TabularPolicy
+        """
+        key = self.cache_key(env, solver, theta, max_iterations, initial_action, action_elimination)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.num_hits += 1
+        else:
+            entry = self._load_cached(key)
+            if entry is not None:
+                self.num_disk_hits += 1
+            else:
+                entry = self._solve(env, solver, theta, max_iterations, initial_action, action_elimination)
+                self.num_misses += 1
+                self._save(key, entry)
+            self._insert(key, entry)
+        return self._materialize(env, entry)
+
+    def clear(self):
+        """메모리 캐시 비우기 (디스크 캐시는 유지)"""
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+    # --- 풀이 ---
+
+    def _solve(self, env, solver, theta, max_iterations, initial_action, action_elimination):
+        if solver == "value_iteration":
+            values = TabularValueFunction()
+            vi = ValueIteration(env, values, action_elimination=action_elimination)
+            iterations = vi.value_iteration(max_iterations=max_iterations, theta=theta)
+            policy = values.extract_policy(env, vi.action_sets if action_elimination else None)
+        else:
+            if initial_action is None:
+                initial_action = env.ACTIONS[0]
+            policy = TabularPolicy(default_action=initial_action)
+            pi = PolicyIteration(env, policy)
+            iterations = pi.policy_iteration(max_iterations=max_iterations, theta=theta)
+            values = pi.values
+
+        states = env.get_states()
+        actions = list(env.ACTIONS)
+        action_index = {action: i for i, action in enumerate(actions)}
+        value_array = array("d", [values.get_value(state) for state in states])
+        codes = array("B", [self.NO_ACTION]) * len(states)
+        for i, state in enumerate(states):
+            state_actions = env.get_actions(state)
+            if state_actions:
+                codes[i] = action_index[policy.select_action(state, state_actions)]
+        return value_array, codes, actions, iterations
+
+    def _materialize(self, env, entry):
+        values, codes, actions, _ = entry
+        value_function = TabularValueFunction()
+        policy = TabularPolicy(default_action=None)
+        for state, value, code in zip(env.get_states(), values, codes):
+            value_function.update(state, value)
+            if code != self.NO_ACTION:
+                policy.update(state, actions[code])
+        return value_function, policy
+
+    def _insert(self, key, entry):
+        entries = self.entries
+        entries[key] = entry
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.num_evictions += 1
+
+    # --- 디스크 캐시 ---
+
+    def _cache_path(self, key):
+        return os.path.join(self.cache_dir, key + ".solution")
+
+    def _save(self, key, entry):
+        """
+        파일 형식: MAGIC | 헤더 길이(uint32) | 헤더(JSON: 상태 수, actions, iterations, byteorder)
+                   | values(float64 x S) | policy 액션 코드(uint8 x S)
+        """
+        if self.cache_dir is None:
+            return
+        values, codes, actions, iterations = entry
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._cache_path(key)
+        header = json.dumps({
+            "num_states": len(values),
+            "actions": actions,
+            "iterations": iterations,
+            "byteorder": sys.byteorder,
+        }).encode("utf-8")
+        # 쓰는 도중 중단되어도 깨진 파일이 남지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            values.tofile(f)
+            codes.tofile(f)
+        os.replace(temp_path, path)
+
+    def _load_cached(self, key):
+        if self.cache_dir is None:
+            return None
+        path = self._cache_path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            if f.read(len(self.MAGIC)) != self.MAGIC:
+                return None
+            (header_length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_length).decode("utf-8"))
+            num_states = header["num_states"]
+            values = array("d")
+            codes = array("B")
+            values.fromfile(f, num_states)
+            codes.fromfile(f, num_states)
+        if header["byteorder"] != sys.byteorder:
+            values.byteswap()
+        return values, codes, header["actions"], header["iterations"]
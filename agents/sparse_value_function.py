@@ -0,0 +1,146 @@
+from array import array
+from collections import OrderedDict
+from .value_function import ValueFunction
+
+
+class SparseValueFunction(ValueFunction):
+    """
+    기본값과 다른 값만 저장하는 희소(sparse) 가치 함수
+
+    - get_value는 없는 상태를 읽어도 아무것도 만들지 않습니다.
+    - 기본값을 update하면 항목을 지웁니다 (테이블에는 항상 기본값이 아닌 상태만 남음).
+    - max_size를 주면 LRU 방식으로 크기를 제한합니다: 가득 찬 상태에서 새 상태를 쓰면
+      가장 오래 사용되지 않은 상태를 지워 기본값으로 되돌립니다.
+    """
+
+    def __init__(self, default_value=0.0, max_size=None):
+        """
+        Args:
+            default_value: 저장되지 않은 상태의 값
+            max_size: 저장할 최대 상태 수 (None이면 제한 없음)
+        """
+        self.default_value = default_value
+        self.max_size = max_size
+        self.value_table = OrderedDict() if max_size is not None else {}
+        self.num_evictions = 0
+
+    def update(self, state, value):
+        value_table = self.value_table
+        if value == self.default_value:
+            value_table.pop(state, None)
+            return
+        if self.max_size is not None:
+            if state in value_table:
+                value_table.move_to_end(state)
+            elif len(value_table) >= self.max_size:
+                value_table.popitem(last=False)
+                self.num_evictions += 1
+        value_table[state] = value
+
+    def add(self, state, value):
+        self.update(state, value)
+
+    def merge(self, value_table):
+        for state, value in value_table.items():
+            self.update(state, value)
+
+    def get_value(self, state):
+        value = self.value_table.get(state)
+        if value is None:
+            return self.default_value
+        if self.max_size is not None:
+            self.value_table.move_to_end(state)
+        return value
+
+    def items(self):
+        return self.value_table.items()
+
+    def __len__(self):
+        return len(self.value_table)
+
+
+class IntKeyValueFunction(ValueFunction):
+    """
+    정수 상태 키(TabularMDP의 상태 인덱스, row·width + col 등)를 위한 open addressing 해시 테이블
+
+    키는 array('q'), 값은 array('d')에 저장하므로 상태 하나당 16바이트(+빈 칸)만 사용하며
+    dict처럼 상태마다 Python 객체를 만들지 않습니다. 충돌은 linear probing으로 처리하고,
+    load factor가 MAX_LOAD를 넘으면 두 배로 키웁니다. get_value는 테이블을 키우지 않습니다.
+    (음수 키는 EMPTY와 겹치므로 0 이상의 정수만 사용)
+    """
+
+    EMPTY = -1
+    MAX_LOAD = 0.5
+
+    def __init__(self, default_value=0.0, capacity=16):
+        """
+        Args:
+            default_value: 저장되지 않은 상태의 값
+            capacity: 초기 슬롯 수 (2의 거듭제곱으로 올림)
+        """
+        self.default_value = default_value
+        size = 1
+        while size < capacity:
+            size *= 2
+        self._allocate(size)
+
+    def _allocate(self, size):
+        self.mask = size - 1
+        self.keys = array("q", [self.EMPTY]) * size
+        self.values = array("d", bytes(8 * size))
+        self.size = 0
+
+    def _slot(self, key):
+        """key가 있는 슬롯 또는 key를 넣을 빈 슬롯"""
+        keys = self.keys
+        mask = self.mask
+        i = hash(key) & mask
+        while True:
+            slot_key = keys[i]
+            if slot_key == key or slot_key == self.EMPTY:
+                return i
+            i = (i + 1) & mask
+
+    def _grow(self):
+        old_keys = self.keys
+        old_values = self.values
+        self._allocate(2 * len(old_keys))
+        for key, value in zip(old_keys, old_values):
+            if key != self.EMPTY:
+                i = self._slot(key)
+                self.keys[i] = key
+                self.values[i] = value
+                self.size += 1
+
+    def update(self, state, value):
+        if state < 0:
+            raise ValueError(f"IntKeyValueFunction keys must be non-negative: {state}")
+        i = self._slot(state)
+        if self.keys[i] == self.EMPTY:
+            if (self.size + 1) > self.MAX_LOAD * len(self.keys):
+                self._grow()
+                i = self._slot(state)
+            self.keys[i] = state
+            self.size += 1
+        self.values[i] = value
+
+    def add(self, state, value):
+        self.update(state, value)
+
+    def merge(self, value_table):
+        for state, value in value_table.items():
+            self.update(state, value)
+
+    def get_value(self, state):
+        i = self._slot(state)
+        if self.keys[i] == self.EMPTY:
+            return self.default_value
+        return self.values[i]
+
+    def items(self):
+        return [
+            (key, value) for key, value in zip(self.keys, self.values) if key != self.EMPTY
+        ]
+
+    def __len__(self):
+        return self.size
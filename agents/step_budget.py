@@ -0,0 +1,68 @@
+from collections import deque
+
+
+class StepBudget:
+    """
+    에피소드 최대 스텝 수(step cap)와 에피소드 통계
+
+    - 고정 cap: 매 에피소드 max_steps 스텝까지 실행
+    - 적응형 cap (adaptive=True): min_steps에서 시작해
+        * 목표에 도달한 최근 window개 에피소드 중 가장 긴 길이의 factor배로 cap을 맞추고
+        * 최근에 목표에 도달한 에피소드가 없는데 잘리면(truncated) cap을 factor배로 늘립니다.
+      cap은 항상 [min_steps, max_steps] 범위입니다.
+
+    잘린 에피소드의 마지막 상태는 터미널이 아니므로, 에이전트는 그 상태의 V/Q로 bootstrap 해야 합니다.
+    """
+
+    def __init__(self, max_steps=1000, adaptive=False, min_steps=100, factor=2.0, window=20):
+        """
+        Args:
+            max_steps: 에피소드 최대 스텝 수 (적응형이면 cap의 상한)
+            adaptive: True면 적응형 cap 사용
+            min_steps: 적응형 cap의 초기값이자 하한
+            factor: 적응형 cap 배수
+            window: cap 계산에 사용할 최근 완료 에피소드 수
+        """
+        self.max_steps = max_steps
+        self.adaptive = adaptive
+        self.min_steps = min(min_steps, max_steps)
+        self.factor = factor
+        self.cap = self.min_steps if adaptive else max_steps
+        self.recent_lengths = deque(maxlen=window)
+
+        # 에피소드 통계
+        self.num_episodes = 0
+        self.num_truncated = 0
+        self.total_steps = 0
+
+    def record(self, steps, truncated):
+        """에피소드 하나가 끝날 때 호출 - 통계를 갱신하고 적응형 cap을 조정"""
+        self.num_episodes += 1
+        self.total_steps += steps
+        if truncated:
+            self.num_truncated += 1
+
+        if not self.adaptive:
+            return
+        if not truncated:
+            self.recent_lengths.append(steps)
+            self.cap = int(self.factor * max(self.recent_lengths))
+        elif not self.recent_lengths:
+            self.cap = int(self.factor * self.cap)
+        self.cap = max(self.min_steps, min(self.max_steps, self.cap))
+
+    def stats(self):
+        """에피소드 통계 딕셔너리"""
+        return {
+            "episodes": self.num_episodes,
+            "truncated": self.num_truncated,
+            "truncation_rate": self.num_truncated / self.num_episodes if self.num_episodes else 0.0,
+            "mean_steps": self.total_steps / self.num_episodes if self.num_episodes else 0.0,
+            "total_steps": self.total_steps,
+            "cap": self.cap,
+        }
+
+    def __repr__(self):
+        # 설정만 포함 (sweep 설정 해시에 사용되므로 실행마다 같아야 함)
+        return (f"StepBudget(max_steps={self.max_steps}, adaptive={self.adaptive}, "
+                f"min_steps={self.min_steps}, factor={self.factor}, window={self.recent_lengths.maxlen})")
@@ -0,0 +1,168 @@
+import math
+from array import array
+from .policy import StochasticPolicy
+from .random_stream import RandomStream
+
+
+class TabularStochasticPolicy(StochasticPolicy):
+    """
+    상태별 액션 확률 배열로 표현한 확률적 정책 π(a|s)
+
+    샘플링은 Walker/Vose의 alias method를 사용합니다.
+    상태마다 (prob, alias) 테이블을 만들어 두면 난수 하나로 O(1)에 액션을 뽑을 수 있습니다:
+        u = U[0,1)·n,  i = ⌊u⌋  →  (u - i) < prob[i] 이면 액션 i, 아니면 alias[i]
+    확률이 바뀐 상태의 테이블은 다음 샘플링 때 다시 만듭니다 (lazy rebuild).
+
+    update(states, actions, rewards)는 gradient bandit 방식으로 선호도(log π)를 갱신합니다:
+        h(s, ·) ← h(s, ·) + lr·(R - R̄(s))·(1[· = A] - π(·|s)),  π(·|s) = softmax(h(s, ·))
+    """
+
+    def __init__(self, learning_rate=0.1, rng=None, seed=None):
+        """
+        Args:
+            learning_rate: update의 학습률
+            rng: RandomStream (None이면 seed로 새로 생성)
+            seed: rng가 없을 때 사용할 seed
+        """
+        self.learning_rate = learning_rate
+        self.rng = rng if rng is not None else RandomStream(seed)
+
+        # state → 액션 리스트 / 확률 배열
+        self.actions = {}
+        self.probabilities = {}
+        # state → 액션 인덱스 dict
+        self.action_index = {}
+        # state → (prob, alias) alias 테이블
+        self.alias_tables = {}
+        # update의 baseline: state → (보상 평균, 횟수)
+        self.baselines = {}
+
+    # --- 확률 설정 ---
+
+    def set_probabilities(self, state, actions, probabilities):
+        """state의 액션 확률을 설정 (합이 1이 되도록 정규화)"""
+        total = sum(probabilities)
+        if total <= 0.0:
+            raise ValueError(f"probabilities must have a positive sum: {probabilities}")
+        self.actions[state] = list(actions)
+        self.action_index[state] = {action: i for i, action in enumerate(actions)}
+        self.probabilities[state] = array("d", [p / total for p in probabilities])
+        self.alias_tables.pop(state, None)
+
+    def set_softmax(self, state, actions, scores, temperature=1.0):
+        """π(a|s) ∝ exp(score(a) / τ)"""
+        best = max(scores)
+        self.set_probabilities(
+            state, actions, [math.exp((score - best) / temperature) for score in scores]
+        )
+
+    def set_epsilon_soft(self, state, actions, greedy_action, epsilon):
+        """greedy_action에 1 - ε + ε/|A|, 나머지 액션에 ε/|A|"""
+        share = epsilon / len(actions)
+        self.set_probabilities(
+            state, actions,
+            [share + (1.0 - epsilon if action == greedy_action else 0.0) for action in actions]
+        )
+
+    # --- alias 테이블 ---
+
+    def _build_alias_table(self, probabilities):
+        """Vose의 alias method로 (prob, alias) 테이블 생성"""
+        n = len(probabilities)
+        prob = array("d", bytes(8 * n))
+        alias = array("l", range(n))
+        scaled = [p * n for p in probabilities]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            i = small.pop()
+            j = large.pop()
+            prob[i] = scaled[i]
+            alias[i] = j
+            scaled[j] = scaled[j] + scaled[i] - 1.0
+            if scaled[j] < 1.0:
+                small.append(j)
+            else:
+                large.append(j)
+
+        # 부동소수점 오차로 남은 칸은 확률 1
+        for i in large + small:
+            prob[i] = 1.0
+        return prob, alias
+
+    def _alias_table(self, state):
+        table = self.alias_tables.get(state)
+        if table is None:
+            table = self._build_alias_table(self.probabilities[state])
+            self.alias_tables[state] = table
+        return table
+
+    def _sample(self, state, u):
+        """균등 난수 u ∈ [0, 1)로 state의 액션 하나를 샘플링"""
+        prob, alias = self._alias_table(state)
+        u *= len(prob)
+        i = int(u)
+        return self.actions[state][i if u - i < prob[i] else alias[i]]
+
+    # --- 정책 인터페이스 ---
+
+    def select_action(self, state, actions=None):
+        """
+        π(·|state)에서 액션을 샘플링
+
+        확률이 설정되지 않은 상태는 actions 중 균등하게 선택 (actions도 없으면 None)
+        """
+        if state not in self.probabilities:
+            return self.rng.choice(actions) if actions else None
+        return self._sample(state, self.rng.random())
+
+    def sample_actions(self, states, action_lists=None):
+        """상태 batch에 대한 액션 샘플 리스트"""
+        if action_lists is None:
+            action_lists = [None] * len(states)
+        samples = []
+        for state, actions, u in zip(states, action_lists, self.rng.uniforms(len(states))):
+            if state in self.probabilities:
+                samples.append(self._sample(state, u))
+            elif actions:
+                samples.append(actions[int(u * len(actions))])
+            else:
+                samples.append(None)
+        return samples
+
+    def get_probability(self, state, action):
+        """π(action|state) (설정되지 않은 상태/액션은 0)"""
+        i = self.action_index.get(state, {}).get(action)
+        if i is None:
+            return 0.0
+        return self.probabilities[state][i]
+
+    def get_probabilities(self, states, actions):
+        """(state, action) batch의 π(action|state) 리스트"""
+        return [self.get_probability(state, action) for state, action in zip(states, actions)]
+
+    def update(self, states, actions, rewards):
+        """
+        (state, action, reward) batch로 gradient bandit 업데이트
+
+        R̄(s)는 해당 상태에서 받은 보상의 평균으로, 갱신 전의 값을 baseline으로 사용합니다.
+        """
+        for state, action, reward in zip(states, actions, rewards):
+            probabilities = self.probabilities[state]
+            chosen = self.action_index[state][action]
+
+            mean_reward, count = self.baselines.get(state, (0.0, 0))
+            step = self.learning_rate * (reward - mean_reward)
+            self.baselines[state] = (mean_reward + (reward - mean_reward) / (count + 1), count + 1)
+
+            preferences = [
+                (math.log(p) if p > 0.0 else float("-inf"))
+                + step * ((1.0 if i == chosen else 0.0) - p)
+                for i, p in enumerate(probabilities)
+            ]
+            best = max(preferences)
+            weights = [math.exp(h - best) for h in preferences]
+            total = sum(weights)
+            self.probabilities[state] = array("d", [w / total for w in weights])
+            self.alias_tables.pop(state, None)
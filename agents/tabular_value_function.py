@@ -4,6 +4,7 @@ from .value_function import ValueFunction
 
 class TabularValueFunction(ValueFunction):
     def __init__(self, default_value=0.0):
+        self.default_value = default_value
         self.value_table = defaultdict(lambda: default_value)
 
     def update(self, state, value):
@@ -13,8 +14,12 @@ class TabularValueFunction(ValueFunction):
         self.value_table[state] = value
 
     def merge(self, value_table):
-        for state, value in value_table.value_table.items():
+        for state, value in value_table.items():
             self.value_table[state] = value
 
     def get_value(self, state):
-        return self.value_table[state]
+        # 방문하지 않은 상태를 읽어도 테이블에 추가하지 않음
+        return self.value_table.get(state, self.default_value)
+
+    def items(self):
+        return self.value_table.items()
@@ -0,0 +1,260 @@
+from envs.vector_env import VectorEnv
+from .qtable import QTable
+from .tabular_policy import TabularPolicy
+from .random_stream import RandomStream
+from .action_selection import EpsilonGreedy
+from .learning_metrics import LearningMetrics
+
+
+class TDControl:
+    """
+    QTable 기반 model-free TD control의 공통 구현 (batched)
+
+    num_envs개의 환경을 동시에 실행하며 매 스텝마다 batch로
+    1. ε-greedy로 액션 선택 (Q만 사용 - env.get_transitions 로 lookahead 하지 않음)
+    2. 모든 환경을 한 번에 step
+    3. TD target을 계산해 QTable을 batch로 업데이트
+       Q(S,A) ← Q(S,A) + α·(target - Q(S,A))
+
+    target은 서브클래스에서 bootstrap_values로 정의합니다 (Q-learning, SARSA, Expected SARSA).
+    TDControl 자체나 bootstrap_values를 구현하지 않은 서브클래스는 생성할 수 없습니다.
+    """
+
+    def __init__(self, env, alpha=0.1, epsilon=0.1, gamma=0.9, num_envs=8, max_steps=1000,
+                 seed=None):
+        """
+        Args:
+            env: 환경 (GridWorld 등) 또는 VectorEnv
+            alpha: 학습률 α
+            epsilon: ε-greedy의 epsilon 값 또는 EpsilonSchedule (에피소드마다 진행)
+            gamma: 할인율 γ
+            num_envs: 동시에 실행할 환경 수 (env가 VectorEnv면 무시)
+            max_steps: 에피소드 최대 스텝 수 (env가 VectorEnv면 무시)
+            seed: 탐색(exploration)용 난수 seed (None이면 매번 다른 난수열)
+        """
+        if type(self).bootstrap_values is TDControl.bootstrap_values:
+            raise TypeError(
+                f"{type(self).__name__} must implement bootstrap_values "
+                "(use QLearning, SARSA or ExpectedSARSA)"
+            )
+        if isinstance(env, VectorEnv):
+            self.vector_env = env
+            self.env = env.env
+        else:
+            self.vector_env = VectorEnv(env, num_envs=num_envs, max_steps=max_steps)
+            self.env = env
+        self.alpha = alpha
+        self.epsilon = epsilon
+        self.gamma = gamma
+
+        # 에이전트 전용 난수 스트림 (전역 random 모듈과 독립)
+        self.rng = RandomStream(seed)
+        self.action_selector = EpsilonGreedy(epsilon, self.rng)
+
+        # Q-table: Q(s, a) (argmax 동점은 랜덤으로 선택)
+        self.qtable = QTable(alpha=alpha, default_value=0.0, rng=self.rng)
+
+        # Policy: greedy policy based on Q
+        self.policy = TabularPolicy(default_action=None)
+
+        # 다음 run_steps 호출에서 사용할, 현재 상태들에 대해 선택된 액션
+        self.pending_actions = None
+
+    def epsilon_greedy_action(self, state, actions):
+        """
+        ε-greedy 정책으로 액션 선택
+
+        Args:
+            state: 현재 상태
+            actions: 가능한 액션 리스트
+
+        Returns:
+            선택된 액션
+        """
+        return self.action_selector.q_action(self.qtable, state, actions)
+
+    def select_actions(self, states):
+        """상태 batch에 대해 ε-greedy 액션 batch 선택"""
+        return self.action_selector.q_actions(
+            self.qtable, states, [self.env.get_actions(state) for state in states]
+        )
+
+    def expected_q(self, state):
+        """ε-greedy 정책 하에서의 기대값 Σ_a π(a|s)·Q(s,a)"""
+        actions = self.env.get_actions(state)
+        if not actions:
+            return 0.0
+        epsilon = self.action_selector.epsilon
+        greedy_q = self.qtable.get_max_q(state, actions)
+        mean_q = sum(self.qtable.get_q_value(state, action) for action in actions) / len(actions)
+        return (1.0 - epsilon) * greedy_q + epsilon * mean_q
+
+    def bootstrap_values(self, next_states, next_actions):
+        """다음 상태의 bootstrap 값 batch (서브클래스에서 구현)"""
+        pass
+
+    def needs_next_actions(self):
+        """target 계산에 다음 액션 A'가 필요한지 (on-policy SARSA)"""
+        return False
+
+    def run_steps(self, num_steps):
+        """
+        모든 환경을 num_steps 스텝 실행하며 batch 업데이트
+
+        Returns:
+            이번 호출 동안 끝난 에피소드의 (총 보상, 스텝 수) 리스트
+        """
+        states = list(self.vector_env.states)
+        if any(state is None for state in states):
+            states = self.vector_env.reset()
+            self.pending_actions = None
+        # 이전 호출에서 이미 선택해 둔 액션 (SARSA의 A')이 있으면 이어서 사용
+        actions = self.pending_actions or self.select_actions(states)
+
+        for _ in range(num_steps):
+            next_states, rewards, dones = self.vector_env.step(actions)
+
+            # 다음 상태에서의 액션 (SARSA 계열은 target에 사용)
+            next_actions = self.select_actions(next_states) if self.needs_next_actions() else None
+
+            # TD target 계산: R + γ·(bootstrap), 터미널이면 R
+            bootstraps = self.bootstrap_values(next_states, next_actions)
+            targets = [
+                reward if done else reward + self.gamma * bootstrap
+                for reward, done, bootstrap in zip(rewards, dones, bootstraps)
+            ]
+            self.qtable.update_batch(states, actions, targets)
+
+            # reset된 환경은 새 상태에서 액션을 다시 선택
+            reset_states = self.vector_env.states
+            if next_actions is None:
+                actions = self.select_actions(reset_states)
+            else:
+                actions = [
+                    self.epsilon_greedy_action(reset_state, self.env.get_actions(reset_state))
+                    if done or truncated else next_action
+                    for next_action, reset_state, done, truncated
+                    in zip(next_actions, reset_states, dones, self.vector_env.truncated)
+                ]
+            states = list(reset_states)
+
+        self.pending_actions = actions
+        completed = self.vector_env.pop_completed()
+        # 끝난 에피소드 수만큼 ε 스케줄 진행
+        self.action_selector.advance(len(completed))
+        return completed
+
+    def extract_policy(self):
+        """
+        현재 Q로부터 greedy policy 추출
+
+        π(s) = argmax_a Q(s, a)
+        """
+        policy = TabularPolicy(default_action=None)
+        states = self.env.get_states()
+        action_lists = [self.env.get_actions(state) for state in states]
+        for state, action in zip(states, self.qtable.get_best_actions(states, action_lists)):
+            if action is not None:
+                policy.update(state, action)
+        return policy
+
+    def train(self, num_episodes=1000, verbose=False, metrics=None):
+        """
+        학습 메인 루프 - 모든 환경을 합쳐 num_episodes개의 에피소드가 끝날 때까지 실행
+
+        Args:
+            num_episodes: 학습할 에피소드 수
+            verbose: True면 진행상황 출력
+            metrics: LearningMetrics - 주어지면 에피소드별 return/길이를 여기에 집계
+
+        Returns:
+            policy: 학습된 정책
+            episode_rewards: 에피소드별 보상 리스트 (끝난 순서, metrics가 주어지면 metrics)
+        """
+        # metrics가 주어지면 보상 리스트를 만들지 않고 스트리밍 지표에만 집계
+        episode_rewards = [] if metrics is None else None
+        tracker = metrics if metrics is not None else (LearningMetrics() if verbose else None)
+        num_finished = 0
+        next_report = 100
+
+        while num_finished < num_episodes:
+            # 마지막 스텝에 여러 환경이 함께 끝나면 num_episodes개까지만 기록
+            for total_reward, steps in self.run_steps(1)[:num_episodes - num_finished]:
+                num_finished += 1
+                if episode_rewards is not None:
+                    episode_rewards.append(total_reward)
+                if tracker is not None:
+                    tracker.record(total_reward, steps)
+
+            if verbose and num_finished >= next_report:
+                print(f"Episode {num_finished}/{num_episodes} - "
+                      f"Avg Reward (last {tracker.window}): {tracker.mean_return():.3f}")
+                next_report += 100
+
+        # 최종 정책 추출
+        policy = self.extract_policy()
+        self.policy = policy
+
+        return policy, episode_rewards if metrics is None else metrics
+
+    def get_q_values(self):
+        """학습된 Q-table 반환"""
+        return self.qtable
+
+    def get_value_function(self):
+        """
+        학습된 Q로부터 V(s) = max_a Q(s,a) 계산하여 반환
+        """
+        from .tabular_value_function import TabularValueFunction
+        value_function = TabularValueFunction(default_value=0.0)
+
+        for state in self.env.get_states():
+            actions = self.env.get_actions(state)
+            if actions:
+                value_function.update(state, self.qtable.get_max_q(state, actions))
+            else:
+                value_function.update(state, 0.0)
+
+        return value_function
+
+
+class QLearning(TDControl):
+    """
+    Q-learning (off-policy TD control)
+
+    target = R + γ·max_a' Q(S', a')
+    """
+
+    def bootstrap_values(self, next_states, next_actions):
+        return [
+            self.qtable.get_max_q(next_state, self.env.get_actions(next_state))
+            for next_state in next_states
+        ]
+
+
+class SARSA(TDControl):
+    """
+    SARSA (on-policy TD control)
+
+    target = R + γ·Q(S', A'),  A' ~ ε-greedy(S')
+    """
+
+    def needs_next_actions(self):
+        return True
+
+    def bootstrap_values(self, next_states, next_actions):
+        return [
+            self.qtable.get_q_value(next_state, next_action) if next_action is not None else 0.0
+            for next_state, next_action in zip(next_states, next_actions)
+        ]
+
+
+class ExpectedSARSA(TDControl):
+    """
+    Expected SARSA
+
+    target = R + γ·Σ_a' π(a'|S')·Q(S', a'),  π = ε-greedy
+    """
+
+    def bootstrap_values(self, next_states, next_actions):
+        return [self.expected_q(next_state) for next_state in next_states]
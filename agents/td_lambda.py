@@ -1,12 +1,16 @@
-import random
-from collections import defaultdict
-from .tabular_value_function import TabularValueFunction
+from array import array
+from envs.transition_log import TransitionLogWriter
+from .array_value_function import ArrayValueFunction
 from .tabular_policy import TabularPolicy
+from .random_stream import RandomStream
+from .action_selection import EpsilonGreedy
+from .step_budget import StepBudget
+from .learning_metrics import LearningMetrics
 
 
 class TDLambda:
     """
-    TD(λ) 알고리즘 구현 (Tabular with Replacing Traces)
+    TD(λ) 알고리즘 구현 (Tabular with Eligibility Traces)
     
     Algorithm: TD(λ) with Replacing Traces
     각 transition (X, R, Y)마다:
@@ -15,30 +19,66 @@ class TDLambda:
        - z[x] ← γ·λ·z[x]  (decay)
        - if X = x: z[x] ← 1  (replacing trace)
        - V[x] ← V[x] + α·δ·z[x]  (value update)
+
+    trace_type으로 X의 trace 갱신 방식을 선택할 수 있습니다:
+       - "replacing":    z[X] ← 1
+       - "accumulating": z[X] ← z[X] + 1
+       - "dutch":        z[X] ← (1 - α)·z[X] + 1
+    true_online=True면 True Online TD(λ) (Dutch trace 사용):
+       - V[x] ← V[x] + α·(δ + V(X) - V_old)·z[x]  (모든 x)
+       - V[X] ← V[X] - α·(V(X) - V_old)
+       - V_old ← V(Y)
+
+    V와 z는 상태 인덱스 기반 배열로 저장하며, 매 스텝 trace가 0이 아닌
+    상태들(active set)만 갱신합니다.
     """
 
-    def __init__(self, env, alpha=0.1, epsilon=0.1, gamma=0.9, lambda_=0.8):
+    TRACE_TYPES = ("replacing", "accumulating", "dutch")
+
+    def __init__(self, env, alpha=0.1, epsilon=0.1, gamma=0.9, lambda_=0.8,
+                 trace_type="replacing", true_online=False, max_steps=1000, seed=None):
         """
         Args:
             env: 환경 (GridWorld 등)
             alpha: 학습률 (learning rate)
-            epsilon: ε-greedy의 epsilon 값
+            epsilon: ε-greedy의 epsilon 값 또는 EpsilonSchedule (에피소드마다 진행)
             gamma: 할인율 (discount factor) γ
             lambda_: trace decay parameter λ (0 ≤ λ ≤ 1)
                     λ=0: TD(0) - one-step TD
                     λ=1: Monte Carlo와 유사
+            trace_type: "replacing", "accumulating", "dutch" 중 하나
+            true_online: True면 True Online TD(λ) (trace_type은 "dutch"로 고정)
+            max_steps: 에피소드 최대 스텝 수 또는 StepBudget (적응형 cap)
+            seed: 탐색(exploration)용 난수 seed (None이면 매번 다른 난수열)
         """
+        if trace_type not in self.TRACE_TYPES:
+            raise ValueError(f"trace_type must be one of {self.TRACE_TYPES}: {trace_type}")
+
         self.env = env
         self.alpha = alpha
         self.epsilon = epsilon
         self.gamma = gamma
         self.lambda_ = lambda_
+        self.true_online = true_online
+        self.trace_type = "dutch" if true_online else trace_type
+
+        # 에이전트 전용 난수 스트림 (전역 random 모듈과 독립)
+        self.rng = RandomStream(seed)
+        self.action_selector = EpsilonGreedy(epsilon, self.rng)
+
+        # 에피소드 step cap과 에피소드 통계
+        self.step_budget = max_steps if isinstance(max_steps, StepBudget) else StepBudget(max_steps)
         
-        # Value function: V(s)
-        self.value_function = TabularValueFunction(default_value=0.0)
+        # Value function: V(s) - 상태 인덱스 기반 배열
+        self.value_function = ArrayValueFunction(env.get_states(), default_value=0.0)
         
-        # Eligibility traces: z(s)
-        self.traces = defaultdict(float)
+        # Eligibility traces: z(s) - V와 같은 인덱스를 사용하는 배열
+        self.traces = array("d", bytes(8 * len(self.value_function.states)))
+        # trace가 0이 아닌 상태 인덱스들
+        self.active_traces = set()
+
+        # True Online TD(λ)의 V_old (직전 스텝에서 계산한 V(Y))
+        self.v_old = 0.0
         
         # Policy: greedy policy based on value function
         self.policy = TabularPolicy(default_action=None)
@@ -54,31 +94,10 @@ class TDLambda:
         Returns:
             선택된 액션
         """
-        if not actions:
-            return None
-        
-        # ε 확률로 랜덤 액션 선택 (exploration)
-        if random.random() < self.epsilon:
-            return random.choice(actions)
-        
-        # 1-ε 확률로 greedy 액션 선택 (exploitation)
-        # Value function 기반으로 최선의 액션 선택
-        best_action = None
-        best_value = float('-inf')
-        
-        for action in actions:
-            # 각 액션에 대해 예상 다음 상태의 value 확인
-            next_states = self.env.get_transitions(state, action)
-            expected_value = 0.0
-            for next_state, prob in next_states:
-                reward = self.env.get_reward(state, action, next_state)
-                expected_value += prob * (reward + self.gamma * self.value_function.get_value(next_state))
-            
-            if expected_value > best_value:
-                best_value = expected_value
-                best_action = action
-        
-        return best_action if best_action else random.choice(actions)
+        # greedy 액션은 V와 환경 모델의 one-step lookahead로 선택 (동점이면 랜덤)
+        return self.action_selector.lookahead_action(
+            self.env, self.value_function, self.gamma, state, actions
+        )
 
     def td_lambda_update(self, X, R, Y):
         """
@@ -101,39 +120,123 @@ class TDLambda:
         7:     V[x] ← V[x] + α · δ · z[x]
         8: end for
         9: return (V, z)
+
+        trace_type / true_online에 따라 Step 5와 Step 7이 달라집니다 (클래스 설명 참고).
         """
+        x_index = self.value_function.index(X)
+        y_index = self.value_function.index(Y)
+        traces = self.traces
+        if len(traces) < len(self.value_function.values):
+            traces.extend(bytes(8 * (len(self.value_function.values) - len(traces))))
+        self.td_lambda_update_index(x_index, R, y_index)
+
+    def td_lambda_update_index(self, x_index, R, y_index):
+        """td_lambda_update와 같지만 상태 대신 value_function의 상태 인덱스를 받음"""
+        values = self.value_function.values
+        traces = self.traces
+
         # Step 1: δ ← R + γ · V[Y] − V[X]
-        V_X = self.value_function.get_value(X)
-        V_Y = self.value_function.get_value(Y)
+        V_X = values[x_index]
+        V_Y = values[y_index]
         delta = R + self.gamma * V_Y - V_X
         
-        # Step 2: for all x ∈ X do
-        # 효율성을 위해 traces가 0이 아닌 상태들과 현재 상태 X만 업데이트
-        states_to_update = list(self.traces.keys()) + [X]
-        states_to_update = list(set(states_to_update))  # 중복 제거
+        # Step 2-3: trace가 0이 아닌 상태들만 z[x] ← γ · λ · z[x]
+        decay = self.gamma * self.lambda_
+        active = self.active_traces
+        for x in active:
+            traces[x] *= decay
         
-        for x in states_to_update:
-            # Step 3: z[x] ← γ · λ · z[x]
-            self.traces[x] = self.gamma * self.lambda_ * self.traces[x]
-            
-            # Step 4-6: if X = x then z[x] ← 1
-            if X == x:
-                self.traces[x] = 1.0
-            
-            # Step 7: V[x] ← V[x] + α · δ · z[x]
-            current_value = self.value_function.get_value(x)
-            new_value = current_value + self.alpha * delta * self.traces[x]
-            self.value_function.update(x, new_value)
-            
-            # 메모리 효율을 위해 매우 작은 trace는 제거
-            if abs(self.traces[x]) < 1e-8:
-                del self.traces[x]
+        # Step 4-6: X의 trace 갱신
+        if self.trace_type == "replacing":
+            traces[x_index] = 1.0
+        elif self.trace_type == "accumulating":
+            traces[x_index] += 1.0
+        else:  # dutch
+            traces[x_index] = (1.0 - self.alpha) * traces[x_index] + 1.0
+        active.add(x_index)
+        
+        # Step 7: V[x] ← V[x] + α · δ · z[x]
+        if self.true_online:
+            step = self.alpha * (delta + V_X - self.v_old)
+            for x in active:
+                values[x] += step * traces[x]
+            values[x_index] -= self.alpha * (V_X - self.v_old)
+            self.v_old = V_Y
+        else:
+            step = self.alpha * delta
+            for x in active:
+                values[x] += step * traces[x]
+        
+        # 메모리 효율을 위해 매우 작은 trace는 제거
+        for x in [x for x in active if abs(traces[x]) < 1e-8]:
+            traces[x] = 0.0
+            active.discard(x)
         
         # Step 9: return (V, z) - 암묵적으로 self에 저장됨
 
     def reset_traces(self):
         """에피소드 시작 시 eligibility traces 초기화"""
-        self.traces.clear()
+        for x in self.active_traces:
+            self.traces[x] = 0.0
+        self.active_traces.clear()
+        self.v_old = 0.0
+
+    def learn_episodes(self, episodes):
+        """
+        다른 곳(actor, 로그 등)에서 생성한 에피소드 batch로 학습
+
+        Args:
+            episodes: [[(state, action, reward, next_state, done), ...], ...]
+                      trace는 에피소드마다 초기화하고, 에피소드 안에서는 순서대로 업데이트합니다.
+        """
+        for episode in episodes:
+            self.reset_traces()
+            for state, action, reward, next_state, done in episode:
+                self.td_lambda_update(state, reward, next_state)
+
+    def get_parameters(self):
+        """actor에게 배포할 파라미터 스냅샷 (pickle 가능한 dict, ε-greedy lookahead 행동용)"""
+        return {
+            "values": dict(self.value_function.items()),
+            "gamma": self.gamma,
+            "epsilon": self.action_selector.epsilon,
+            "max_steps": self.step_budget.cap,
+        }
+
+    def train_offline(self, log, num_epochs=1):
+        """
+        로그 파일(TransitionLog)의 transition으로 학습 - 환경에서 step 하지 않음
+
+        로그를 chunk 단위로 읽고, 로그의 상태 인덱스를 value function 인덱스로 한 번만 변환해 두어
+        transition마다 상태 해싱 없이 td_lambda_update_index를 적용합니다.
+        trace는 시간 순서에 의존하므로 chunk 안에서는 기록된 순서대로 업데이트하고,
+        에피소드가 끝난 transition 다음에 trace를 초기화합니다.
+
+        Args:
+            log: TransitionLog (chunks()로 TransitionChunk를 생성하는 reader)
+            num_epochs: 로그 전체를 반복할 횟수
+
+        Returns:
+            policy: 학습된 정책 (env의 모델로 추출)
+        """
+        index_map = [self.value_function.index(state) for state in log.states]
+        traces = self.traces
+        if len(traces) < len(self.value_function.values):
+            traces.extend(bytes(8 * (len(self.value_function.values) - len(traces))))
+
+        update = self.td_lambda_update_index
+        end_flag = TransitionLogWriter.EPISODE_END
+        for _ in range(num_epochs):
+            self.reset_traces()
+            for chunk in log.chunks():
+                for s, reward, next_s, flags in zip(chunk.states, chunk.rewards, chunk.next_states, chunk.flags):
+                    update(index_map[s], reward, index_map[next_s])
+                    if flags & end_flag:
+                        self.reset_traces()
+
+        policy = self.extract_policy()
+        self.policy = policy
+        return policy
 
     def run_episode(self):
         """
@@ -150,10 +253,11 @@ class TDLambda:
         total_reward = 0.0
         steps = 0
         
-        max_steps = 1000  # 무한 루프 방지
-        for _ in range(max_steps):
+        done = False
+        for _ in range(self.step_budget.cap):
             actions = self.env.get_actions(state)
             if not actions:  # 터미널 상태
+                done = True
                 break
             
             # ε-greedy로 액션 선택
@@ -173,6 +277,13 @@ class TDLambda:
             
             state = next_state
         
+        # cap에 걸려 잘린 에피소드는 마지막 업데이트에서 이미 V(Y)로 bootstrap 했으므로
+        # (Y는 터미널이 아님) 추가 처리 없이 통계에만 기록
+        self.step_budget.record(steps, truncated=not done)
+        
+        # 에피소드가 끝날 때마다 ε 스케줄 진행
+        self.action_selector.advance()
+        
         return total_reward, steps
 
     def extract_policy(self):
@@ -182,59 +293,49 @@ class TDLambda:
         π(s) = argmax_a E[R + γ·V(s') | s, a]
         """
         policy = TabularPolicy(default_action=None)
+        score_fn = self.action_selector.lookahead_scores(self.env, self.value_function, self.gamma)
         
         for state in self.env.get_states():
             actions = self.env.get_actions(state)
-            if not actions:
-                continue
-            
-            best_action = None
-            best_value = float('-inf')
-            
-            for action in actions:
-                # 각 액션에 대해 예상 value 계산
-                expected_value = 0.0
-                for next_state, prob in self.env.get_transitions(state, action):
-                    reward = self.env.get_reward(state, action, next_state)
-                    expected_value += prob * (reward + self.gamma * self.value_function.get_value(next_state))
-                
-                if expected_value > best_value:
-                    best_value = expected_value
-                    best_action = action
-            
-            if best_action:
-                policy.update(state, best_action)
+            if actions:
+                # 예상 value가 최대인 액션 (동점이면 랜덤)
+                policy.update(state, self.action_selector.argmax(actions, score_fn(state, actions)))
         
         return policy
 
-    def train(self, num_episodes=1000, verbose=False):
+    def train(self, num_episodes=1000, verbose=False, metrics=None):
         """
         TD(λ) 학습 메인 루프
         
         Args:
             num_episodes: 학습할 에피소드 수
             verbose: True면 진행상황 출력
+            metrics: LearningMetrics - 주어지면 에피소드별 return/길이를 여기에 집계
         
         Returns:
             policy: 학습된 정책
-            episode_rewards: 에피소드별 보상 리스트
+            episode_rewards: 에피소드별 보상 리스트 (metrics가 주어지면 metrics)
         """
-        episode_rewards = []
+        # metrics가 주어지면 보상 리스트를 만들지 않고 스트리밍 지표에만 집계
+        episode_rewards = [] if metrics is None else None
+        tracker = metrics if metrics is not None else (LearningMetrics() if verbose else None)
         
         for episode_num in range(num_episodes):
             total_reward, steps = self.run_episode()
-            episode_rewards.append(total_reward)
+            if episode_rewards is not None:
+                episode_rewards.append(total_reward)
+            if tracker is not None:
+                tracker.record(total_reward, steps)
             
             if verbose and (episode_num + 1) % 100 == 0:
-                avg_reward = sum(episode_rewards[-100:]) / min(100, len(episode_rewards))
                 print(f"Episode {episode_num + 1}/{num_episodes} - "
-                      f"Avg Reward (last 100): {avg_reward:.3f}")
+                      f"Avg Reward (last {tracker.window}): {tracker.mean_return():.3f}")
         
         # 최종 정책 추출
         policy = self.extract_policy()
         self.policy = policy
         
-        return policy, episode_rewards
+        return policy, episode_rewards if metrics is None else metrics
 
     def get_value_function(self):
         """학습된 value function 반환"""
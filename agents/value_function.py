@@ -1,4 +1,5 @@
 from .tabular_policy import TabularPolicy
+from .action_selection import argmax
 
 class ValueFunction:
 
@@ -25,17 +26,21 @@ class ValueFunction:
 
     """ Return a policy from this value function """
 
-    def extract_policy(self, mdp):
+    def extract_policy(self, mdp, action_sets=None, rng=None, tolerance=0.0):
+        # action_sets: {state: [actions]} - 상태별로 고려할 액션 집합
+        # (예: ValueIteration의 action elimination 후 남은 액션들)
+        # rng: RandomStream - 주어지면 최대 Q-값과 tolerance 이내인 액션들 중 랜덤으로 선택
+        # (None이면 첫 번째 최대 액션)
         policy = TabularPolicy()
         for state in mdp.get_states():
-            max_q = float("-inf")
-            for action in mdp.get_actions(state):
-                q_value = self.get_q_value(mdp, state, action)
+            if action_sets is not None and state in action_sets:
+                actions = action_sets[state]
+            else:
+                actions = mdp.get_actions(state)
+            if not actions:
+                continue
 
-                # If this is the maximum Q-value so far,
-                # set the policy for this state
-                if q_value > max_q:
-                    policy.update(state, action)
-                    max_q = q_value
+            q_values = [self.get_q_value(mdp, state, action) for action in actions]
+            policy.update(state, argmax(actions, q_values, rng, tolerance))
 
-        return policy
\ No newline at end of file
+        return policy
@@ -1,43 +1,250 @@
-from .tabular_value_function import TabularValueFunction
-from .qtable import QTable
+from array import array
+from .warm_start import remap_values
 
 
 class ValueIteration:
-    def __init__(self, mdp, values):
+    """
+    Value Iteration
+
+    mode:
+        "jacobi": V_(k+1) = T V_k - sweep 동안 이전 sweep의 값만 읽음 (기본값)
+        "gauss_seidel": 같은 sweep에서 먼저 갱신한 상태의 값을 바로 사용 (in-place)
+                        - 보통 더 적은 sweep으로 수렴
+        "sor": Gauss-Seidel에 relaxation을 더함 - V(s) ← V(s) + ω·(max_a Q(s,a) - V(s))
+               (ω = 1이면 Gauss-Seidel과 같음). 수축 계수가 |1 - ω| + ω·γ 이므로
+               ω ≤ 1이면 항상 수렴하지만, ω > 1은 ω < 2/(1+γ)일 때만 수렴이 보장됩니다
+               (max 연산 때문에 선형 방정식의 SOR처럼 ω를 2 가까이 키울 수 없음).
+
+    action elimination의 bound(MacQueen)는 V_(k+1) = T V_k를 가정하므로 Jacobi 모드에서만 사용할 수 있습니다.
+    bound의 폭은 전역 γ·(max(d) - min(d))/(1-γ)이므로 보상이 목표에만 있는 결정적 최단 경로 맵에서는
+    값이 퍼지는 동안 폭이 Q 차이보다 넓어 액션이 거의 제외되지 않습니다 (이득 없음).
+    sweep 수가 많은 맵(cell_rewards, 높은 γ 등)에서 수렴 후반의 sweep 비용이 줄어듭니다.
+    """
+
+    MODES = ("jacobi", "gauss_seidel", "sor")
+    # 부동소수점 오차로 최적 액션이 제외되지 않도록 두는 여유
+    ELIMINATION_TOLERANCE = 1e-9
+
+    def __init__(self, mdp, values, action_elimination=False, mode="jacobi", omega=1.0):
+        """
+        Args:
+            mdp: MDP 환경
+            values: 가치 함수 (warm start 시 미리 채워진 값 사용)
+            action_elimination: True면 Q(s,a)의 상/하한을 유지하면서
+                                최적이 될 수 없는 액션을 영구적으로 제외 (Jacobi 모드만)
+            mode: "jacobi", "gauss_seidel", "sor"
+            omega: SOR의 relaxation 계수 (0 < ω < 2, mode="sor"에서만 사용)
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}: {mode}")
+        if action_elimination and mode != "jacobi":
+            raise ValueError("action_elimination requires mode='jacobi'")
+        if mode == "sor" and not 0.0 < omega < 2.0:
+            raise ValueError(f"omega must be in (0, 2): {omega}")
+
         self.mdp = mdp
         self.values = values
+        self.action_elimination = action_elimination
+        self.mode = mode
+        self.omega = omega if mode == "sor" else 1.0
+
+        # Action elimination: 상태별로 남아있는 (최적일 수 있는) 액션 집합 캐시
+        self.action_sets = {}
+        # Q*(s,a)의 하한/상한 - k = s·A + a 인덱스의 array('d') (첫 sweep에서 ∓inf로 할당)
+        self.q_lower = None
+        self.q_upper = None
+        # sweep별 Q(s,a) 계산 횟수
+        self.sweep_q_evaluations = []
+
+    def warm_start(self, values=None, source_mdp=None, state_map=None):
+        """
+        이전 풀이의 가치 함수로 초기값 설정
+
+        Args:
+            values: 이전 풀이의 가치 함수 (None이면 아무것도 하지 않음)
+            source_mdp: 이전 풀이의 MDP (맵이 다르면 없는 상태는 0으로 시작)
+            state_map: 현재 상태 → 이전 상태 (dict 또는 함수, None이면 같은 상태)
+        """
+        if values is None:
+            return
+        self.values.merge(remap_values(values, self.mdp, source_mdp, state_map))
+
+    def get_actions(self, state):
+        """state에서 고려할 액션들 반환 (action elimination 시 제외된 액션은 빠짐)"""
+        if not self.action_elimination:
+            return self.mdp.get_actions(state)
+        if state not in self.action_sets:
+            self.action_sets[state] = list(self.mdp.get_actions(state))
+        return self.action_sets[state]
+
+    def state_models(self, states, state_index):
+        """
+        상태별 {action: [(s' 인덱스, p, r), ...]} 리스트
+
+        sweep 동안 transition/보상은 바뀌지 않으므로 value_iteration 호출마다 한 번만 조회합니다.
+        """
+        mdp = self.mdp
+        models = []
+        for state in states:
+            model = {}
+            for action in mdp.get_actions(state):
+                model[action] = [
+                    (state_index[next_state], probability, mdp.get_reward(state, action, next_state))
+                    for next_state, probability in mdp.get_transitions(state, action)
+                ]
+            models.append(model)
+        return models
 
     def value_iteration(self, max_iterations=100, theta=0.001):
+        """
+        mode에 따라 Jacobi / Gauss-Seidel / SOR sweep 반복
+
+        값은 상태 인덱스 기반 array('d') 버퍼에서 갱신하고 끝날 때 self.values에 기록합니다.
+        Jacobi는 미리 만든 두 버퍼(V_k 읽기, V_(k+1) 쓰기)를 sweep마다 맞바꾸고,
+        Gauss-Seidel / SOR은 버퍼 하나를 in-place로 갱신하므로 sweep마다 새로 할당하는 테이블은 없습니다.
+        action elimination의 sweep별 Q(s,a)도 미리 할당한 k = s·A + a 인덱스의 array('d')에 기록하며,
+        전역 bound 폭으로 제외할 수 있는 액션이 있을 때만 기록 / bound 갱신을 수행합니다 (eliminate_actions 참고).
+
+        Returns:
+            수렴한 sweep의 인덱스 (max_iterations 안에 수렴하지 않으면 None)
+        """
+        states = self.mdp.get_states()
+        state_index = {state: s for s, state in enumerate(states)}
+        models = self.state_models(states, state_index)
+        gamma = self.mdp.get_discount_factor()
+        jacobi = self.mode == "jacobi"
+        omega = self.omega
+
+        values = array("d", [self.values.get_value(state) for state in states])
+        # Jacobi: 다음 sweep 값을 쓸 두 번째 버퍼, Gauss-Seidel / SOR: 같은 버퍼
+        next_values = array("d", values) if jacobi else values
 
+        if self.action_elimination:
+            action_index = {}
+            for model in models:
+                for action in model:
+                    action_index.setdefault(action, len(action_index))
+            num_actions = len(action_index)
+            num_pairs = len(states) * num_actions
+            sweep_q = array("d", bytes(8 * num_pairs))
+            # 이번 sweep에서 Q를 sweep_q에 기록할지 (직전 sweep에서 제외가 가능했으면 True)
+            armed = False
+            if self.q_lower is None or len(self.q_lower) != num_pairs:
+                # bound가 아직 없는 (s,a)는 (-inf, inf) - 첫 교집합이 이번 sweep의 bound가 됨
+                self.q_lower = array("d", [float("-inf")]) * num_pairs
+                self.q_upper = array("d", [float("inf")]) * num_pairs
+
+        converged = None
         for i in range(max_iterations):
             delta = 0.0
-            new_values = TabularValueFunction()
-            for state in self.mdp.get_states():
-                qtable = QTable(alpha=1.0)
-                for action in self.mdp.get_actions(state):
-                    # Calculate the value of Q(s,a)
-                    new_value = 0.0
-                    for (new_state, probability) in self.mdp.get_transitions(
-                        state, action
-                    ):
-                        reward = self.mdp.get_reward(state, action, new_state)
-                        new_value += probability * (
-                            reward
-                            + (
-                                self.mdp.get_discount_factor()
-                                * self.values.get_value(new_state)
-                            )
-                        )
-
-                    qtable.update(state, action, new_value)
-
-                # V(s) = max_a Q(sa)
-                max_q = qtable.get_max_q(state, self.mdp.get_actions(state))
-                delta = max(delta, abs(self.values.get_value(state) - max_q))
-                new_values.add(state, max_q)
-
-            self.values.merge(new_values)
+            # V_(k+1) - V_k 의 최소/최대 (action elimination의 bound 계산용)
+            # 터미널 상태(값 고정)가 있어도 bound가 성립하도록 0을 포함
+            min_diff = 0.0
+            max_diff = 0.0
+            q_evaluations = 0
+            # 상태별 max_a Q - min_a Q 의 최댓값 (이보다 bound 폭이 넓으면 어떤 액션도 제외할 수 없음)
+            max_gap = 0.0
+            record = self.action_elimination and armed
+            for s, state in enumerate(states):
+                model = models[s]
+
+                # V(s) = max_a Q(s,a) (액션이 없는 터미널은 0)
+                max_q = None
+                min_q = None
+                for action in self.get_actions(state):
+                    q_value = 0.0
+                    for next_s, probability, reward in model[action]:
+                        q_value += probability * (reward + gamma * values[next_s])
+                    if max_q is None or q_value > max_q:
+                        max_q = q_value
+                    if min_q is None or q_value < min_q:
+                        min_q = q_value
+                    if record:
+                        sweep_q[s * num_actions + action_index[action]] = q_value
+                    q_evaluations += 1
+                if max_q is None:
+                    max_q = 0.0
+                elif max_q - min_q > max_gap:
+                    max_gap = max_q - min_q
+
+                old_value = values[s]
+                new_value = max_q if omega == 1.0 else old_value + omega * (max_q - old_value)
+                diff = new_value - old_value
+                delta = max(delta, abs(diff))
+                min_diff = min(min_diff, diff)
+                max_diff = max(max_diff, diff)
+                next_values[s] = new_value
+
+            if jacobi:
+                values, next_values = next_values, values
+            self.sweep_q_evaluations.append(q_evaluations)
+
+            if self.action_elimination:
+                # 새 bound의 폭 γ·(max(d) - min(d))/(1-γ)이 Q 차이보다 넓으면 bound 갱신을 건너뜀
+                # (목표까지의 최단 경로 맵은 마지막 sweep까지 폭이 넓어 제외가 일어나지 않음)
+                prunable = gamma < 1.0 and max_gap > gamma * (max_diff - min_diff) / (1.0 - gamma)
+                if prunable and record:
+                    self.eliminate_actions(states, action_index, sweep_q, min_diff, max_diff)
+                armed = prunable
 
             # Terminate if the value function has converged
             if delta < theta:
-                return i
\ No newline at end of file
+                converged = i
+                break
+
+        for state, value in zip(states, values):
+            self.values.update(state, value)
+        return converged
+
+    def eliminate_actions(self, states, action_index, sweep_q, min_diff, max_diff):
+        """
+        Q*(s,a)의 bound를 갱신하고 최적이 될 수 없는 액션을 제외합니다.
+        (sweep_q, q_lower, q_upper는 k = s·A + a 인덱스의 배열, s는 states의 인덱스)
+
+        V_(k+1) = T V_k, d = V_(k+1) - V_k 일 때 (MacQueen bound)
+            V_k + min(d) / (1-γ) ≤ V* ≤ V_k + max(d) / (1-γ)
+        따라서 이번 sweep에서 계산한 Q_k(s,a)에 대해
+            Q_k(s,a) + γ·min(d)/(1-γ) ≤ Q*(s,a) ≤ Q_k(s,a) + γ·max(d)/(1-γ)
+
+        이전 sweep에서 얻은 bound와 교집합을 취해 가장 좁은 구간을 유지합니다.
+        upper(s,a) < max_b lower(s,b) 이면 a는 s에서 최적이 될 수 없으므로
+        이후 sweep에서 영구적으로 제외합니다. 제외된 액션은 V*를 바꾸지 않으므로
+        남은 액션만으로 구성된 MDP에서도 같은 bound가 성립합니다.
+        """
+        gamma = self.mdp.get_discount_factor()
+        if gamma >= 1.0:
+            return  # 할인이 없으면 bound가 유한하지 않음
+
+        lower_offset = gamma * min_diff / (1.0 - gamma)
+        upper_offset = gamma * max_diff / (1.0 - gamma)
+
+        num_actions = len(action_index)
+        q_lower = self.q_lower
+        q_upper = self.q_upper
+        for s, state in enumerate(states):
+            actions = self.action_sets[state]
+            if len(actions) <= 1:
+                continue
+
+            base = s * num_actions
+            best_lower = float("-inf")
+            for action in actions:
+                # 이전 sweep의 bound도 유효하므로 더 좁은 쪽을 유지
+                k = base + action_index[action]
+                q_value = sweep_q[k]
+                lower = q_value + lower_offset
+                if lower > q_lower[k]:
+                    q_lower[k] = lower
+                else:
+                    lower = q_lower[k]
+                upper = q_value + upper_offset
+                if upper < q_upper[k]:
+                    q_upper[k] = upper
+                if lower > best_lower:
+                    best_lower = lower
+
+            self.action_sets[state] = [
+                action
+                for action in actions
+                if q_upper[base + action_index[action]] >= best_lower - self.ELIMINATION_TOLERANCE
+            ]
@@ -1,3 +1,6 @@
 from .gridworld import GridWorld
+from .tabular_mdp import TabularMDP
+from .vector_env import VectorEnv
+from .transition_log import TransitionChunk, TransitionLogWriter, TransitionLog
 
-__all__ = ['GridWorld']
+__all__ = ['GridWorld', 'TabularMDP', 'VectorEnv', 'TransitionChunk', 'TransitionLogWriter', 'TransitionLog']
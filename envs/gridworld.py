@@ -1,3 +1,7 @@
+import hashlib
+import json
+
+
 class GridWorld:
     """
     간단한 Grid World MDP 환경
@@ -14,19 +18,70 @@ class GridWorld:
     +---+---+---+---+
     
     S: 시작점, G: 목표 (reward +1), X: 장애물
+
+    보상 맵 (선택):
+        goal_rewards: 목표별 보상 {cell: reward} (지정하지 않은 목표는 +1)
+        hazards: 터미널 위험 셀 {cell: reward} 또는 셀 리스트 (보상 -1)
+        cell_rewards: 셀에 들어갈 때 받는 보상/비용 {cell: reward} 또는 height x width 2차원 리스트
+        step_cost: 매 스텝 빼는 비용
+    보상은 r(s, a, s') = cell_rewards[s'] - step_cost + (s'가 목표/위험 셀이면 그 보상)이며,
+    compile()은 보상 맵을 그대로 TabularMDP의 rewards 배열로 옮기므로 planner는 항상 배열 fast path를 사용합니다.
     """
 
     ACTIONS = ["up", "down", "left", "right"]
+    # 8방향 이동 (대각선 포함) 및 제자리(no-op) 액션 집합
+    ACTIONS_8 = ACTIONS + ["up_left", "up_right", "down_left", "down_right"]
+    ACTIONS_9 = ACTIONS_8 + ["stay"]
+
+    # 액션별 (row, col) 이동량
+    ACTION_DELTAS = {
+        "up": (-1, 0),
+        "down": (1, 0),
+        "left": (0, -1),
+        "right": (0, 1),
+        "up_left": (-1, -1),
+        "up_right": (-1, 1),
+        "down_left": (1, -1),
+        "down_right": (1, 1),
+        "stay": (0, 0),
+    }
 
-    def __init__(self, width=4, height=4, goal_states=None, obstacles=None, discount=0.9, start_state=None):
+    def __init__(self, width=4, height=4, goal_states=None, obstacles=None, discount=0.9, start_state=None,
+                 actions=None, goal_rewards=None, hazards=None, cell_rewards=None, step_cost=0.0):
         self.width = width
         self.height = height
         self.discount = discount
+
+        # 액션 집합 (기본: 상하좌우 4방향, 예: actions=GridWorld.ACTIONS_9)
+        if actions is not None:
+            self.ACTIONS = list(actions)
         
-        # 기본 목표: 우상단 (0, width-1)
-        self.goal_states = goal_states if goal_states else [(0, width - 1)]
+        # 목표별 보상 (지정하지 않은 목표는 +1)
+        self.goal_rewards = dict(goal_rewards) if goal_rewards else {}
+        # 기본 목표: 우상단 (0, width-1) (goal_rewards만 주면 그 셀들)
+        if not goal_states:
+            goal_states = list(self.goal_rewards) if self.goal_rewards else [(0, width - 1)]
+        self.goal_states = goal_states
         # 장애물
         self.obstacles = obstacles if obstacles else []
+        # 터미널 위험 셀: cell → 보상
+        if hazards is None:
+            hazards = {}
+        elif not isinstance(hazards, dict):
+            hazards = {cell: -1.0 for cell in hazards}
+        self.hazards = hazards
+        # 셀에 들어갈 때의 보상/비용: cell → 보상 (0이 아닌 셀만 저장)
+        if cell_rewards is None:
+            cell_rewards = {}
+        elif not isinstance(cell_rewards, dict):
+            cell_rewards = {
+                (row, col): reward
+                for row, rewards in enumerate(cell_rewards)
+                for col, reward in enumerate(rewards)
+                if reward
+            }
+        self.cell_rewards = cell_rewards
+        self.step_cost = step_cost
         # 시작 상태 (기본: 좌하단)
         self.start_state = start_state if start_state else (height - 1, 0)
         # 현재 상태
@@ -41,26 +96,21 @@ class GridWorld:
                     states.append((row, col))
         return states
 
+    def is_terminal(self, state):
+        """목표 또는 위험 셀이면 터미널 상태"""
+        return state in self.goal_states or state in self.hazards
+
     def get_actions(self, state):
         """주어진 상태에서 가능한 액션들 반환"""
-        if state in self.goal_states:
-            return []  # 목표 상태는 터미널 상태
+        if self.is_terminal(state):
+            return []  # 목표/위험 상태는 터미널 상태
         return self.ACTIONS
 
     def _get_next_state(self, state, action):
         """액션 수행 후 다음 상태 계산"""
         row, col = state
-        
-        if action == "up":
-            next_state = (row - 1, col)
-        elif action == "down":
-            next_state = (row + 1, col)
-        elif action == "left":
-            next_state = (row, col - 1)
-        elif action == "right":
-            next_state = (row, col + 1)
-        else:
-            next_state = state
+        d_row, d_col = self.ACTION_DELTAS.get(action, (0, 0))
+        next_state = (row + d_row, col + d_col)
 
         # 벽이나 장애물에 부딪히면 제자리
         next_row, next_col = next_state
@@ -84,14 +134,110 @@ class GridWorld:
         return [(next_state, 1.0)]
 
     def get_reward(self, state, action, next_state):
-        """보상 반환"""
+        """보상 반환: 다음 셀의 보상 - step_cost (+ 목표/위험 셀 보상)"""
+        reward = self.cell_rewards.get(next_state, 0.0) - self.step_cost
         if next_state in self.goal_states:
-            return 1.0
-        return 0.0  # 기본 보상
+            reward += self.goal_rewards.get(next_state, 1.0)
+        elif next_state in self.hazards:
+            reward += self.hazards[next_state]
+        return reward
 
     def get_discount_factor(self):
         return self.discount
 
+    def canonical_key(self, include_goals=True):
+        """
+        맵 설정을 순서와 무관한 표준 형태로 나타낸 딕셔너리
+
+        크기, 액션, 장애물, 보상 맵, 할인율과 transition 모델(클래스)을 포함하며
+        시작 상태와 현재 상태는 포함하지 않습니다.
+        transition이나 보상을 바꾸는 파라미터를 추가한 서브클래스는 이 키에 그 파라미터를 더해야 합니다.
+        """
+        key = {
+            "class": f"{type(self).__module__}.{type(self).__qualname__}",
+            "width": self.width,
+            "height": self.height,
+            "actions": list(self.ACTIONS),
+            "obstacles": sorted(set(self.obstacles)),
+            "hazards": sorted(self.hazards.items()),
+            "cell_rewards": sorted(self.cell_rewards.items()),
+            "step_cost": self.step_cost,
+            "discount": self.discount,
+        }
+        if include_goals:
+            key["goals"] = sorted((goal, self.goal_rewards.get(goal, 1.0)) for goal in set(self.goal_states))
+        return key
+
+    def map_hash(self, include_goals=True):
+        """canonical_key의 sha256 해시 (캐시 키)"""
+        encoded = json.dumps(self.canonical_key(include_goals), sort_keys=True, default=repr).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def compile(self):
+        """
+        TabularMDP(정수 인덱스 배열 표현)로 컴파일
+
+        상태마다 get_transitions/get_reward를 호출하는 대신 set 기반으로 한 번에 구성합니다.
+        보상 맵(goal_rewards, hazards, cell_rewards, step_cost)은 상태별 진입 보상 배열로 한 번 계산해
+        transition마다 rewards 배열에 채웁니다.
+        transition이나 보상을 override한 서브클래스는 일반 경로(TabularMDP.from_mdp)를 사용합니다.
+        """
+        from .tabular_mdp import TabularMDP
+
+        cls = type(self)
+        if (
+            cls.get_transitions is not GridWorld.get_transitions
+            or cls.get_reward is not GridWorld.get_reward
+            or cls._get_next_state is not GridWorld._get_next_state
+            or cls.get_actions is not GridWorld.get_actions
+            or cls.is_terminal is not GridWorld.is_terminal
+        ):
+            return TabularMDP.from_mdp(self)
+
+        obstacles = set(self.obstacles)
+        terminals = set(self.goal_states) | set(self.hazards)
+        states = [
+            (row, col)
+            for row in range(self.height)
+            for col in range(self.width)
+            if (row, col) not in obstacles
+        ]
+        state_index = {state: i for i, state in enumerate(states)}
+
+        # 상태별 진입 보상 r(·, ·, s')
+        entry_rewards = [self.get_reward(None, None, state) for state in states]
+
+        num_actions = len(self.ACTIONS)
+        deltas = [self.ACTION_DELTAS.get(action, (0, 0)) for action in self.ACTIONS]
+        all_actions = list(range(num_actions))
+
+        state_actions = []
+        offsets = [0]
+        next_states = []
+        probabilities = []
+        rewards = []
+        for s, (row, col) in enumerate(states):
+            if (row, col) in terminals:
+                # 목표/위험 상태는 터미널 상태
+                state_actions.append([])
+                offsets.extend([len(next_states)] * num_actions)
+                continue
+
+            state_actions.append(all_actions)
+            for d_row, d_col in deltas:
+                # 벽이나 장애물에 부딪히면 제자리
+                next_state = state_index.get((row + d_row, col + d_col), s)
+                if not (0 <= row + d_row < self.height and 0 <= col + d_col < self.width):
+                    next_state = s
+                next_states.append(next_state)
+                probabilities.append(1.0)
+                rewards.append(entry_rewards[next_state])
+                offsets.append(len(next_states))
+
+        return TabularMDP(
+            states, self.ACTIONS, state_actions, offsets, next_states, probabilities, rewards, self.discount
+        )
+
     def reset(self):
         """환경을 초기 상태로 리셋"""
         self.current_state = self.start_state
@@ -108,7 +254,7 @@ class GridWorld:
         """
         next_state = self._get_next_state(self.current_state, action)
         reward = self.get_reward(self.current_state, action, next_state)
-        done = next_state in self.goal_states
+        done = self.is_terminal(next_state)
         self.current_state = next_state
         return next_state, reward, done
 
@@ -122,6 +268,8 @@ class GridWorld:
                     row_str += "  [X]  "
                 elif (row, col) in self.goal_states:
                     row_str += "  [G]  "
+                elif (row, col) in self.hazards:
+                    row_str += "  [H]  "
                 else:
                     value = value_function.get_value((row, col))
                     row_str += f"{value:6.3f} "
@@ -135,6 +283,11 @@ class GridWorld:
             "down": "↓",
             "left": "←",
             "right": "→",
+            "up_left": "↖",
+            "up_right": "↗",
+            "down_left": "↙",
+            "down_right": "↘",
+            "stay": "○",
             None: "·"
         }
         
@@ -146,6 +299,8 @@ class GridWorld:
                     row_str += " X "
                 elif (row, col) in self.goal_states:
                     row_str += " G "
+                elif (row, col) in self.hazards:
+                    row_str += " H "
                 else:
                     action = policy.select_action((row, col), self.ACTIONS)
                     row_str += f" {action_symbols.get(action, '?')} "
@@ -0,0 +1,233 @@
+from array import array
+
+
+class TabularMDP:
+    """
+    MDP를 정수 인덱스 기반 배열 표현으로 컴파일한 모델 (planner용 fast path)
+
+    상태 s ∈ [0, S), 액션 a ∈ [0, A) 이며 (s, a) 쌍은 k = s·A + a 로 인덱싱합니다.
+    (s, a)의 transition은 CSR 형식으로 저장합니다:
+        offsets[k] ≤ j < offsets[k + 1] 인 j에 대해
+        next_states[j], probabilities[j], rewards[j]
+    터미널 상태 등 가능한 액션이 없는 (s, a)는 빈 구간입니다.
+
+    원래 MDP와 같은 인터페이스(get_states, get_actions, get_transitions,
+    get_reward, get_discount_factor)도 제공하므로 기존 알고리즘에 그대로 넘길 수 있습니다.
+    """
+
+    def __init__(self, states, actions, state_actions, offsets, next_states, probabilities, rewards, discount):
+        """
+        Args:
+            states: 상태 리스트 (인덱스 → 원래 상태)
+            actions: 액션 리스트 (인덱스 → 원래 액션)
+            state_actions: 상태별 가능한 액션 인덱스 리스트
+            offsets: 길이 S·A + 1 의 CSR offset
+            next_states, probabilities, rewards: CSR 데이터
+            discount: 할인율 γ
+        """
+        self.states = list(states)
+        self.actions = list(actions)
+        self.num_states = len(self.states)
+        self.num_actions = len(self.actions)
+        self.discount = discount
+
+        self.state_index = {state: i for i, state in enumerate(self.states)}
+        self.action_index = {action: i for i, action in enumerate(self.actions)}
+        self.state_actions = [list(action_ids) for action_ids in state_actions]
+
+        self.offsets = array("l", offsets)
+        self.next_states = array("l", next_states)
+        self.probabilities = array("d", probabilities)
+        self.rewards = array("d", rewards)
+
+        # (s, a)별 기대 보상 Σ p·r
+        num_pairs = self.num_states * self.num_actions
+        self.expected_rewards = array("d", bytes(8 * num_pairs))
+        for k in range(num_pairs):
+            total = 0.0
+            for j in range(self.offsets[k], self.offsets[k + 1]):
+                total += self.probabilities[j] * self.rewards[j]
+            self.expected_rewards[k] = total
+
+        # 결정적 모델이면 (s, a) → s' 를 바로 찾을 수 있도록 successor 배열 구성
+        self.deterministic = all(
+            self.offsets[k + 1] - self.offsets[k] <= 1 for k in range(num_pairs)
+        ) and all(p == 1.0 for p in self.probabilities)
+        self.successors = array("l", [-1]) * num_pairs
+        if self.deterministic:
+            for k in range(num_pairs):
+                if self.offsets[k + 1] > self.offsets[k]:
+                    self.successors[k] = self.next_states[self.offsets[k]]
+
+    @classmethod
+    def from_mdp(cls, mdp):
+        """get_states/get_actions/get_transitions/get_reward 인터페이스를 가진 MDP를 컴파일"""
+        states = list(mdp.get_states())
+        state_index = {state: i for i, state in enumerate(states)}
+
+        actions = []
+        action_index = {}
+        for state in states:
+            for action in mdp.get_actions(state):
+                if action not in action_index:
+                    action_index[action] = len(actions)
+                    actions.append(action)
+
+        transitions = {}
+        state_actions = []
+        for s, state in enumerate(states):
+            action_ids = []
+            for action in mdp.get_actions(state):
+                a = action_index[action]
+                action_ids.append(a)
+                transitions[(s, a)] = [
+                    (state_index[next_state], probability, mdp.get_reward(state, action, next_state))
+                    for next_state, probability in mdp.get_transitions(state, action)
+                    if probability > 0.0
+                ]
+            state_actions.append(action_ids)
+
+        return cls.from_transitions(states, actions, state_actions, transitions, mdp.get_discount_factor())
+
+    @classmethod
+    def from_transitions(cls, states, actions, state_actions, transitions, discount):
+        """
+        {(s, a): [(next_state_id, probability, reward), ...]} 형태의 transition으로부터 생성
+        """
+        num_actions = len(actions)
+        offsets = [0]
+        next_states = []
+        probabilities = []
+        rewards = []
+        for s in range(len(states)):
+            for a in range(num_actions):
+                for next_state, probability, reward in transitions.get((s, a), ()):
+                    next_states.append(next_state)
+                    probabilities.append(probability)
+                    rewards.append(reward)
+                offsets.append(len(next_states))
+
+        return cls(states, actions, state_actions, offsets, next_states, probabilities, rewards, discount)
+
+    def aggregate(self, key):
+        """
+        상태들을 key(state)가 같은 블록으로 묶은 coarse MDP 생성 (state aggregation)
+
+        P(B'|B, a) = 1/|B| · Σ_(s∈B) P(B'|s, a)
+        R(B, a)    = 1/|B| · Σ_(s∈B) Σ_s' P(s'|s, a)·r(s, a, s')
+
+        터미널 상태는 다른 상태와 묶지 않고 각각 하나의 coarse 터미널 상태가 됩니다.
+        (목표로 들어가는 보상이 블록 내부의 self-loop로 바뀌어 반복 수집되는 것을 막음)
+
+        Returns:
+            coarse: coarse TabularMDP
+            partition: fine 상태 인덱스 → coarse 상태 인덱스 리스트
+        """
+        coarse_states = []
+        coarse_index = {}
+        partition = []
+        for s, state in enumerate(self.states):
+            block = key(state) if self.state_actions[s] else ("terminal", s)
+            if block not in coarse_index:
+                coarse_index[block] = len(coarse_states)
+                coarse_states.append(block)
+            partition.append(coarse_index[block])
+
+        block_sizes = [0] * len(coarse_states)
+        for b in partition:
+            block_sizes[b] += 1
+
+        num_actions = self.num_actions
+        transitions = {}
+        block_actions = [set() for _ in coarse_states]
+        for s in range(self.num_states):
+            b = partition[s]
+            weight = 1.0 / block_sizes[b]
+            for a in self.state_actions[s]:
+                block_actions[b].add(a)
+                k = s * num_actions + a
+                merged = transitions.setdefault((b, a), {})
+                for j in range(self.offsets[k], self.offsets[k + 1]):
+                    next_block = partition[self.next_states[j]]
+                    probability, reward = merged.get(next_block, (0.0, 0.0))
+                    p = weight * self.probabilities[j]
+                    merged[next_block] = (probability + p, reward + p * self.rewards[j])
+
+        coarse_transitions = {
+            pair: [
+                (next_block, probability, reward / probability if probability > 0.0 else 0.0)
+                for next_block, (probability, reward) in merged.items()
+            ]
+            for pair, merged in transitions.items()
+        }
+        state_actions = [sorted(action_ids) for action_ids in block_actions]
+
+        coarse = TabularMDP.from_transitions(
+            coarse_states, self.actions, state_actions, coarse_transitions, self.discount
+        )
+        return coarse, partition
+
+    def q_value(self, values, s, a):
+        """Q(s, a) = Σ p·(r + γ·V[s'])"""
+        k = s * self.num_actions + a
+        total = self.expected_rewards[k]
+        for j in range(self.offsets[k], self.offsets[k + 1]):
+            total += self.discount * self.probabilities[j] * values[self.next_states[j]]
+        return total
+
+    def greedy_actions(self, values):
+        """상태별 argmax_a Q(s, a) 액션 인덱스 리스트 (터미널 상태는 -1)"""
+        greedy = []
+        for s in range(self.num_states):
+            best_action = -1
+            best_value = float("-inf")
+            for a in self.state_actions[s]:
+                q_value = self.q_value(values, s, a)
+                if q_value > best_value:
+                    best_value = q_value
+                    best_action = a
+            greedy.append(best_action)
+        return greedy
+
+    def values_from(self, value_function):
+        """ValueFunction → 상태 인덱스 기반 배열"""
+        return array("d", [value_function.get_value(state) for state in self.states])
+
+    def to_value_function(self, values, value_function):
+        """상태 인덱스 기반 배열의 값을 value_function(TabularValueFunction 등)에 기록"""
+        for s, state in enumerate(self.states):
+            value_function.update(state, values[s])
+        return value_function
+
+    def to_policy(self, action_ids, policy):
+        """액션 인덱스 리스트를 policy(TabularPolicy 등)에 기록 (터미널 상태 -1은 건너뜀)"""
+        for s, a in enumerate(action_ids):
+            if a >= 0:
+                policy.update(self.states[s], self.actions[a])
+        return policy
+
+    # --- MDP 인터페이스 ---
+
+    def get_states(self):
+        return self.states
+
+    def get_actions(self, state):
+        return [self.actions[a] for a in self.state_actions[self.state_index[state]]]
+
+    def get_transitions(self, state, action):
+        k = self.state_index[state] * self.num_actions + self.action_index[action]
+        return [
+            (self.states[self.next_states[j]], self.probabilities[j])
+            for j in range(self.offsets[k], self.offsets[k + 1])
+        ]
+
+    def get_reward(self, state, action, next_state):
+        k = self.state_index[state] * self.num_actions + self.action_index[action]
+        n = self.state_index[next_state]
+        for j in range(self.offsets[k], self.offsets[k + 1]):
+            if self.next_states[j] == n:
+                return self.rewards[j]
+        return 0.0
+
+    def get_discount_factor(self):
+        return self.discount
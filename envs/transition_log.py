@@ -0,0 +1,192 @@
+import ast
+import json
+import struct
+import sys
+from array import array
+from collections import namedtuple
+
+
+# 로그 한 chunk의 컬럼들 (states/next_states는 상태 인덱스, actions는 액션 인덱스)
+TransitionChunk = namedtuple("TransitionChunk", ["states", "actions", "rewards", "next_states", "flags"])
+
+
+class TransitionLogWriter:
+    """
+    (state, action, reward, next_state, done) transition을 chunk 단위 컬럼 형식 파일로 기록
+
+    파일 형식:
+        MAGIC(8바이트) | 헤더 길이(uint32, little-endian) | 헤더(JSON: states, actions, byteorder)
+        | chunk | chunk | ...
+    chunk 형식 (n = chunk의 transition 수):
+        n(uint32) | states(int32 x n) | actions(uint8 x n) | rewards(float64 x n)
+        | next_states(int32 x n) | flags(uint8 x n)
+    flags는 DONE(터미널 도착)과 EPISODE_END(에피소드의 마지막 transition, 잘린 에피소드 포함)의 비트 조합입니다.
+
+    메모리에는 현재 채우고 있는 chunk 하나만 유지합니다.
+
+    사용 예:
+        with TransitionLogWriter("log.bin", env.get_states(), env.ACTIONS) as writer:
+            writer.record(state, action, reward, next_state, done)
+            ...
+            writer.end_episode()
+    """
+
+    MAGIC = b"RLTRANS1"
+    DONE = 1
+    EPISODE_END = 2
+
+    def __init__(self, path, states, actions, chunk_size=4096):
+        """
+        Args:
+            path: 파일 경로 (덮어씀)
+            states: 상태 리스트 (인덱스 → 상태)
+            actions: 액션 리스트 (인덱스 → 액션, 최대 256개)
+            chunk_size: chunk 하나에 담을 transition 수
+        """
+        if len(actions) > 256:
+            raise ValueError(f"TransitionLogWriter supports at most 256 actions: {len(actions)}")
+
+        self.path = path
+        self.states = list(states)
+        self.actions = list(actions)
+        self.state_index = {state: i for i, state in enumerate(self.states)}
+        self.action_index = {action: i for i, action in enumerate(self.actions)}
+        self.chunk_size = chunk_size
+        self.num_transitions = 0
+
+        self._new_chunk()
+        self.file = open(path, "wb")
+        header = json.dumps({
+            "states": [repr(state) for state in self.states],
+            "actions": [repr(action) for action in self.actions],
+            "byteorder": sys.byteorder,
+        }).encode("utf-8")
+        self.file.write(self.MAGIC)
+        self.file.write(struct.pack("<I", len(header)))
+        self.file.write(header)
+
+    def _new_chunk(self):
+        self.chunk = TransitionChunk(array("i"), array("B"), array("d"), array("i"), array("B"))
+
+    def record(self, state, action, reward, next_state, done):
+        """transition 하나 기록 (done이면 에피소드도 끝난 것으로 표시)"""
+        # 가득 찬 chunk는 다음 transition이 들어올 때 씀 (end_episode가 마지막 transition을 수정할 수 있도록)
+        if len(self.chunk.states) >= self.chunk_size:
+            self.flush()
+        chunk = self.chunk
+        chunk.states.append(self.state_index[state])
+        chunk.actions.append(self.action_index[action])
+        chunk.rewards.append(reward)
+        chunk.next_states.append(self.state_index[next_state])
+        chunk.flags.append(self.DONE | self.EPISODE_END if done else 0)
+        self.num_transitions += 1
+
+    def end_episode(self):
+        """마지막 transition을 에피소드 끝으로 표시 (터미널 없이 잘린 에피소드용)"""
+        flags = self.chunk.flags
+        if flags:
+            flags[-1] |= self.EPISODE_END
+
+    def flush(self):
+        """채우고 있는 chunk를 파일에 씀"""
+        chunk = self.chunk
+        if not chunk.states:
+            return
+        self.file.write(struct.pack("<I", len(chunk.states)))
+        for column in chunk:
+            column.tofile(self.file)
+        self._new_chunk()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class TransitionLog:
+    """
+    TransitionLogWriter로 기록한 파일을 generator로 읽는 reader
+
+    - chunks(): chunk 하나씩 TransitionChunk(인덱스 배열들)로 읽음 - 메모리는 chunk 하나 크기
+    - transitions(): (state, action, reward, next_state, done) 튜플 스트림
+    - episodes(): 에피소드 단위 transition 리스트 스트림 - 메모리는 에피소드 하나 크기
+
+    파일 전체를 메모리에 올리지 않으므로 로그 크기와 무관하게 여러 epoch 반복해서 읽을 수 있습니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(TransitionLogWriter.MAGIC)) != TransitionLogWriter.MAGIC:
+                raise ValueError(f"not a transition log file: {path}")
+            (header_length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_length).decode("utf-8"))
+        self.states = [ast.literal_eval(state) for state in header["states"]]
+        self.actions = [ast.literal_eval(action) for action in header["actions"]]
+        self.swap_bytes = header["byteorder"] != sys.byteorder
+        self.offset = len(TransitionLogWriter.MAGIC) + 4 + header_length
+
+    def chunks(self):
+        """TransitionChunk를 하나씩 생성"""
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            while True:
+                size = f.read(4)
+                if len(size) < 4:
+                    return
+                (n,) = struct.unpack("<I", size)
+                chunk = TransitionChunk(array("i"), array("B"), array("d"), array("i"), array("B"))
+                for column in chunk:
+                    column.fromfile(f, n)
+                    if self.swap_bytes:
+                        column.byteswap()
+                yield chunk
+
+    def transitions(self):
+        """(state, action, reward, next_state, done) 튜플을 하나씩 생성"""
+        states = self.states
+        actions = self.actions
+        done_flag = TransitionLogWriter.DONE
+        for chunk in self.chunks():
+            for s, a, reward, next_s, flags in zip(*chunk):
+                yield states[s], actions[a], reward, states[next_s], bool(flags & done_flag)
+
+    def episodes(self):
+        """
+        에피소드를 하나씩 생성
+
+        각 에피소드는 [(state, action, reward, next_state, done), ...] 리스트이며,
+        마지막 transition의 done이 False면 잘린(truncated) 에피소드입니다.
+        """
+        states = self.states
+        actions = self.actions
+        done_flag = TransitionLogWriter.DONE
+        end_flag = TransitionLogWriter.EPISODE_END
+        episode = []
+        for chunk in self.chunks():
+            for s, a, reward, next_s, flags in zip(*chunk):
+                episode.append((states[s], actions[a], reward, states[next_s], bool(flags & done_flag)))
+                if flags & end_flag:
+                    yield episode
+                    episode = []
+        if episode:
+            yield episode
+
+    def __len__(self):
+        """전체 transition 수 (chunk 헤더만 읽음)"""
+        total = 0
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            while True:
+                size = f.read(4)
+                if len(size) < 4:
+                    return total
+                (n,) = struct.unpack("<I", size)
+                total += n
+                # states(4) + actions(1) + rewards(8) + next_states(4) + flags(1)
+                f.seek(18 * n, 1)
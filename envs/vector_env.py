@@ -0,0 +1,87 @@
+import copy
+
+
+class VectorEnv:
+    """
+    같은 환경의 복사본 num_envs개를 묶어 한 번에 step 하는 batched 환경
+
+    - reset(): 모든 복사본을 초기화하고 상태 리스트 반환
+    - step(actions): 각 복사본에 액션을 적용하고 (next_states, rewards, dones) 리스트 반환
+      에피소드가 끝난(done) 복사본은 자동으로 reset 되며, 다음 스텝의 현재 상태는 states 속성에 있음
+    - max_steps 스텝 동안 끝나지 않은 에피소드는 잘라내고(truncated) reset 합니다.
+      (truncated는 터미널이 아니므로 done은 False)
+    - 끝난 에피소드의 (총 보상, 스텝 수)는 pop_completed()로 가져갈 때까지만 보관합니다.
+    """
+
+    def __init__(self, env, num_envs=8, max_steps=1000):
+        """
+        Args:
+            env: 원본 환경 (GridWorld 등) - num_envs개로 복사됨
+            num_envs: 동시에 실행할 환경 수
+            max_steps: 에피소드 최대 스텝 수
+        """
+        self.env = env
+        self.num_envs = num_envs
+        self.max_steps = max_steps
+        self.envs = [copy.deepcopy(env) for _ in range(num_envs)]
+
+        self.states = [None] * num_envs
+        self.episode_steps = [0] * num_envs
+        self.episode_rewards = [0.0] * num_envs
+        self.truncated = [False] * num_envs
+
+        # 끝났지만 아직 pop_completed()로 가져가지 않은 에피소드들의 (총 보상, 스텝 수)
+        self.completed_episodes = []
+
+    def get_states(self):
+        return self.env.get_states()
+
+    def pop_completed(self):
+        """마지막 호출 이후 끝난 에피소드들의 (총 보상, 스텝 수) 리스트를 반환하고 비움"""
+        completed = self.completed_episodes
+        self.completed_episodes = []
+        return completed
+
+    def get_actions(self, state):
+        return self.env.get_actions(state)
+
+    def reset(self):
+        """모든 환경 초기화"""
+        for i, env in enumerate(self.envs):
+            self.states[i] = env.reset()
+            self.episode_steps[i] = 0
+            self.episode_rewards[i] = 0.0
+        return list(self.states)
+
+    def step(self, actions):
+        """
+        Args:
+            actions: 환경별 액션 리스트
+
+        Returns:
+            next_states: 환경별 다음 상태 (reset 전 상태)
+            rewards: 환경별 보상
+            dones: 환경별 터미널 도달 여부
+        """
+        next_states = []
+        rewards = []
+        dones = []
+        for i, env in enumerate(self.envs):
+            next_state, reward, done = env.step(actions[i])
+            next_states.append(next_state)
+            rewards.append(reward)
+            dones.append(done)
+
+            self.episode_steps[i] += 1
+            self.episode_rewards[i] += reward
+            self.truncated[i] = not done and self.episode_steps[i] >= self.max_steps
+
+            if done or self.truncated[i]:
+                self.completed_episodes.append((self.episode_rewards[i], self.episode_steps[i]))
+                self.states[i] = env.reset()
+                self.episode_steps[i] = 0
+                self.episode_rewards[i] = 0.0
+            else:
+                self.states[i] = next_state
+
+        return next_states, rewards, dones
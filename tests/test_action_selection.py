@@ -0,0 +1,132 @@
+from collections import Counter
+from envs import GridWorld
+from agents import (
+    EpsilonGreedy, EpsilonSchedule, RandomStream, QTable, TD0, ValueIteration, TabularValueFunction,
+    TabularPolicy
+)
+
+
+def main():
+    print("=" * 50)
+    print("ε-greedy 액션 선택 테스트")
+    print("=" * 50)
+
+    print("\n[ε 스케줄]")
+    for mode in EpsilonSchedule.MODES:
+        schedule = EpsilonSchedule(start=0.5, end=0.01, decay_steps=100, mode=mode)
+        values = [schedule.value(step) for step in (0, 25, 50, 100, 200)]
+        print(f"  {mode:12s}: " + ", ".join(f"{value:.3f}" for value in values))
+
+    print("\n[동점 액션의 랜덤 tie-breaking (ε=0)]")
+    selector = EpsilonGreedy(epsilon=0.0, rng=RandomStream(0))
+    qtable = QTable()
+    state = (0, 0)
+    actions = ["up", "down", "left", "right"]
+    qtable.update(state, "left", 1.0)
+    qtable.update(state, "right", 1.0)
+    counts = Counter(selector.q_actions(qtable, [state] * 1000, [actions] * 1000))
+    print(f"  Q = {dict((a, qtable.get_q_value(state, a)) for a in actions)}")
+    print(f"  1000번 선택: {dict(counts)}")
+
+    print("\n[ε=0.2 batch 선택]")
+    selector = EpsilonGreedy(epsilon=0.2, rng=RandomStream(0))
+    counts = Counter(selector.q_actions(qtable, [state] * 1000, [actions] * 1000))
+    print(f"  1000번 선택: {dict(counts)}")
+
+
+def test_model_actions():
+    print("\n" + "=" * 50)
+    print("컴파일된 모델 위에서 상태 인덱스 batch 선택")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=6,
+        height=6,
+        goal_states=[(0, 5)],
+        obstacles=[(1, 1), (2, 2), (3, 3)],
+        discount=0.9,
+        start_state=(5, 0)
+    )
+    values = TabularValueFunction()
+    ValueIteration(gridworld, values).value_iteration(theta=1e-6)
+
+    model = gridworld.compile()
+    value_array = model.values_from(values)
+    selector = EpsilonGreedy(epsilon=0.0, rng=RandomStream(0))
+    state_ids = list(range(model.num_states))
+    action_ids = selector.model_actions(model, value_array, state_ids)
+
+    optimal = sum(
+        1 for s, a in zip(state_ids, action_ids)
+        if a >= 0 and model.q_value(value_array, s, a) == max(
+            model.q_value(value_array, s, b) for b in model.state_actions[s]
+        )
+    )
+    print(f"\n상태 수: {model.num_states}, 터미널: {list(action_ids).count(-1)}")
+    print(f"argmax Q(s, a)를 고른 상태 수: {optimal}")
+
+    policy = model.to_policy(action_ids, TabularPolicy(default_action=None))
+    gridworld.print_policy(policy)
+
+
+def test_epsilon_schedule_td0():
+    print("\n" + "=" * 50)
+    print("ε 스케줄을 사용한 TD(0) 학습 (6x6)")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=6,
+        height=6,
+        goal_states=[(0, 5)],
+        obstacles=[(1, 1), (2, 2), (3, 3)],
+        discount=0.9,
+        start_state=(5, 0)
+    )
+
+    for epsilon in [0.3, EpsilonSchedule(start=0.5, end=0.01, decay_steps=300, mode="exponential")]:
+        td0 = TD0(env=gridworld, alpha=0.1, epsilon=epsilon, gamma=0.9, seed=0)
+        td0.train(num_episodes=500, verbose=False)
+        steps = [td0.run_episode()[1] for _ in range(20)]
+        print(f"\nε = {epsilon}")
+        print(f"  학습 후 ε: {td0.action_selector.epsilon:.3f}")
+        print(f"  평균 에피소드 길이 (20 에피소드): {sum(steps) / len(steps):.1f}")
+
+
+def test_tie_breaking():
+    print("\n" + "=" * 50)
+    print("QTable / extract_policy의 tolerance 동점 처리")
+    print("=" * 50)
+
+    actions = ["up", "down", "left", "right"]
+    states = [(row, 0) for row in range(1000)]
+    for rng, tolerance in [(None, 0.0), (RandomStream(0), 0.0), (RandomStream(0), 1e-3)]:
+        qtable = QTable(alpha=1.0, rng=rng, tolerance=tolerance)
+        for state in states:
+            qtable.update(state, "left", 1.0)
+            qtable.update(state, "right", 1.0 - 1e-4)
+        counts = Counter(qtable.get_best_actions(states, [actions] * len(states)))
+        label = "첫 번째 최대" if rng is None else "랜덤"
+        print(f"  {label}, tolerance={tolerance}: {dict(counts)}")
+
+    # 모든 값이 0인 초기 가치 함수에서 추출한 정책
+    gridworld = GridWorld(
+        width=6,
+        height=6,
+        goal_states=[(0, 5)],
+        obstacles=[],
+        discount=0.9,
+        start_state=(5, 0)
+    )
+    values = TabularValueFunction()
+    for rng in [None, RandomStream(0)]:
+        policy = values.extract_policy(gridworld, rng=rng)
+        label = "첫 번째 최대" if rng is None else "랜덤"
+        print(f"\n초기 가치 함수의 정책 ({label})")
+        gridworld.print_policy(policy)
+
+
+if __name__ == "__main__":
+    main()
+    test_model_actions()
+    test_epsilon_schedule_td0()
+    test_tie_breaking()
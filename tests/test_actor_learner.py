@@ -0,0 +1,90 @@
+import asyncio
+import multiprocessing
+import time
+from envs import GridWorld
+from agents import ActorLearner, MonteCarlo, OffPolicyMonteCarlo, TD0, TDLambda, TabularValueFunction, ValueIteration
+from agents.actor_learner import _publish_latest
+
+
+class SlowGridWorld(GridWorld):
+    """step마다 느린 외부 서비스를 기다리는 환경 (async_step으로 기다리는 동안 다른 actor가 실행됨)"""
+
+    def __init__(self, latency=0.001, **kwargs):
+        super().__init__(**kwargs)
+        self.latency = latency
+
+    async def async_step(self, action):
+        await asyncio.sleep(self.latency)
+        return self.step(action)
+
+
+def make_gridworld(cls=GridWorld, **kwargs):
+    return cls(
+        width=6,
+        height=6,
+        goal_states=[(0, 5)],
+        obstacles=[(1, 1), (2, 3), (3, 3), (4, 1)],
+        discount=0.95,
+        start_state=(5, 0),
+        **kwargs
+    )
+
+
+def main():
+    print("=" * 50)
+    print("Actor-Learner 테스트 (6x6)")
+    print("=" * 50)
+
+    gridworld = make_gridworld()
+    values = TabularValueFunction()
+    ValueIteration(gridworld, values).value_iteration(theta=1e-6)
+    print(f"\nV*{gridworld.start_state} = {values.get_value(gridworld.start_state):.4f}")
+
+    print("\n[asyncio actor - 느린 환경 (step당 1ms), TD(0) 300 에피소드]")
+    slow_gridworld = make_gridworld(SlowGridWorld, latency=0.001)
+    for num_actors in [1, 4, 16]:
+        agent = TD0(env=slow_gridworld, alpha=0.2, epsilon=0.1, gamma=0.95, max_steps=200, seed=0)
+        runner = ActorLearner(agent, num_actors=num_actors, queue_size=32, batch_size=8, seed=0)
+        start = time.perf_counter()
+        policy, rewards = runner.run(num_episodes=300)
+        elapsed = time.perf_counter() - start
+        value = agent.get_value_function().get_value(gridworld.start_state)
+        print(f"  actor {num_actors:>2}개: {elapsed:.2f}s, 업데이트 {runner.num_updates}회 "
+              f"(최대 batch {runner.max_batch_size}), 배포 {runner.num_publishes}회, "
+              f"V{gridworld.start_state} = {value:.4f}")
+
+    print("\n[asyncio actor - TD(λ=0.8) 300 에피소드]")
+    agent = TDLambda(env=gridworld, alpha=0.1, epsilon=0.1, gamma=0.95, lambda_=0.8, max_steps=200, seed=0)
+    runner = ActorLearner(agent, num_actors=4, publish_interval=2, seed=0)
+    policy, rewards = runner.run(num_episodes=300)
+    print(f"  V{gridworld.start_state} = {agent.get_value_function().get_value(gridworld.start_state):.4f}, "
+          f"배포 {runner.num_publishes}회")
+
+    print("\n[파라미터 큐 (maxsize=1) - 연속 배포 후 남은 스냅샷]")
+    parameter_queue = multiprocessing.get_context().Queue(maxsize=1)
+    for version in range(20):
+        _publish_latest(parameter_queue, {"version": version})
+    latest = parameter_queue.get(timeout=1.0)
+    print(f"  20번 배포 후 actor가 받는 스냅샷: {latest}, 최신과 같음: {latest == {'version': 19}}")
+
+    print("\n[process actor - Monte Carlo 2000 에피소드]")
+    agent = MonteCarlo(env=gridworld, epsilon=0.1, discount=0.95, max_steps=200, seed=0)
+    runner = ActorLearner(agent, num_actors=2, queue_size=64, batch_size=16, mode="process", seed=0)
+    start = time.perf_counter()
+    policy, rewards = runner.run(num_episodes=2000)
+    elapsed = time.perf_counter() - start
+    value = agent.get_value_function().get_value(gridworld.start_state)
+    print(f"  {elapsed:.2f}s, 업데이트 {runner.num_updates}회, V{gridworld.start_state} = {value:.4f}")
+    print(f"  평균 보상 (마지막 100): {sum(rewards[-100:]) / 100:.3f}")
+    gridworld.print_policy(policy)
+
+    print("\n[asyncio actor - Off-policy Monte Carlo 2000 에피소드]")
+    agent = OffPolicyMonteCarlo(env=gridworld, epsilon=0.3, discount=0.95, max_steps=200, seed=0)
+    runner = ActorLearner(agent, num_actors=4, batch_size=16, seed=0)
+    policy, rewards = runner.run(num_episodes=2000)
+    value = agent.get_value_function().get_value(gridworld.start_state)
+    print(f"  업데이트 {runner.num_updates}회, V{gridworld.start_state} = {value:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import os
+import tempfile
+import time
+from array import array
+from envs import GridWorld
+from agents import (
+    ValueIteration, TabularValueFunction, CompactPolicy, PolicyLookupService
+)
+
+
+def main():
+    print("=" * 50)
+    print("Compact Policy 테스트 (20x20)")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=20,
+        height=20,
+        goal_states=[(0, 19)],
+        obstacles=[(row, 10) for row in range(2, 18)] + [(10, col) for col in range(3, 10)],
+        discount=0.95,
+        start_state=(19, 0)
+    )
+
+    values = TabularValueFunction()
+    ValueIteration(gridworld, values).value_iteration(max_iterations=1000, theta=1e-6)
+    policy = values.extract_policy(gridworld)
+
+    states = gridworld.get_states()
+    compact = CompactPolicy.from_policy(policy, states, gridworld.ACTIONS)
+    same = all(compact.select_action(state) == policy.select_action(state, gridworld.ACTIONS)
+               for state in states)
+    print(f"\n상태 수: {len(states)}, 코드 배열 크기: {len(compact.codes)} bytes")
+    print(f"TabularPolicy와 같은 액션: {same}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "policy.bin")
+        compact.save(path)
+        print(f"파일 크기: {os.path.getsize(path)} bytes")
+
+        loaded = CompactPolicy.load(path)
+        same = all(loaded.select_action(state) == compact.select_action(state) for state in states)
+        print(f"mmap으로 불러온 정책과 같은 액션: {same}")
+
+        gridworld.print_policy(loaded)
+        del loaded
+
+
+def test_lookup_service():
+    print("\n" + "=" * 50)
+    print("Policy Lookup Service - batch 질의")
+    print("=" * 50)
+
+    service = PolicyLookupService()
+    gridworlds = {
+        "open": GridWorld(width=10, height=10, goal_states=[(0, 9)], obstacles=[],
+                          discount=0.9, start_state=(9, 0)),
+        "wall": GridWorld(width=10, height=10, goal_states=[(0, 9)],
+                          obstacles=[(row, 5) for row in range(1, 10)],
+                          discount=0.9, start_state=(9, 0)),
+    }
+    tabular_policies = {}
+    for name, gridworld in gridworlds.items():
+        values = TabularValueFunction()
+        ValueIteration(gridworld, values).value_iteration(theta=1e-6)
+        tabular_policies[name] = values.extract_policy(gridworld)
+        service.register(
+            name, CompactPolicy.from_policy(tabular_policies[name], gridworld.get_states(), gridworld.ACTIONS)
+        )
+
+    # 한 tick에 10000개 에이전트의 질의
+    queries = []
+    for i in range(10000):
+        name = "open" if i % 2 else "wall"
+        states = gridworlds[name].get_states()
+        queries.append((name, states[(i * 7) % len(states)]))
+
+    start = time.perf_counter()
+    actions = service.tick(queries)
+    service_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [
+        tabular_policies[name].select_action(state, gridworlds[name].ACTIONS)
+        for name, state in queries
+    ]
+    tabular_time = time.perf_counter() - start
+
+    # 상태 인덱스로 질의하는 경로 (에이전트가 상태 인덱스를 들고 있는 경우)
+    policy = service.policies["open"]
+    state_ids = [(i * 7) % len(policy.states) for i in range(10000)]
+    start = time.perf_counter()
+    codes = service.select_action_ids("open", state_ids)
+    id_time = time.perf_counter() - start
+    same_ids = [
+        None if code == CompactPolicy.NO_ACTION else policy.actions[code] for code in codes
+    ] == policy.select_actions(
+        [policy.states[i] for i in state_ids]
+    )
+
+    print(f"\n질의 수: {len(queries)}")
+    print(f"tick 결과가 TabularPolicy와 같음: {actions == expected}")
+    print(f"PolicyLookupService.tick: {service_time * 1000:.2f} ms")
+    print(f"TabularPolicy 개별 조회: {tabular_time * 1000:.2f} ms")
+    print(f"상태 인덱스 batch 질의 ({len(state_ids)}개): {id_time * 1000:.2f} ms, 결과 일치: {same_ids}")
+
+    # 등록된 정책이 많아도 작은 tick의 비용은 질의 수에만 비례
+    small_queries = queries[:10]
+    start = time.perf_counter()
+    for _ in range(1000):
+        service.tick(small_queries)
+    few_time = time.perf_counter() - start
+    open_policy = service.policies["open"]
+    for i in range(1000):
+        service.register(f"extra_{i}", CompactPolicy(open_policy.states, open_policy.actions, array("B", open_policy.codes)))
+    start = time.perf_counter()
+    for _ in range(1000):
+        small_actions = service.tick(small_queries)
+    many_time = time.perf_counter() - start
+    print(f"질의 10개 tick (정책 2개 / {len(service.policies)}개 등록): "
+          f"{few_time * 1000:.2f}µs / {many_time * 1000:.2f}µs, 결과 일치: {small_actions == expected[:10]}")
+
+    # update()로 추가한 새 액션도 batch 조회에 반영
+    extra = service.policies["extra_0"]
+    extra.update((0, 0), "stay")
+    print(f"update 후 새 액션 조회: {service.tick([('extra_0', (0, 0))])}")
+
+
+if __name__ == "__main__":
+    main()
+    test_lookup_service()
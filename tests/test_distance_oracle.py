@@ -0,0 +1,78 @@
+import os
+import tempfile
+import time
+from envs import GridWorld
+from agents import DistanceOracle, TabularValueFunction, ValueIteration
+
+
+def make_gridworld(goal_states, **kwargs):
+    return GridWorld(
+        width=20,
+        height=20,
+        goal_states=goal_states,
+        obstacles=[(row, 6) for row in range(0, 15)] + [(row, 13) for row in range(5, 20)],
+        discount=0.95,
+        start_state=(19, 0),
+        **kwargs
+    )
+
+
+def main():
+    print("=" * 50)
+    print("Distance Oracle 테스트 (20x20)")
+    print("=" * 50)
+
+    goals = [(0, 19), (19, 19), (10, 10), (0, 0)]
+    for label, kwargs in [
+        ("보상 +1만", {}),
+        ("step cost 0.02 + 위험 셀", {"step_cost": 0.02, "hazards": {(16, 3): -1.0, (3, 16): -0.1}}),
+    ]:
+        gridworld = make_gridworld(goals[:1], **kwargs)
+        print(f"\n[{label}]")
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            start = time.perf_counter()
+            oracle = DistanceOracle(gridworld, goals=goals, cache_dir=cache_dir)
+            build_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            cached = DistanceOracle(gridworld, goals=goals, cache_dir=cache_dir)
+            load_time = time.perf_counter() - start
+            print(f"  사전 계산 (목표 {len(goals)}개): {build_time * 1000:.1f}ms, "
+                  f"캐시에서 불러오기: {load_time * 1000:.1f}ms (from cache: {cached.loaded_from_cache})")
+            print(f"  캐시 파일: {os.listdir(cache_dir)[0][:16]}...")
+
+        # 목표마다 ValueIteration과 비교
+        max_error = 0.0
+        start = time.perf_counter()
+        for goal in goals:
+            env = make_gridworld([goal], **kwargs)
+            values = TabularValueFunction()
+            ValueIteration(env, values).value_iteration(max_iterations=1000, theta=1e-9)
+            max_error = max(max_error, max(
+                abs(values.get_value(state) - oracle.value(state, goal)) for state in env.get_states()
+            ))
+        vi_time = time.perf_counter() - start
+        print(f"  ValueIteration x {len(goals)}: {vi_time:.2f}s, 최대 오차: {max_error:.2e}")
+
+        # 질의 지연 시간
+        states = gridworld.get_states()
+        num_queries = 100000
+        start = time.perf_counter()
+        for i in range(num_queries):
+            oracle.value(states[i % len(states)], (10, 10))
+        value_latency = (time.perf_counter() - start) / num_queries
+        start = time.perf_counter()
+        for i in range(num_queries):
+            oracle.action(states[i % len(states)], (10, 10))
+        action_latency = (time.perf_counter() - start) / num_queries
+        print(f"  질의 지연: V* {value_latency * 1e6:.2f}µs, π* {action_latency * 1e6:.2f}µs")
+        print(f"  d((19, 0) → (0, 19)) = {oracle.distance((19, 0), (0, 19))}, "
+              f"V* = {oracle.value((19, 0), (0, 19)):.4f}")
+
+    print(f"\n[목표 (10, 10) 최적 정책 - {label}]")
+    make_gridworld([(10, 10)], **kwargs).print_policy(oracle.get_policy((10, 10)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import time
+from envs import GridWorld
+from agents import DynaQ, TabularValueFunction, ValueIteration
+
+
+def main():
+    print("=" * 50)
+    print("Dyna-Q 테스트 (10x10)")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=10,
+        height=10,
+        goal_states=[(0, 9)],
+        obstacles=[
+            (2, 1), (2, 2), (2, 3),
+            (4, 3), (4, 4), (4, 5),
+            (6, 5), (6, 6), (6, 7),
+            (8, 7), (8, 8),
+            (3, 8), (5, 2)
+        ],
+        discount=0.95,
+        start_state=(9, 0)
+    )
+
+    values = TabularValueFunction()
+    ValueIteration(gridworld, values).value_iteration(theta=1e-6)
+    optimal_value = values.get_value(gridworld.start_state)
+    print(f"\nV*{gridworld.start_state} = {optimal_value:.4f}")
+
+    print("\n[planning_steps별 비교 - 50 에피소드]")
+    for planning_steps in [0, 5, 20, 50]:
+        agent = DynaQ(
+            env=gridworld,
+            alpha=0.5,
+            epsilon=0.1,
+            gamma=0.95,
+            planning_steps=planning_steps,
+            seed=0
+        )
+        start = time.perf_counter()
+        policy, episode_rewards = agent.train(num_episodes=50, verbose=False)
+        elapsed = time.perf_counter() - start
+
+        value = agent.get_value_function().get_value(gridworld.start_state)
+        print(f"  k={planning_steps:2d}: 실제 스텝 {agent.num_real_steps:6d}, "
+              f"planning backup {agent.num_planning_backups:7d}, "
+              f"V{gridworld.start_state} = {value:.4f}, 시간 {elapsed:.2f}s")
+
+    print("\n[k=50으로 학습한 정책]")
+    gridworld.print_policy(policy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+import os
+import tempfile
+import time
+from envs import GridWorld
+from agents import TDLambda, HyperparameterSweep, StepBudget, EpsilonSchedule
+
+
+START_STATE = (5, 0)
+
+
+def start_value(agent):
+    """학습된 가치 함수의 V(시작 상태) - 프로세스 풀로 넘기기 위해 모듈 최상위 함수"""
+    return agent.get_value_function().get_value(START_STATE)
+
+
+def main():
+    print("=" * 50)
+    print("Hyperparameter Sweep 테스트 (TD(λ), 6x6)")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=6,
+        height=6,
+        goal_states=[(0, 5)],
+        obstacles=[(1, 1), (2, 2), (3, 3)],
+        discount=0.9,
+        start_state=START_STATE
+    )
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        sweep = HyperparameterSweep(
+            TDLambda,
+            gridworld,
+            param_grid={"alpha": [0.05, 0.2], "lambda_": [0.0, 0.8]},
+            seeds=[0, 1, 2],
+            num_episodes=300,
+            cache_dir=cache_dir,
+            num_workers=4,
+            fixed_params={"epsilon": 0.1, "gamma": 0.9},
+            evaluate=start_value,
+        )
+
+        print(f"\n[Sweep 실행 - trial {len(sweep.trials())}개, 프로세스 4개]")
+        start = time.perf_counter()
+        results = sweep.run(verbose=True)
+        elapsed = time.perf_counter() - start
+        print(f"실행 시간: {elapsed:.2f}s, 캐시 파일 수: {len(os.listdir(cache_dir))}")
+
+        print("\n[결과 집계 - seed 평균]")
+        for summary in sorted(sweep.aggregate(results), key=lambda s: -s["mean_score"]):
+            print(f"  alpha={summary['params']['alpha']}, lambda={summary['params']['lambda_']}: "
+                  f"V{START_STATE} = {summary['mean_score']:.4f}, "
+                  f"평균 보상 (최근 100 에피소드) {summary['final_reward']:.3f} "
+                  f"(seed {summary['num_seeds']}개)")
+
+        print("\n[다시 실행 - 캐시된 결과 사용]")
+        start = time.perf_counter()
+        cached_results = sweep.run(verbose=True)
+        elapsed = time.perf_counter() - start
+        print(f"실행 시간: {elapsed:.2f}s")
+        print(f"결과 동일: {cached_results == results}")
+
+        print("\n[같은 seed로 다시 학습 - 재현성 확인]")
+        fresh = HyperparameterSweep(
+            TDLambda,
+            gridworld,
+            param_grid={"alpha": [0.2], "lambda_": [0.8]},
+            seeds=[1],
+            num_episodes=300,
+            num_workers=1,
+            fixed_params={"epsilon": 0.1, "gamma": 0.9},
+        ).run()
+        previous = [r for r in results if r["params"] == fresh[0]["params"] and r["seed"] == 1]
+        print(f"learning curve 동일: {previous[0]['episode_rewards'] == fresh[0]['episode_rewards']}")
+
+
+def test_reward_map_sweep():
+    print("\n" + "=" * 50)
+    print("보상 맵(위험 셀, cell_rewards) GridWorld Sweep 테스트")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=6,
+        height=6,
+        goal_states=[(0, 5)],
+        obstacles=[(1, 1), (3, 3)],
+        hazards={(2, 2): -1.0, (4, 4): -1.0},
+        cell_rewards={(5, 2): -0.5},
+        step_cost=0.01,
+        discount=0.9,
+        start_state=START_STATE
+    )
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        sweep = HyperparameterSweep(
+            TDLambda,
+            gridworld,
+            param_grid={"alpha": [0.1, 0.2]},
+            seeds=[0, 1],
+            num_episodes=200,
+            cache_dir=cache_dir,
+            num_workers=1,
+            fixed_params={"epsilon": 0.1, "gamma": 0.9},
+            evaluate=start_value,
+        )
+        results = sweep.run(verbose=True)
+        for summary in sweep.aggregate(results):
+            print(f"  alpha={summary['params']['alpha']}: V{START_STATE} = {summary['mean_score']:.4f}")
+
+        cached_results = sweep.run(verbose=True)
+        print(f"캐시된 결과 동일: {cached_results == results}")
+
+        moved = GridWorld(
+            width=6,
+            height=6,
+            goal_states=[(0, 5)],
+            obstacles=[(1, 1), (3, 3)],
+            hazards={(2, 3): -1.0, (4, 4): -1.0},
+            cell_rewards={(5, 2): -0.5},
+            step_cost=0.01,
+            discount=0.9,
+            start_state=START_STATE
+        )
+        params = {"alpha": 0.1, "epsilon": 0.1, "gamma": 0.9}
+        other = HyperparameterSweep(TDLambda, moved, param_grid={"alpha": [0.1]})
+        print(f"위험 셀 위치가 다르면 다른 해시: "
+              f"{sweep.config_hash(params, 0) != other.config_hash(params, 0)}")
+
+
+def test_parameter_objects():
+    print("\n" + "=" * 50)
+    print("파라미터 객체(StepBudget, EpsilonSchedule) Sweep 테스트")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=6,
+        height=6,
+        goal_states=[(0, 5)],
+        obstacles=[(1, 1), (2, 2), (3, 3)],
+        discount=0.9,
+        start_state=START_STATE
+    )
+    sweep = HyperparameterSweep(TDLambda, gridworld, param_grid={})
+
+    # 파라미터 값이 객체(StepBudget, EpsilonSchedule)여도 해시는 실행마다 같아야 캐시가 재사용됨
+    params = {"max_steps": StepBudget(200, adaptive=True), "epsilon": EpsilonSchedule(0.3, 0.05, 100, "linear")}
+    same_params = {"max_steps": StepBudget(200, adaptive=True), "epsilon": EpsilonSchedule(0.3, 0.05, 100, "linear")}
+    print(f"같은 설정의 파라미터 객체 → 같은 해시: "
+          f"{sweep.config_hash(params, 0) == sweep.config_hash(same_params, 0)}")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        sweep = HyperparameterSweep(
+            TDLambda,
+            gridworld,
+            param_grid={"max_steps": [StepBudget(200, adaptive=True, min_steps=50)]},
+            seeds=[0, 1],
+            num_episodes=100,
+            cache_dir=cache_dir,
+            num_workers=1,
+        )
+        sweep.run()
+        print("StepBudget 파라미터 sweep 다시 실행 → 캐시 사용: ", end="")
+        sweep.run(verbose=True)
+
+
+if __name__ == "__main__":
+    main()
+    test_reward_map_sweep()
+    test_parameter_objects()
@@ -0,0 +1,61 @@
+from envs import GridWorld
+from agents import TabularValueFunction, ValueIteration, IncrementalReplanner
+
+
+def main():
+    print("=" * 50)
+    print("Incremental Replanning 테스트 (10x10)")
+    print("=" * 50)
+
+    # 10x10 Grid World - 가운데 통로가 있는 벽
+    gridworld = GridWorld(
+        width=10,
+        height=10,
+        goal_states=[(0, 9)],
+        obstacles=[
+            # 가로 벽 (4열에 통로)
+            (5, 0), (5, 1), (5, 2), (5, 3), (5, 5), (5, 6), (5, 7), (5, 8)
+        ],
+        discount=0.95,
+        start_state=(9, 0)
+    )
+
+    print("\n[Grid World 설정]")
+    print(f"크기: {gridworld.width} x {gridworld.height}")
+    print(f"목표 상태: {gridworld.goal_states}")
+    print(f"장애물: {gridworld.obstacles}")
+
+    replanner = IncrementalReplanner(gridworld, theta=0.0001)
+    iterations = replanner.plan()
+    print(f"\n[최초 계획] 수렴까지 반복 횟수: {iterations}")
+    gridworld.print_policy(replanner.extract_policy())
+
+    # 통로를 막음
+    backups = replanner.update_map(add_obstacles=[(5, 4)])
+    print(f"[장애물 추가 (5, 4)] backup 횟수: {backups}")
+    gridworld.print_policy(replanner.extract_policy())
+
+    # 반대쪽 끝에 새 통로를 염
+    backups = replanner.update_map(remove_obstacles=[(5, 8)])
+    print(f"[장애물 제거 (5, 8)] backup 횟수: {backups}")
+    gridworld.print_policy(replanner.extract_policy())
+
+    # 목표 이동
+    backups = replanner.update_map(remove_goals=[(0, 9)], add_goals=[(0, 0)])
+    print(f"[목표 이동 (0, 9) -> (0, 0)] backup 횟수: {backups}")
+    gridworld.print_values(replanner.values)
+    gridworld.print_policy(replanner.extract_policy())
+
+    # 전체 재계산과 비교
+    values = TabularValueFunction(default_value=0.0)
+    vi = ValueIteration(gridworld, values)
+    vi.value_iteration(max_iterations=200, theta=0.0001)
+    max_error = max(
+        abs(values.get_value(state) - replanner.values.get_value(state))
+        for state in gridworld.get_states()
+    )
+    print(f"[전체 Value Iteration 대비 최대 오차] {max_error:.6f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from envs import GridWorld
+from agents import LearningMetrics, MonteCarlo, QLearning, QuantileSketch, TD0, TDLambda
+
+
+def test_streaming_accuracy():
+    print("=" * 50)
+    print("스트리밍 지표 정확도 / 메모리 (100만 에피소드 흉내)")
+    print("=" * 50)
+
+    rng = random.Random(0)
+    num_episodes = 1000000
+    returns = [rng.gauss(0.5, 0.2) for _ in range(num_episodes)]
+
+    metrics = LearningMetrics(window=100, quantiles=(0.5, 0.9, 0.99))
+    start = time.perf_counter()
+    for episode_return in returns:
+        metrics.record(episode_return, 10)
+    elapsed = time.perf_counter() - start
+
+    # 기록 중 늘어나는 메모리 (보상 리스트라면 에피소드 수에 비례)
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for episode_return in returns[:100000]:
+        metrics.record(episode_return, 10)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"\nrecord {num_episodes}회: {elapsed:.2f}s ({elapsed / num_episodes * 1e6:.2f}µs/에피소드)")
+    print(f"10만 에피소드 추가 기록 후 늘어난 메모리: {(after - before) / 1024:.1f}KB "
+          f"(보상 리스트였다면 ~{100000 * 8 / 1024:.0f}KB 이상)")
+
+    returns = returns + returns[:100000]
+    num_episodes = len(returns)
+    summary = metrics.summary()
+    exact_mean = sum(returns[-100:]) / 100
+    ordered = sorted(returns)
+    print(f"최근 100 평균: {summary['return_mean']:.6f} (정확한 값 {exact_mean:.6f})")
+    for q in metrics.quantiles:
+        name = f"return_p{q * 100:g}"
+        print(f"{name:<11}: {summary[name]:.4f} (정확한 값 {ordered[int(q * num_episodes)]:.4f})")
+
+    # 학습 초반에만 긴 에피소드가 나오는 (분포가 바뀌는) 에피소드 길이
+    lengths = [rng.randint(100, 1000) for _ in range(300)] + [rng.randint(10, 20) for _ in range(30000)]
+    sketch = QuantileSketch()
+    for length in lengths:
+        sketch.update(length)
+    ordered = sorted(lengths)
+    print(f"분포가 바뀌는 길이의 p90 / p99.5: {sketch.quantile(0.9):.1f} / {sketch.quantile(0.995):.1f} "
+          f"(정확한 값 {ordered[int(0.9 * len(lengths))]} / {ordered[int(0.995 * len(lengths))]}), "
+          f"bucket 수: {len(sketch.positive)}")
+
+
+def main():
+    print("\n" + "=" * 50)
+    print("에이전트 학습 지표 기록 테스트 (6x6)")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=6,
+        height=6,
+        goal_states=[(0, 5)],
+        obstacles=[(1, 1), (2, 2), (3, 3), (1, 4)],
+        discount=0.9,
+        start_state=(5, 0)
+    )
+
+    with tempfile.TemporaryDirectory() as metrics_dir:
+        for label, agent, num_episodes in [
+            ("TD(0)", TD0(env=gridworld, alpha=0.1, epsilon=0.1, gamma=0.9, seed=0), 2000),
+            ("TD(λ)", TDLambda(env=gridworld, alpha=0.1, epsilon=0.1, gamma=0.9, lambda_=0.8, seed=0), 2000),
+            ("Q-learning", QLearning(env=gridworld, alpha=0.1, epsilon=0.1, gamma=0.9, seed=0), 2000),
+            ("Monte Carlo", MonteCarlo(env=gridworld, epsilon=0.1, discount=0.9, seed=0), 2000),
+        ]:
+            path = os.path.join(metrics_dir, f"{label}.metrics")
+            metrics = LearningMetrics(window=100, path=path, flush_interval=500)
+            agent.train(num_episodes=num_episodes, metrics=metrics)
+
+            rows = LearningMetrics.read(path)
+            print(f"\n[{label}] 파일 크기: {os.path.getsize(path)} bytes, 기록된 행: {len(rows)}")
+            for row in rows:
+                print(f"  episodes {int(row['episodes']):>5}: return 평균 {row['return_mean']:.3f} "
+                      f"(EMA {row['return_ema']:.3f}, p50 {row['return_p50']:.3f}), "
+                      f"길이 평균 {row['length_mean']:.1f} (p90 {row['length_p90']:.1f})")
+
+    print("\n[verbose 출력 - 최근 평균은 ring buffer에서 계산]")
+    TD0(env=gridworld, alpha=0.1, epsilon=0.1, gamma=0.9, seed=0).train(num_episodes=300, verbose=True)
+
+
+if __name__ == "__main__":
+    test_streaming_accuracy()
+    main()
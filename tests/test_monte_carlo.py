@@ -1,5 +1,7 @@
+import time
 from envs import GridWorld
-from agents import MonteCarlo
+from agents import (MonteCarlo, OffPolicyMonteCarlo, StepBudget, TabularStochasticPolicy,
+                    TabularValueFunction, ValueIteration)
 
 
 def main():
@@ -173,7 +175,127 @@ def test_every_visit_mc():
     gridworld.print_values(value_function)
 
 
+def test_step_budget():
+    print("\n" + "=" * 50)
+    print("Step cap / truncation 테스트 (20x20)")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=20,
+        height=20,
+        goal_states=[(0, 19)],
+        obstacles=[(row, 10) for row in range(2, 20)],
+        discount=0.95,
+        start_state=(19, 0)
+    )
+
+    for label, max_steps in [
+        ("고정 cap 1000", 1000),
+        ("적응형 cap 100~1000", StepBudget(max_steps=1000, adaptive=True, min_steps=100)),
+    ]:
+        mc = MonteCarlo(env=gridworld, epsilon=0.1, discount=0.95, max_steps=max_steps, seed=0)
+        start = time.perf_counter()
+        mc.train(num_episodes=500, verbose=False)
+        elapsed = time.perf_counter() - start
+
+        stats = mc.step_budget.stats()
+        value = mc.get_value_function().get_value(gridworld.start_state)
+        print(f"\n[{label}]")
+        print(f"  학습 시간: {elapsed:.2f}s, 총 스텝: {stats['total_steps']}, "
+              f"평균 에피소드 길이: {stats['mean_steps']:.1f}")
+        print(f"  잘린 에피소드: {stats['truncated']}/{stats['episodes']} "
+              f"({stats['truncation_rate']:.1%}), 최종 cap: {stats['cap']}")
+        print(f"  V{gridworld.start_state} = {value:.4f}")
+
+
+def test_off_policy_mc():
+    print("\n" + "=" * 50)
+    print("Off-policy Monte Carlo (Weighted Importance Sampling) 테스트 (6x6)")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=6,
+        height=6,
+        goal_states=[(0, 5)],
+        obstacles=[(1, 1), (2, 3), (3, 3), (4, 1)],
+        discount=0.95,
+        start_state=(5, 0)
+    )
+
+    values = TabularValueFunction()
+    ValueIteration(gridworld, values).value_iteration(theta=1e-6)
+    print(f"\nV*{gridworld.start_state} = {values.get_value(gridworld.start_state):.4f}")
+
+    # 1. ε-greedy behavior policy로 greedy target policy 학습
+    mc = OffPolicyMonteCarlo(env=gridworld, epsilon=0.3, discount=0.95, seed=0)
+    start = time.perf_counter()
+    policy = mc.train(num_episodes=3000, verbose=False)
+    elapsed = time.perf_counter() - start
+
+    print("\n[ε-greedy behavior (ε=0.3) - 3000 에피소드]")
+    print(f"  학습 시간: {elapsed:.2f}s")
+    print(f"  역방향 계산 스텝: {mc.num_backward_steps}/{mc.num_episode_steps} "
+          f"({mc.num_backward_steps / mc.num_episode_steps:.1%})")
+    print(f"  V{gridworld.start_state} = {mc.get_value_function().get_value(gridworld.start_state):.4f}")
+    gridworld.print_policy(policy)
+
+    # 2. 로그 데이터로 학습: 최적 정책을 ε=0.5로 섞은 운영 정책의 (s, a, r, b(a|s)) 로그
+    operator_policy = TabularStochasticPolicy(seed=1)
+    optimal_policy = values.extract_policy(gridworld)
+    for state in gridworld.get_states():
+        actions = gridworld.get_actions(state)
+        if actions:
+            operator_policy.set_epsilon_soft(state, actions, optimal_policy.select_action(state, actions), 0.5)
+
+    episodes = []
+    for _ in range(3000):
+        logged_episode = []
+        state = gridworld.reset()
+        for _ in range(1000):
+            actions = gridworld.get_actions(state)
+            if not actions:
+                break
+            action = operator_policy.select_action(state, actions)
+            next_state, reward, done = gridworld.step(action)
+            logged_episode.append((state, action, reward, operator_policy.get_probability(state, action)))
+            if done:
+                break
+            state = next_state
+        episodes.append(logged_episode)
+
+    mc = OffPolicyMonteCarlo(env=gridworld, discount=0.95, seed=0)
+    policy = mc.train_from_log(episodes)
+
+    print("\n[운영 정책 로그 (ε=0.5) - 3000 에피소드]")
+    print(f"  역방향 계산 스텝: {mc.num_backward_steps}/{mc.num_episode_steps} "
+          f"({mc.num_backward_steps / mc.num_episode_steps:.1%})")
+    print(f"  V{gridworld.start_state} = {mc.get_value_function().get_value(gridworld.start_state):.4f}")
+    gridworld.print_policy(policy)
+
+    # 3. (state, action, reward, next_state, done) 에피소드 batch - b는 현재 Q와 ε으로 계산
+    mc = OffPolicyMonteCarlo(env=gridworld, epsilon=0.3, discount=0.95, seed=0)
+    for _ in range(300):
+        batch = []
+        for _ in range(10):
+            transitions = []
+            for state, action, reward in mc.generate_episode():
+                next_state = gridworld._get_next_state(state, action)
+                transitions.append((state, action, reward, next_state, gridworld.is_terminal(next_state)))
+            batch.append(transitions)
+        mc.learn_episodes(batch)
+    mc.improve_policy()
+    print("\n[learn_episodes - batch 10 x 300]")
+    print(f"  V{gridworld.start_state} = {mc.get_value_function().get_value(gridworld.start_state):.4f}")
+
+    try:
+        mc.train_offline(None)
+    except ValueError as error:
+        print(f"  train_offline → ValueError: {error}")
+
+
 if __name__ == "__main__":
     main()
     test_larger_grid()
     test_every_visit_mc()
+    test_step_budget()
+    test_off_policy_mc()
@@ -0,0 +1,71 @@
+import time
+from envs import GridWorld
+from agents import MultiGoalValueIteration, TabularValueFunction, ValueIteration, RandomStream
+
+
+def make_gridworld(goal_config):
+    """목표 설정 하나에 대한 GridWorld (셀 리스트 또는 {cell: reward})"""
+    goals = {"goal_rewards": goal_config} if isinstance(goal_config, dict) else {"goal_states": goal_config}
+    return GridWorld(
+        width=15,
+        height=15,
+        obstacles=[(5, col) for col in range(0, 11)] + [(10, col) for col in range(4, 15)],
+        hazards=[(2, 7), (12, 2)],
+        step_cost=0.01,
+        discount=0.95,
+        start_state=(14, 0),
+        **goals
+    )
+
+
+def main():
+    print("=" * 50)
+    print("Multi-goal batched Value Iteration 테스트 (15x15)")
+    print("=" * 50)
+
+    # 목표만 다르고 맵(장애물, 위험 셀, step cost)은 같음 - gridworld의 goal_states는 사용하지 않음
+    gridworld = make_gridworld([(0, 14)])
+
+    # 배송 목적지마다 하나의 목표 설정
+    rng = RandomStream(0)
+    cells = [state for state in gridworld.get_states() if state not in gridworld.hazards]
+    goal_configs = [[rng.choice(cells)] for _ in range(50)]
+    goal_configs[0] = {(0, 14): 1.0, (14, 14): 2.0}  # 가중치가 다른 여러 목표
+
+    print("\n[Grid World 설정]")
+    print(f"크기: {gridworld.width} x {gridworld.height}, 상태 수: {len(gridworld.get_states())}")
+    print(f"목표 설정 수 K: {len(goal_configs)}")
+
+    # Batched: K개 설정을 한 번에
+    start = time.perf_counter()
+    mgvi = MultiGoalValueIteration(gridworld, goal_configs)
+    sweeps = mgvi.value_iteration(max_iterations=1000, theta=1e-6)
+    batched_time = time.perf_counter() - start
+    print(f"\n[Batched] {batched_time:.2f}s, sweep 수: {sweeps}")
+
+    # 비교: 설정마다 ValueIteration을 따로 실행
+    start = time.perf_counter()
+    max_error = 0.0
+    for k, config in enumerate(goal_configs):
+        env = make_gridworld(config)
+        values = TabularValueFunction()
+        ValueIteration(env, values).value_iteration(max_iterations=1000, theta=1e-6)
+        batched_values = mgvi.get_value_function(k)
+        max_error = max(max_error, max(
+            abs(values.get_value(state) - batched_values.get_value(state)) for state in env.get_states()
+        ))
+    separate_time = time.perf_counter() - start
+    print(f"[ValueIteration x {len(goal_configs)}] {separate_time:.2f}s")
+    print(f"속도 향상: {separate_time / batched_time:.1f}배, 최대 오차: {max_error:.6f}")
+
+    value_matrix = mgvi.value_matrix()
+    print(f"\n가치 행렬 크기: ({len(value_matrix)}, {len(value_matrix[0])})")
+
+    policies = mgvi.extract_policies()
+    for k in (0, 1):
+        print(f"\n[목표 설정 {k}: {goal_configs[k]}]")
+        make_gridworld(goal_configs[k]).print_policy(policies[k])
+
+
+if __name__ == "__main__":
+    main()
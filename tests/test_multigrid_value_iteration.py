@@ -0,0 +1,55 @@
+from envs import GridWorld
+from agents import TabularValueFunction, ValueIteration, MultigridValueIteration
+
+
+def main():
+    print("=" * 50)
+    print("Multigrid Value Iteration 테스트 (30x30)")
+    print("=" * 50)
+
+    # 30x30 Grid World - 통로가 엇갈린 가로 벽들
+    obstacles = []
+    for row in (6, 12, 18, 24):
+        gap = 2 if row % 12 == 0 else 27
+        obstacles += [(row, col) for col in range(30) if col not in (gap, gap + 1)]
+
+    gridworld = GridWorld(
+        width=30,
+        height=30,
+        goal_states=[(0, 29)],
+        obstacles=obstacles,
+        discount=0.95,
+        start_state=(29, 0)
+    )
+
+    print("\n[Grid World 설정]")
+    print(f"크기: {gridworld.width} x {gridworld.height}")
+    print(f"목표 상태: {gridworld.goal_states}")
+    print(f"장애물 수: {len(gridworld.obstacles)}")
+
+    # 기존 Value Iteration
+    values = TabularValueFunction(default_value=0.0)
+    vi = ValueIteration(gridworld, values)
+    iterations = vi.value_iteration(max_iterations=1000, theta=0.0001)
+    print(f"\n[Value Iteration] 수렴까지 반복 횟수: {iterations}")
+
+    # Multigrid Value Iteration
+    multigrid_values = TabularValueFunction(default_value=0.0)
+    mg = MultigridValueIteration(gridworld, multigrid_values, block_size=2, min_states=64)
+    iterations = mg.value_iteration(max_iterations=1000, theta=0.0001)
+    print(f"[Multigrid] 가장 fine한 레벨의 반복 횟수: {iterations}")
+    for num_states, sweeps in mg.level_sweeps:
+        print(f"  상태 수 {num_states:5d}: {sweeps} sweeps")
+
+    max_error = max(
+        abs(values.get_value(state) - multigrid_values.get_value(state))
+        for state in gridworld.get_states()
+    )
+    print(f"[Value Iteration 대비 최대 오차] {max_error:.6f}")
+
+    policy = mg.extract_policy()
+    gridworld.print_policy(policy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import time
+from envs import GridWorld
+from agents import SolutionCache
+
+
+def make_gridworld(goal, obstacles, discount=0.95):
+    return GridWorld(
+        width=10,
+        height=10,
+        goal_states=[goal],
+        obstacles=obstacles,
+        discount=discount,
+        start_state=(9, 0)
+    )
+
+
+def main():
+    print("=" * 50)
+    print("Solution Cache 테스트 (10x10)")
+    print("=" * 50)
+
+    obstacles = [(2, 1), (2, 2), (2, 3), (4, 3), (4, 4), (4, 5), (6, 5), (6, 6), (6, 7), (8, 7), (8, 8)]
+    # 서비스가 반복해서 푸는 몇 개의 맵
+    maps = [make_gridworld(goal, obstacles) for goal in [(0, 9), (0, 0), (5, 9), (9, 9)]]
+    requests = [maps[i % len(maps)] for i in range(40)]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for solver in SolutionCache.SOLVERS:
+            print(f"\n[{solver}] 요청 {len(requests)}개 (맵 {len(maps)}종류)")
+            cache = SolutionCache(cache_dir=cache_dir)
+
+            start = time.perf_counter()
+            for env in requests:
+                cache.solve(env, solver=solver, theta=1e-6)
+            elapsed = time.perf_counter() - start
+            print(f"  캐시 사용: {elapsed:.3f}s (hit {cache.num_hits}, miss {cache.num_misses})")
+
+            # 새 프로세스를 흉내낸 빈 메모리 캐시 - 디스크에서 불러옴
+            reloaded = SolutionCache(cache_dir=cache_dir)
+            start = time.perf_counter()
+            for env in requests:
+                values, policy = reloaded.solve(env, solver=solver, theta=1e-6)
+            elapsed = time.perf_counter() - start
+            print(f"  재시작 후: {elapsed:.3f}s (disk hit {reloaded.num_disk_hits}, miss {reloaded.num_misses})")
+
+            # 캐시 없이 매번 풀이
+            uncached = SolutionCache(max_entries=0)
+            start = time.perf_counter()
+            for env in requests[:len(maps)]:
+                uncached.solve(env, solver=solver, theta=1e-6)
+            elapsed = (time.perf_counter() - start) * len(requests) / len(maps)
+            print(f"  캐시 없음 (추정): {elapsed:.3f}s")
+
+            env = requests[-1]
+            print(f"  V{env.start_state} = {values.get_value(env.start_state):.4f}")
+
+        print(f"\n디스크 캐시 파일 수: {len(os.listdir(cache_dir))}")
+
+    print("\n[캐시 키]")
+    cache = SolutionCache(max_entries=2)
+    shuffled = make_gridworld((0, 9), list(reversed(obstacles)))
+    print(f"  장애물 순서만 다른 맵: 같은 키 = {cache.cache_key(maps[0]) == cache.cache_key(shuffled)}")
+    other_discount = make_gridworld((0, 9), obstacles, discount=0.9)
+    print(f"  할인율이 다른 맵: 같은 키 = {cache.cache_key(maps[0]) == cache.cache_key(other_discount)}")
+    print(f"  theta가 다른 풀이: 같은 키 = {cache.cache_key(maps[0]) == cache.cache_key(maps[0], theta=1e-6)}")
+
+    print("\n[LRU (max_entries=2)]")
+    for env in maps[:3]:
+        cache.solve(env)
+    print(f"  저장된 풀이 수: {len(cache)}, 제거된 풀이 수: {cache.num_evictions}")
+
+    # 반환된 결과를 수정해도 캐시는 그대로
+    values, policy = cache.solve(maps[2])
+    values.update(maps[2].start_state, -100.0)
+    values, policy = cache.solve(maps[2])
+    print(f"  반환값 수정 후 다시 조회: V{maps[2].start_state} = {values.get_value(maps[2].start_state):.4f}")
+
+    print("\n[캐시된 정책]")
+    maps[2].print_policy(policy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import sys
+from envs import GridWorld
+from agents import (
+    TabularValueFunction, SparseValueFunction, IntKeyValueFunction, ValueIteration
+)
+
+
+def main():
+    print("=" * 50)
+    print("Sparse Value Function 테스트")
+    print("=" * 50)
+
+    # 큰 맵에서 방문하지 않은 상태를 읽기만 하는 경우
+    states = [(row, col) for row in range(300) for col in range(300)]
+    for value_function in [TabularValueFunction(), SparseValueFunction()]:
+        value_function.update((0, 0), 1.0)
+        total = sum(value_function.get_value(state) for state in states)
+        print(f"\n{type(value_function).__name__}: {len(states)}개 상태 읽기 후 "
+              f"저장된 항목 수 = {len(value_function.value_table)}, 합 = {total}")
+
+    print("\n[LRU 크기 제한 (max_size=1000)]")
+    value_function = SparseValueFunction(max_size=1000)
+    for i, state in enumerate(states[:5000]):
+        value_function.update(state, float(i + 1))
+        # 첫 상태를 계속 읽어 LRU에서 살아남게 함
+        value_function.get_value(states[0])
+    print(f"  저장된 항목 수: {len(value_function)}, 제거(evict) 횟수: {value_function.num_evictions}")
+    print(f"  V{states[0]} = {value_function.get_value(states[0])} (자주 읽어서 유지)")
+    print(f"  V{states[1]} = {value_function.get_value(states[1])} (제거되어 기본값)")
+    print(f"  V{states[4999]} = {value_function.get_value(states[4999])} (최근 상태)")
+
+
+def test_int_keys():
+    print("\n" + "=" * 50)
+    print("정수 키 open addressing 테이블 (상태 인덱스)")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=30,
+        height=30,
+        goal_states=[(0, 29)],
+        obstacles=[(row, 15) for row in range(5, 25)],
+        discount=0.95,
+        start_state=(29, 0)
+    )
+    values = TabularValueFunction()
+    ValueIteration(gridworld, values).value_iteration(max_iterations=1000, theta=1e-6)
+
+    model = gridworld.compile()
+    int_values = IntKeyValueFunction()
+    dict_values = {}
+    for s, state in enumerate(model.states):
+        int_values.update(s, values.get_value(state))
+        dict_values[s] = values.get_value(state)
+
+    same = all(int_values.get_value(s) == values.get_value(state) for s, state in enumerate(model.states))
+    int_bytes = int_values.keys.itemsize * len(int_values.keys) + int_values.values.itemsize * len(int_values.values)
+    dict_bytes = sys.getsizeof(dict_values) + sum(sys.getsizeof(v) for v in dict_values.values())
+    print(f"\n상태 수: {len(int_values)}, 슬롯 수: {len(int_values.keys)}")
+    print(f"TabularValueFunction과 같은 값: {same}")
+    print(f"없는 키 읽기: {int_values.get_value(10 ** 9)}, 읽은 후 상태 수: {len(int_values)}")
+    print(f"메모리: IntKeyValueFunction {int_bytes} bytes, dict {dict_bytes} bytes")
+
+
+if __name__ == "__main__":
+    main()
+    test_int_keys()
@@ -0,0 +1,97 @@
+import time
+from collections import Counter
+from envs import GridWorld
+from agents import TabularStochasticPolicy, TabularValueFunction, ValueIteration
+
+
+def main():
+    print("=" * 50)
+    print("Tabular Stochastic Policy 테스트 (alias method)")
+    print("=" * 50)
+
+    policy = TabularStochasticPolicy(seed=0)
+    state = (0, 0)
+    actions = ["up", "down", "left", "right"]
+    policy.set_probabilities(state, actions, [0.1, 0.2, 0.3, 0.4])
+
+    num_samples = 100000
+    start = time.perf_counter()
+    counts = Counter(policy.sample_actions([state] * num_samples))
+    elapsed = time.perf_counter() - start
+
+    print(f"\n[{num_samples}번 batch 샘플링: {elapsed * 1000:.1f} ms]")
+    for action in actions:
+        print(f"  {action:5s}: π = {policy.get_probability(state, action):.2f}, "
+              f"빈도 = {counts[action] / num_samples:.3f}")
+
+    print("\n[ε-soft 정책 (ε=0.2, greedy=right)]")
+    policy.set_epsilon_soft(state, actions, "right", 0.2)
+    print(f"  π = {policy.get_probabilities([state] * 4, actions)}")
+    counts = Counter(policy.select_action(state, actions) for _ in range(10000))
+    print(f"  10000번 select_action: {dict(counts)}")
+
+
+def test_gradient_bandit():
+    print("\n" + "=" * 50)
+    print("update로 gradient bandit 학습 (1-상태, 4-액션)")
+    print("=" * 50)
+
+    policy = TabularStochasticPolicy(learning_rate=0.1, seed=0)
+    state = "bandit"
+    actions = ["a", "b", "c", "d"]
+    mean_rewards = {"a": 0.2, "b": 0.5, "c": 1.0, "d": 0.0}
+    policy.set_probabilities(state, actions, [1.0] * 4)
+
+    for step in range(1, 2001):
+        # 8개씩 batch로 샘플링하고 업데이트
+        sampled = policy.sample_actions([state] * 8)
+        noise = policy.rng.uniforms(8)
+        rewards = [mean_rewards[action] + (u - 0.5) for action, u in zip(sampled, noise)]
+        policy.update([state] * 8, sampled, rewards)
+
+        if step in (1, 100, 500, 2000):
+            probabilities = ", ".join(
+                f"{action}={policy.get_probability(state, action):.3f}" for action in actions
+            )
+            print(f"  step {step:4d}: {probabilities}")
+
+
+def test_softmax_gridworld():
+    print("\n" + "=" * 50)
+    print("Q 기반 softmax 정책으로 GridWorld 에피소드 실행")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=6,
+        height=6,
+        goal_states=[(0, 5)],
+        obstacles=[(1, 1), (2, 2), (3, 3)],
+        discount=0.9,
+        start_state=(5, 0)
+    )
+    values = TabularValueFunction()
+    ValueIteration(gridworld, values).value_iteration(theta=1e-6)
+
+    for temperature in [1.0, 0.1, 0.01]:
+        policy = TabularStochasticPolicy(seed=0)
+        for state in gridworld.get_states():
+            actions = gridworld.get_actions(state)
+            if actions:
+                scores = [values.get_q_value(gridworld, state, action) for action in actions]
+                policy.set_softmax(state, actions, scores, temperature)
+
+        lengths = []
+        for _ in range(200):
+            state = gridworld.reset()
+            for steps in range(1, 1001):
+                state, reward, done = gridworld.step(policy.select_action(state))
+                if done:
+                    break
+            lengths.append(steps)
+        print(f"  τ = {temperature}: 평균 에피소드 길이 {sum(lengths) / len(lengths):.1f} (최단 10)")
+
+
+if __name__ == "__main__":
+    main()
+    test_gradient_bandit()
+    test_softmax_gridworld()
@@ -1,3 +1,6 @@
+import copy
+import pickle
+import time
 from envs import GridWorld
 from agents import TD0
 
@@ -245,9 +248,98 @@ def compare_convergence_speed():
     gridworld.print_policy(policy)
 
 
+def test_seed_reproducibility():
+    print("\n" + "=" * 50)
+    print("Seed 재현성 테스트 (에이전트별 난수 스트림)")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=6,
+        height=6,
+        goal_states=[(0, 5)],
+        obstacles=[(1, 1), (2, 2), (3, 3)],
+        discount=0.9,
+        start_state=(5, 0)
+    )
+
+    values = []
+    for seed in [7, 7, 8]:
+        td0 = TD0(env=gridworld, alpha=0.1, epsilon=0.3, gamma=0.9, seed=seed)
+        td0.train(num_episodes=200, verbose=False)
+        value = td0.get_value_function().get_value(gridworld.start_state)
+        values.append(value)
+        print(f"seed={seed}: V{gridworld.start_state} = {value:.6f}")
+
+    print(f"\n같은 seed → 같은 결과: {values[0] == values[1]}")
+    print(f"다른 seed → 다른 결과: {values[0] != values[2]}")
+
+    # 학습 중인 에이전트를 복사(체크포인트)하면 복사본도 같은 난수열로 학습을 이어감
+    td0 = TD0(env=gridworld, alpha=0.1, epsilon=0.3, gamma=0.9, seed=7)
+    td0.train(num_episodes=100, verbose=False)
+    checkpoint = copy.deepcopy(td0)
+    restored_rng = pickle.loads(pickle.dumps(td0.rng))
+    same_stream = restored_rng.uniforms(5000) == copy.deepcopy(td0.rng).uniforms(5000)
+    td0.train(num_episodes=100, verbose=False)
+    checkpoint.train(num_episodes=100, verbose=False)
+    same_values = (td0.get_value_function().get_value(gridworld.start_state)
+                   == checkpoint.get_value_function().get_value(gridworld.start_state))
+    print(f"deepcopy한 에이전트 → 같은 결과: {same_values}, pickle한 난수 스트림 → 같은 난수열: {same_stream}")
+
+
+def test_compiled_fast_path():
+    print("\n" + "=" * 50)
+    print("컴파일된 모델 fast path (run_compiled_episodes) vs 기존 경로")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=10,
+        height=10,
+        goal_states=[(0, 9)],
+        obstacles=[
+            (2, 1), (2, 2), (2, 3),
+            (4, 3), (4, 4), (4, 5),
+            (6, 5), (6, 6), (6, 7),
+            (8, 7), (8, 8),
+        ],
+        hazards={(5, 5): -1.0},
+        step_cost=0.01,
+        discount=0.95,
+        start_state=(9, 0)
+    )
+
+    results = {}
+    for compiled in [False, True]:
+        td0 = TD0(env=gridworld, alpha=0.1, epsilon=0.1, gamma=0.95, seed=3)
+        start = time.perf_counter()
+        policy, episode_rewards = td0.train(num_episodes=3000, verbose=False, compiled=compiled)
+        elapsed = time.perf_counter() - start
+        total_steps = td0.step_budget.stats()["total_steps"]
+        name = "compiled" if compiled else "기존 경로"
+        print(f"[{name}] {elapsed:.3f}s, {total_steps} 스텝 "
+              f"({total_steps / elapsed:,.0f} 스텝/초, {elapsed / total_steps * 1e6:.2f}µs/스텝)")
+        results[compiled] = (td0, policy, episode_rewards, elapsed)
+
+    reference, fast = results[False], results[True]
+    max_diff = max(
+        abs(reference[0].get_value_function().get_value(state) - fast[0].get_value_function().get_value(state))
+        for state in gridworld.get_states()
+    )
+    same_policy = all(
+        reference[1].select_action(state, gridworld.get_actions(state))
+        == fast[1].select_action(state, gridworld.get_actions(state))
+        for state in gridworld.get_states()
+        if gridworld.get_actions(state)
+    )
+    print(f"\n같은 seed → 가치 함수 최대 차이: {max_diff}")
+    print(f"에피소드 보상 동일: {reference[2] == fast[2]}, 정책 동일: {same_policy}")
+    print(f"속도 향상 (정책 추출 포함): {reference[3] / fast[3]:.1f}x")
+
+
 if __name__ == "__main__":
     main()
     test_different_alpha()
     test_different_epsilon()
     test_small_grid()
     compare_convergence_speed()
+    test_seed_reproducibility()
+    test_compiled_fast_path()
@@ -0,0 +1,97 @@
+from envs import GridWorld, VectorEnv
+from agents import TDControl, QLearning, SARSA, ExpectedSARSA
+
+
+def main():
+    print("=" * 50)
+    print("Q-learning / SARSA / Expected SARSA 테스트 (10x10)")
+    print("=" * 50)
+
+    # 10x10 Grid World - 다이아몬드 패턴
+    gridworld = GridWorld(
+        width=10,
+        height=10,
+        goal_states=[(0, 9)],
+        obstacles=[
+            (5, 5),
+            (4, 4), (4, 6),
+            (3, 5),
+            (6, 4), (6, 6),
+            (7, 5)
+        ],
+        discount=0.95,
+        start_state=(9, 0)
+    )
+
+    print("\n[Grid World 설정]")
+    print(f"크기: {gridworld.width} x {gridworld.height}")
+    print(f"시작 상태: {gridworld.start_state}")
+    print(f"목표 상태: {gridworld.goal_states}")
+    print(f"장애물: {gridworld.obstacles}")
+
+    for agent_class in [QLearning, SARSA, ExpectedSARSA]:
+        print(f"\n[{agent_class.__name__} 학습 - 8개 환경 batch]")
+        agent = agent_class(
+            env=gridworld,
+            alpha=0.2,
+            epsilon=0.1,
+            gamma=0.95,
+            num_envs=8
+        )
+        policy, episode_rewards = agent.train(num_episodes=2000, verbose=False)
+
+        avg_reward = sum(episode_rewards[-100:]) / 100
+        print(f"  평균 보상 (최근 100 에피소드): {avg_reward:.3f}")
+        print(f"  V{gridworld.start_state} = "
+              f"{agent.get_value_function().get_value(gridworld.start_state):.4f}")
+
+        gridworld.print_policy(policy)
+
+
+def test_vector_env():
+    print("\n" + "=" * 50)
+    print("VectorEnv로 직접 batch 실행 (32개 환경)")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=6,
+        height=6,
+        goal_states=[(0, 5)],
+        obstacles=[(1, 1), (2, 2), (3, 3)],
+        discount=0.9,
+        start_state=(5, 0)
+    )
+
+    vector_env = VectorEnv(gridworld, num_envs=32, max_steps=200)
+    agent = QLearning(env=vector_env, alpha=0.5, epsilon=0.1, gamma=0.9)
+
+    # 스텝 단위로 실행
+    completed = agent.run_steps(num_steps=500)
+    print(f"\n500 스텝 x 32 환경 동안 끝난 에피소드 수: {len(completed)}")
+
+    policy = agent.extract_policy()
+    gridworld.print_policy(policy)
+    gridworld.print_values(agent.get_value_function())
+
+
+
+def test_abstract_base():
+    print("\n" + "=" * 50)
+    print("TDControl 직접 생성 테스트")
+    print("=" * 50)
+
+    class MissingTarget(TDControl):
+        pass
+
+    for cls in [TDControl, MissingTarget]:
+        try:
+            cls(GridWorld())
+            print(f"{cls.__name__}: 생성됨 (오류 없음)")
+        except TypeError as error:
+            print(f"{cls.__name__}: TypeError - {error}")
+
+
+if __name__ == "__main__":
+    main()
+    test_vector_env()
+    test_abstract_base()
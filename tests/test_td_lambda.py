@@ -227,8 +227,60 @@ def test_different_alpha():
         print(f"  평균 보상 (최근 100 에피소드): {avg_reward:.3f}")
 
 
+def test_trace_types():
+    """
+    Trace 종류 비교 (replacing / accumulating / dutch / true online)
+    """
+    print("\n" + "=" * 50)
+    print("Trace 종류 비교 (10x10)")
+    print("=" * 50)
+
+    # 10x10 Grid World - 다이아몬드 패턴
+    gridworld = GridWorld(
+        width=10,
+        height=10,
+        goal_states=[(0, 9)],
+        obstacles=[
+            (5, 5),
+            (4, 4), (4, 6),
+            (3, 5),
+            (6, 4), (6, 6),
+            (7, 5)
+        ],
+        discount=0.95,
+        start_state=(9, 0)
+    )
+
+    settings = [
+        ("Replacing traces", dict(trace_type="replacing")),
+        ("Accumulating traces", dict(trace_type="accumulating")),
+        ("Dutch traces", dict(trace_type="dutch")),
+        ("True Online TD(λ)", dict(true_online=True)),
+    ]
+
+    for name, kwargs in settings:
+        print(f"\n[{name} 학습 중...]")
+
+        td = TDLambda(
+            env=gridworld,
+            alpha=0.1,
+            epsilon=0.1,
+            gamma=0.95,
+            lambda_=0.8,
+            **kwargs
+        )
+
+        policy, episode_rewards = td.train(num_episodes=1000, verbose=False)
+
+        avg_reward = sum(episode_rewards[-100:]) / 100
+        print(f"  평균 보상 (최근 100 에피소드): {avg_reward:.3f}")
+        print(f"  V{gridworld.start_state} = "
+              f"{td.get_value_function().get_value(gridworld.start_state):.4f}")
+
+
 if __name__ == "__main__":
     main()
     compare_lambda_values()
     test_td0_vs_mc()
     test_different_alpha()
+    test_trace_types()
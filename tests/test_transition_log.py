@@ -0,0 +1,93 @@
+import os
+import tempfile
+import time
+from envs import GridWorld, TransitionLogWriter, TransitionLog
+from agents import MonteCarlo, TD0, TDLambda, TabularStochasticPolicy, TabularValueFunction, ValueIteration
+
+
+def record_log(gridworld, behavior_policy, path, num_episodes, max_steps=200, chunk_size=1024):
+    """behavior_policy로 에피소드를 실행하며 transition 로그 기록"""
+    with TransitionLogWriter(path, gridworld.get_states(), gridworld.ACTIONS, chunk_size) as writer:
+        for _ in range(num_episodes):
+            state = gridworld.reset()
+            for _ in range(max_steps):
+                actions = gridworld.get_actions(state)
+                if not actions:
+                    break
+                action = behavior_policy.select_action(state, actions)
+                next_state, reward, done = gridworld.step(action)
+                writer.record(state, action, reward, next_state, done)
+                if done:
+                    break
+                state = next_state
+            writer.end_episode()
+        return writer.num_transitions
+
+
+def main():
+    print("=" * 50)
+    print("Transition 로그 기반 Offline 학습 테스트 (10x10)")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=10,
+        height=10,
+        goal_states=[(0, 9)],
+        obstacles=[
+            (2, 1), (2, 2), (2, 3),
+            (4, 3), (4, 4), (4, 5),
+            (6, 5), (6, 6), (6, 7),
+            (8, 7), (8, 8),
+            (3, 8), (5, 2)
+        ],
+        discount=0.95,
+        start_state=(9, 0)
+    )
+
+    values = TabularValueFunction()
+    ValueIteration(gridworld, values).value_iteration(theta=1e-6)
+    print(f"\nV*{gridworld.start_state} = {values.get_value(gridworld.start_state):.4f}")
+
+    # 배포된 정책을 흉내낸 behavior policy: 최적 정책에 ε=0.3 탐색을 섞음
+    behavior_policy = TabularStochasticPolicy(seed=0)
+    optimal_policy = values.extract_policy(gridworld)
+    for state in gridworld.get_states():
+        actions = gridworld.get_actions(state)
+        if actions:
+            behavior_policy.set_epsilon_soft(state, actions, optimal_policy.select_action(state, actions), 0.3)
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        path = os.path.join(log_dir, "transitions.bin")
+
+        start = time.perf_counter()
+        num_transitions = record_log(gridworld, behavior_policy, path, num_episodes=2000)
+        elapsed = time.perf_counter() - start
+
+        log = TransitionLog(path)
+        num_chunks = sum(1 for _ in log.chunks())
+        num_episodes = sum(1 for _ in log.episodes())
+        num_truncated = sum(1 for episode in log.episodes() if not episode[-1][4])
+        print("\n[로그 기록]")
+        print(f"  transition 수: {num_transitions} (len(log) = {len(log)})")
+        print(f"  파일 크기: {os.path.getsize(path)} bytes, chunk 수: {num_chunks}")
+        print(f"  에피소드 수: {num_episodes} (잘린 에피소드 {num_truncated})")
+        print(f"  기록 시간: {elapsed:.2f}s")
+
+        print("\n[Offline 학습 - 환경 step 없이 로그만 사용]")
+        for label, agent, kwargs in [
+            ("TD(0)", TD0(env=gridworld, alpha=0.1, gamma=0.95), {"num_epochs": 3, "batch_size": 256}),
+            ("TD(λ=0.8)", TDLambda(env=gridworld, alpha=0.1, gamma=0.95, lambda_=0.8), {"num_epochs": 3}),
+            ("Monte Carlo", MonteCarlo(env=gridworld, discount=0.95), {"num_epochs": 1}),
+        ]:
+            start = time.perf_counter()
+            policy = agent.train_offline(log, **kwargs)
+            elapsed = time.perf_counter() - start
+            value = agent.get_value_function().get_value(gridworld.start_state)
+            print(f"  {label:<12} {kwargs}: V{gridworld.start_state} = {value:.4f}, 학습 시간: {elapsed:.2f}s")
+
+        print("\n[Monte Carlo offline 학습 정책]")
+        gridworld.print_policy(policy)
+
+
+if __name__ == "__main__":
+    main()
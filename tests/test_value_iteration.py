@@ -1,5 +1,6 @@
-from envs import GridWorld
-from agents import TabularValueFunction, ValueIteration
+import time
+from envs import GridWorld, TabularMDP
+from agents import TabularValueFunction, ValueIteration, MultigridValueIteration
 
 
 def main():
@@ -87,6 +88,182 @@ def test_larger_grid():
     gridworld.print_policy(policy)
 
 
+def test_action_elimination():
+    print("\n" + "=" * 50)
+    print("Action Elimination 테스트 (10x10, 8방향 + 제자리, 셀 비용)")
+    print("=" * 50)
+
+    obstacles = [
+        # 가로 벽
+        (3, 0), (3, 1), (3, 2), (3, 3), (3, 4), (3, 5),
+        # 아래쪽 방을 막는 벽 (방 안의 상태는 목표에 도달할 수 없음)
+        (6, 0), (6, 1), (6, 2), (6, 3), (6, 4), (6, 5), (6, 6), (6, 7), (6, 8), (6, 9)
+    ]
+    # 셀마다 다른 진입 비용 - 목표에 도달할 수 없는 방의 값은 γ의 속도로만 수렴하므로 sweep이 많이 필요한 맵
+    cell_rewards = [[-0.05 * (1 + (row * 7 + col * 3) % 10) for col in range(10)] for row in range(10)]
+
+    # 8방향 이동 + 제자리(no-op) 액션을 가진 Grid World
+    gridworld = GridWorld(
+        width=10,
+        height=10,
+        goal_states=[(0, 9)],
+        obstacles=obstacles,
+        cell_rewards=cell_rewards,
+        discount=0.95,
+        actions=GridWorld.ACTIONS_9
+    )
+
+    print("\n[Grid World 설정]")
+    print(f"크기: {gridworld.width} x {gridworld.height}")
+    print(f"액션: {gridworld.ACTIONS}")
+
+    start = time.perf_counter()
+    plain = ValueIteration(gridworld, TabularValueFunction(default_value=0.0))
+    plain.value_iteration(max_iterations=1000, theta=1e-8)
+    plain_time = time.perf_counter() - start
+
+    values = TabularValueFunction(default_value=0.0)
+    start = time.perf_counter()
+    vi = ValueIteration(gridworld, values, action_elimination=True)
+    iterations = vi.value_iteration(max_iterations=1000, theta=1e-8)
+    elimination_time = time.perf_counter() - start
+
+    print(f"\n[결과]")
+    print(f"수렴까지 반복 횟수: {iterations}")
+    evaluations = vi.sweep_q_evaluations
+    print(f"sweep별 Q(s,a) 계산 횟수 (50 sweep마다): {evaluations[::50]} ... {evaluations[-1]}")
+    print(f"총 Q(s,a) 계산: {sum(evaluations)} (일반 VI {sum(plain.sweep_q_evaluations)}), "
+          f"시간: {elimination_time:.3f}s (일반 VI {plain_time:.3f}s)")
+    max_diff = max(abs(values.get_value(state) - plain.values.get_value(state)) for state in gridworld.get_states())
+    print(f"일반 VI와의 최대 차이: {max_diff:.1e}")
+
+    remaining = sum(len(actions) for actions in vi.action_sets.values())
+    total = sum(len(gridworld.get_actions(state)) for state in gridworld.get_states())
+    print(f"남은 (s,a) 쌍: {remaining} / {total}")
+
+    # 제외되지 않은 액션만으로 정책 추출
+    policy = values.extract_policy(gridworld, vi.action_sets)
+    gridworld.print_policy(policy)
+
+    # 보상이 목표에만 있는 최단 경로 맵: bound 폭이 마지막 sweep까지 넓어 제외가 일어나지 않음
+    shortest_path = GridWorld(
+        width=10,
+        height=10,
+        goal_states=[(0, 9)],
+        obstacles=obstacles,
+        discount=0.95,
+        actions=GridWorld.ACTIONS_9
+    )
+    vi = ValueIteration(shortest_path, TabularValueFunction(default_value=0.0), action_elimination=True)
+    vi.value_iteration(max_iterations=1000, theta=1e-8)
+    print(f"[최단 경로 맵] sweep별 Q(s,a) 계산 횟수: {vi.sweep_q_evaluations} (제외 없음)")
+
+
+def test_reward_map():
+    print("\n" + "=" * 50)
+    print("보상 맵 테스트 (20x20, step cost / 위험 셀 / 가중 목표 / 셀 비용)")
+    print("=" * 50)
+
+    # 가운데 진흙 지대(셀 비용)와 위험 셀 띠, 가까운 작은 목표와 먼 큰 목표
+    cell_rewards = [[0.0] * 20 for _ in range(20)]
+    for row in range(5, 15):
+        for col in range(5, 15):
+            cell_rewards[row][col] = -0.2
+    gridworld = GridWorld(
+        width=20,
+        height=20,
+        goal_rewards={(19, 19): 1.0, (0, 19): 5.0},
+        hazards=[(10, col) for col in range(0, 4)] + [(row, 16) for row in range(0, 12)],
+        obstacles=[(row, 4) for row in range(12, 20)],
+        cell_rewards=cell_rewards,
+        step_cost=0.04,
+        discount=0.98,
+        start_state=(19, 0)
+    )
+
+    print("\n[Grid World 설정]")
+    print(f"목표 보상: {gridworld.goal_rewards}")
+    print(f"위험 셀 수: {len(gridworld.hazards)}, 진흙 셀 수: {len(gridworld.cell_rewards)}, "
+          f"step cost: {gridworld.step_cost}")
+
+    # 컴파일된 배열 모델이 일반 경로(상태마다 get_reward 호출)와 같은지 확인
+    start = time.perf_counter()
+    model = gridworld.compile()
+    compile_time = time.perf_counter() - start
+    start = time.perf_counter()
+    generic_model = TabularMDP.from_mdp(gridworld)
+    generic_time = time.perf_counter() - start
+    same = (
+        list(model.rewards) == list(generic_model.rewards)
+        and list(model.next_states) == list(generic_model.next_states)
+    )
+    print(f"\n[compile] {compile_time * 1000:.1f}ms (일반 경로 {generic_time * 1000:.1f}ms), "
+          f"일반 경로와 동일: {same}")
+
+    # Python 경로 Value Iteration vs 배열 모델 위의 Multigrid Value Iteration
+    values = TabularValueFunction()
+    start = time.perf_counter()
+    ValueIteration(gridworld, values).value_iteration(max_iterations=1000, theta=1e-6)
+    vi_time = time.perf_counter() - start
+
+    multigrid_values = TabularValueFunction()
+    start = time.perf_counter()
+    mg = MultigridValueIteration(gridworld, multigrid_values)
+    mg.value_iteration(max_iterations=1000, theta=1e-6)
+    mg_time = time.perf_counter() - start
+
+    max_error = max(
+        abs(values.get_value(state) - multigrid_values.get_value(state))
+        for state in gridworld.get_states()
+    )
+    print(f"[Value Iteration] {vi_time:.2f}s, V{gridworld.start_state} = "
+          f"{values.get_value(gridworld.start_state):.4f}")
+    print(f"[Multigrid (컴파일 모델)] {mg_time:.2f}s, 최대 오차: {max_error:.6f}")
+
+    gridworld.print_policy(values.extract_policy(gridworld))
+
+
+def test_update_modes():
+    print("\n" + "=" * 50)
+    print("Jacobi / Gauss-Seidel / SOR 비교 (30x30)")
+    print("=" * 50)
+
+    gridworld = GridWorld(
+        width=30,
+        height=30,
+        goal_states=[(29, 29)],
+        obstacles=[(row, 10) for row in range(0, 25)] + [(row, 20) for row in range(5, 30)],
+        hazards=[(15, col) for col in range(12, 18)],
+        step_cost=0.01,
+        discount=0.99,
+        start_state=(0, 0)
+    )
+
+    # 결정적 맵에서는 Gauss-Seidel이 한 sweep에 값을 멀리 전파하므로
+    # over-relaxation(ω > 1)은 진동만 더해 오히려 느려짐 (ω < 2/(1+γ)만 수렴 보장)
+    reference = None
+    for mode, omega in [("jacobi", 1.0), ("gauss_seidel", 1.0), ("sor", 0.8), ("sor", 1.005), ("sor", 1.05)]:
+        values = TabularValueFunction()
+        vi = ValueIteration(gridworld, values, mode=mode, omega=omega)
+        start = time.perf_counter()
+        vi.value_iteration(max_iterations=2000, theta=1e-8)
+        elapsed = time.perf_counter() - start
+        if reference is None:
+            reference = values
+        max_error = max(
+            abs(values.get_value(state) - reference.get_value(state)) for state in gridworld.get_states()
+        )
+        label = mode if mode != "sor" else f"sor (ω={omega})"
+        print(f"[{label:<14}] sweep 수: {len(vi.sweep_q_evaluations):>4}, {elapsed:.2f}s, "
+              f"V{gridworld.start_state} = {values.get_value(gridworld.start_state):.4f}, "
+              f"Jacobi와의 최대 차이: {max_error:.1e}")
+
+    gridworld.print_policy(values.extract_policy(gridworld))
+
+
 if __name__ == "__main__":
     main()
     test_larger_grid()
+    test_action_elimination()
+    test_reward_map()
+    test_update_modes()
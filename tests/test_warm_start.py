@@ -0,0 +1,94 @@
+import time
+from envs import GridWorld
+from agents import (
+    PolicyIteration, TabularPolicy, TabularValueFunction, ValueIteration, anneal_discount,
+)
+
+
+OBSTACLES = [
+    (2, 1), (2, 2), (2, 3),
+    (4, 3), (4, 4), (4, 5),
+    (6, 5), (6, 6), (6, 7),
+    (8, 7), (8, 8),
+    (3, 8), (5, 2)
+]
+
+
+def make_gridworld(obstacles=OBSTACLES, discount=0.95, width=10, goal=(0, 9)):
+    return GridWorld(
+        width=width,
+        height=10,
+        goal_states=[goal],
+        obstacles=obstacles,
+        discount=discount,
+        start_state=(9, 0)
+    )
+
+
+def solve_vi(env, warm_values=None, source_env=None, state_map=None):
+    values = TabularValueFunction()
+    vi = ValueIteration(env, values)
+    vi.warm_start(warm_values, source_env, state_map)
+    vi.value_iteration(max_iterations=1000, theta=1e-6)
+    return values, len(vi.sweep_q_evaluations)
+
+
+def solve_pi(env, warm_values=None, warm_policy=None, source_env=None, state_map=None):
+    pi = PolicyIteration(env, TabularPolicy(default_action="up"))
+    pi.warm_start(warm_values, warm_policy, source_env, state_map)
+    start = time.perf_counter()
+    iterations = pi.policy_iteration(max_iterations=100, theta=1e-6)
+    return pi, iterations, time.perf_counter() - start
+
+
+def main():
+    print("=" * 50)
+    print("Warm Start 테스트 (10x10)")
+    print("=" * 50)
+
+    gridworld = make_gridworld()
+    values, sweeps = solve_vi(gridworld)
+    pi, _, _ = solve_pi(gridworld)
+
+    print("\n[장애물 하나를 없앤 맵]")
+    edited = make_gridworld(obstacles=OBSTACLES[:-1])
+    cold_values, cold_sweeps = solve_vi(edited)
+    warm_values, warm_sweeps = solve_vi(edited, values, gridworld)
+    print(f"  ValueIteration sweep 수: 처음부터 {cold_sweeps}, warm start {warm_sweeps}")
+    error = max(abs(cold_values.get_value(s) - warm_values.get_value(s)) for s in edited.get_states())
+    print(f"  두 풀이의 최대 차이: {error:.2e}")
+    _, cold_iterations, cold_time = solve_pi(edited)
+    _, warm_iterations, warm_time = solve_pi(edited, pi.values, pi.policy, gridworld)
+    print(f"  PolicyIteration 반복 수: 처음부터 {cold_iterations} ({cold_time:.2f}s), "
+          f"warm start {warm_iterations} ({warm_time:.2f}s)")
+
+    print("\n[왼쪽에 열 하나를 추가한 맵 - 상태 remapping]")
+    shifted = make_gridworld(obstacles=[(row, col + 1) for row, col in OBSTACLES], width=11, goal=(0, 10))
+
+    def state_map(state):
+        return (state[0], state[1] - 1)
+
+    _, cold_sweeps = solve_vi(shifted)
+    _, warm_sweeps = solve_vi(shifted, values, gridworld, state_map)
+    print(f"  ValueIteration sweep 수: 처음부터 {cold_sweeps}, warm start {warm_sweeps}")
+    _, cold_iterations, cold_time = solve_pi(shifted)
+    _, warm_iterations, warm_time = solve_pi(shifted, pi.values, pi.policy, gridworld, state_map)
+    print(f"  PolicyIteration 반복 수: 처음부터 {cold_iterations} ({cold_time:.2f}s), "
+          f"warm start {warm_iterations} ({warm_time:.2f}s)")
+
+    print("\n[Discount annealing (γ=0.99)]")
+    target = make_gridworld(discount=0.99)
+    for solver in ("value_iteration", "policy_iteration"):
+        for discounts in ([0.99], [0.9, 0.99], [0.8, 0.9, 0.95, 0.99]):
+            start = time.perf_counter()
+            values, policy, stage_iterations = anneal_discount(target, discounts, solver=solver, theta=1e-6)
+            elapsed = time.perf_counter() - start
+            print(f"  {solver:<16} {str(discounts):<24} 단계별 반복 {stage_iterations}, "
+                  f"{elapsed:.2f}s, V{target.start_state} = {values.get_value(target.start_state):.4f}")
+
+    print("\n[Annealing으로 구한 정책]")
+    target.print_policy(policy)
+
+
+if __name__ == "__main__":
+    main()